@@ -0,0 +1,17 @@
+"""
+Optional numba JIT for the numeric kernels.
+
+Without numba, njit hands the decorated functions back unchanged, so every kernel runs as plain
+Python/NumPy with the same results.
+"""
+
+try:
+	from numba import njit
+except ImportError:  # numba is optional
+	def njit(*args, **kwargs):
+		"""Stand-in for numba.njit, used bare or with a signature and options"""
+		if len(args) == 1 and callable(args[0]) and not kwargs:
+			return args[0]
+		def decorator(func):
+			return func
+		return decorator
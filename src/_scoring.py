@@ -0,0 +1,28 @@
+"""
+Numeric kernels for partial-packing candidate scoring.
+
+numba is optional: without it the kernels run as plain NumPy.
+"""
+
+import numpy as np
+
+from ._jit import njit
+
+
+# Utilization bonus by tenth: +20% from 60%, +30% from 70%, +50% from 80% utilization
+UTIL_MULT = np.array((1.0,) * 6 + (1.2, 1.3) + (1.5,) * 3, dtype=np.float64)
+
+
+@njit(cache=True)
+def score_candidates(utilization: np.ndarray, item_ratio: np.ndarray, price: np.ndarray) -> np.ndarray:
+	"""Score partial-packing candidates: heavily favors utilization (85%) + item count (15%)"""
+	scores = (utilization * 0.85) + (item_ratio * 0.15)
+	
+	# Strong bonus for high utilization
+	tiers = np.minimum((utilization * 10).astype(np.int64), 10)
+	scores = scores * UTIL_MULT[tiers]
+	
+	# Penalty for expensive containers unless utilization is very high
+	scores = scores * np.where((price > 50) & (utilization < 0.75), 0.8, 1.0)
+	
+	return scores
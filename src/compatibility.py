@@ -5,6 +5,7 @@ This module defines rules for which products can/cannot be packed together
 based on safety, regulatory, and quality considerations.
 """
 
+import sys
 from typing import List, Set, Dict, Tuple
 from .models import Product
 from enum import Enum
@@ -24,6 +25,12 @@ class ProductCategory(Enum):
     GENERAL = "general"
 
 
+# Interned category strings, resolved once so report/grouping code avoids Enum.value lookups
+CATEGORY_VALUES: Dict[ProductCategory, str] = {
+    category: sys.intern(category.value) for category in ProductCategory
+}
+
+
 class CompatibilityChecker:
     """Check product compatibility for safe packing"""
     
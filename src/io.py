@@ -1,11 +1,17 @@
+import codecs
+import csv
 import pandas as pd
 from pathlib import Path
-from typing import List
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from .models import Product, Container, Order, OrderItem
 
 
-def load_products_csv(path: str) -> List[Product]:
+def products_frame(path: str) -> pd.DataFrame:
+	"""
+	Products CSV as one row per product with the Product field columns, in mm and g.
+	load_products_csv builds its Products from this; checks that only need the columns can use
+	it directly
+	"""
 	p = Path(path)
 	if not p.exists():
 		raise FileNotFoundError(f"Products CSV not found: {path}")
@@ -22,43 +28,54 @@ def load_products_csv(path: str) -> List[Product]:
 			return df[col_mm].astype(float), "mm"
 		else:
 			return pd.Series([float('nan')]*len(df)), None
-	# Unit converters
-	to_mm = lambda x: float(x) * 10.0
-	to_g = lambda x: float(x) * 1000.0
 	w_raw, w_unit = pick("width_cm", "width_mm")
 	l_raw, l_unit = pick("length_cm", "length_mm")
 	h_raw, h_unit = pick("height_cm", "height_mm")
 	wg_raw, wg_unit = pick("weight_kg", "weight_g")
-	width_mm  = w_raw.map(lambda v: to_mm(v) if w_unit == "cm" else float(v))
-	length_mm = l_raw.map(lambda v: to_mm(v) if l_unit == "cm" else float(v))
-	height_mm = h_raw.map(lambda v: to_mm(v) if h_unit == "cm" else float(v))
-	weight_g  = wg_raw.map(lambda v: to_g(v) if wg_unit == "kg" else float(v))
-	fragile = (df["fragile"].astype(bool) if "fragile" in df.columns else pd.Series([False]*len(df)))
-	# Support both packaging_type and package_type column names
-	packaging_type = (df["packaging_type"] if "packaging_type" in df.columns 
-	                 else df["package_type"] if "package_type" in df.columns 
-	                 else pd.Series([None]*len(df)))
-	# Support both hazmat_class and hazard_class column names
-	hazmat = (df["hazmat_class"] if "hazmat_class" in df.columns 
-	         else df["hazard_class"] if "hazard_class" in df.columns 
-	         else pd.Series([None]*len(df)))
-	skus = (df["sku"].astype(str) if "sku" in df.columns else pd.Series([f"SKU-{i+1:06d}" for i in range(len(df))]))
-	products: List[Product] = []
-	for i in range(len(df)):
-		products.append(Product(
-			sku=str(skus.iloc[i]),
-			width_mm=float(width_mm.iloc[i]),
-			length_mm=float(length_mm.iloc[i]),
-			height_mm=float(height_mm.iloc[i]),
-			weight_g=float(weight_g.iloc[i]),
-			fragile=bool(fragile.iloc[i]),
-			packaging_type=None if packaging_type is None else packaging_type.iloc[i],
-			hazmat_class=None if hazmat is None else hazmat.iloc[i],
-		))
-	return products
+	# Unit conversions, applied to whole columns
+	return pd.DataFrame({
+		"sku": (df["sku"].astype(str) if "sku" in df.columns else pd.Series([f"SKU-{i+1:06d}" for i in range(len(df))])),
+		"width_mm": w_raw * 10.0 if w_unit == "cm" else w_raw,
+		"length_mm": l_raw * 10.0 if l_unit == "cm" else l_raw,
+		"height_mm": h_raw * 10.0 if h_unit == "cm" else h_raw,
+		"weight_g": wg_raw * 1000.0 if wg_unit == "kg" else wg_raw,
+		"fragile": (df["fragile"].astype(bool) if "fragile" in df.columns else pd.Series([False]*len(df))),
+		# Support both packaging_type and package_type column names
+		"packaging_type": (df["packaging_type"] if "packaging_type" in df.columns
+		                   else df["package_type"] if "package_type" in df.columns
+		                   else pd.Series([None]*len(df), dtype=object)),
+		# Support both hazmat_class and hazard_class column names
+		"hazmat_class": (df["hazmat_class"] if "hazmat_class" in df.columns
+		                 else df["hazard_class"] if "hazard_class" in df.columns
+		                 else pd.Series([None]*len(df), dtype=object)),
+	})
 
 
-def load_containers_csv(path: str) -> List[Container]:
+def load_products_csv(path: str) -> List[Product]:
+	df = products_frame(path)
+	return [
+		Product(
+			sku=str(sku),
+			width_mm=float(w),
+			length_mm=float(l),
+			height_mm=float(h),
+			weight_g=float(wg),
+			fragile=bool(fragile),
+			packaging_type=packaging_type,
+			hazmat_class=hazmat_class,
+		)
+		for sku, w, l, h, wg, fragile, packaging_type, hazmat_class in zip(
+			df["sku"].tolist(), df["width_mm"].tolist(), df["length_mm"].tolist(), df["height_mm"].tolist(),
+			df["weight_g"].tolist(), df["fragile"].tolist(), df["packaging_type"].tolist(), df["hazmat_class"].tolist())
+	]
+
+
+def containers_frame(path: str) -> pd.DataFrame:
+	"""
+	Containers CSV as one row per usable container with the Container field columns, in mm and g.
+	Rows without a positive width and length are skipped, and rows without a height become 1mm
+	"envelope" packaging. load_containers_csv builds its Containers from this
+	"""
 	p = Path(path)
 	if not p.exists():
 		raise FileNotFoundError(f"Container CSV not found: {path}")
@@ -70,77 +87,85 @@ def load_containers_csv(path: str) -> List[Container]:
 			return df[col_mm].astype(float), "mm"
 		else:
 			return pd.Series([float('nan')]*len(df)), None
-	to_mm = lambda x: float(x) * 10.0
-	to_g = lambda x: float(x) * 1000.0
 	w_raw, w_unit = pick("width_cm", "inner_w_mm")
 	l_raw, l_unit = pick("length_cm", "inner_l_mm")
 	h_raw, h_unit = pick("height_cm", "inner_h_mm")
-	w_mm = w_raw.map(lambda v: to_mm(v) if w_unit == "cm" else float(v))
-	l_mm = l_raw.map(lambda v: to_mm(v) if l_unit == "cm" else float(v))
-	h_mm = h_raw.map(lambda v: to_mm(v) if h_unit == "cm" else float(v))
+	w_mm = (w_raw * 10.0 if w_unit == "cm" else w_raw).fillna(0.0)
+	l_mm = (l_raw * 10.0 if l_unit == "cm" else l_raw).fillna(0.0)
+	h_mm = (h_raw * 10.0 if h_unit == "cm" else h_raw).fillna(0.0)
 	tare_g = (df["tare_weight_g"].astype(float) if "tare_weight_g" in df.columns else pd.Series([0.0]*len(df)))
 	if "max_weight_kg" in df.columns:
-		max_g = df["max_weight_kg"].astype(float).map(to_g)
+		max_g = df["max_weight_kg"].astype(float) * 1000.0
 	elif "max_weight_g" in df.columns:
 		max_g = df["max_weight_g"].astype(float)
 	else:
 		max_g = pd.Series([float('nan')]*len(df))
 	# Fallback for missing max weight: 10kg conservative default
 	max_g = max_g.fillna(10000.0)
-	material = (df["box_type"].astype(str) if "box_type" in df.columns else (df["material"].astype(str) if "material" in df.columns else pd.Series([None]*len(df))))
-	price = (df["price"].astype(float) if "price" in df.columns else pd.Series([None]*len(df)))
+	material = (df["box_type"].astype(str) if "box_type" in df.columns else (df["material"].astype(str) if "material" in df.columns else pd.Series([None]*len(df), dtype=object)))
+	price = (df["price"].astype(float) if "price" in df.columns else pd.Series([float('nan')]*len(df)))
 	stock = (df["Stok"].fillna(1).astype(int) if "Stok" in df.columns else (df["stock"].fillna(1).astype(int) if "stock" in df.columns else pd.Series([1]*len(df))))
 	box_id = (df["boxes_id"].astype(str) if "boxes_id" in df.columns else (df["box_id"].astype(str) if "box_id" in df.columns else pd.Series([f"BOX-{i+1:06d}" for i in range(len(df))])))
-	box_name = (df["box_name"].astype(str) if "box_name" in df.columns else pd.Series([None]*len(df)))
-	shipping_company = (df["shipping_company"].astype(str) if "shipping_company" in df.columns else pd.Series([None]*len(df)))
-	items: List[Container] = []
-	boxes_count = 0
-	envelopes_count = 0
-	
-	for i in range(len(df)):
-		# Get dimensions
-		w_val = float(w_mm.iloc[i]) if not pd.isna(w_mm.iloc[i]) else 0
-		l_val = float(l_mm.iloc[i]) if not pd.isna(l_mm.iloc[i]) else 0
-		h_val = float(h_mm.iloc[i]) if not pd.isna(h_mm.iloc[i]) else 0
-		
-		# Skip containers with invalid width or length
-		if w_val <= 0 or l_val <= 0:
-			print(f"Skipping container {box_id.iloc[i]} with invalid width/length: {w_val}x{l_val}mm")
-			continue
-		
-		# Determine container type based on height
-		if h_val > 0:
-			# 3D Box - has valid height
-			container_type = "box"
-			boxes_count += 1
-		else:
-			# 2D Packaging - envelope, bag, protective material (no height or height=0)
-			container_type = "envelope"
-			h_val = 1.0  # Set minimal height for 2D packaging (1mm thickness)
-			envelopes_count += 1
-		
-		# Create more meaningful container ID
-		name = str(box_name.iloc[i]) if not pd.isna(box_name.iloc[i]) else f"Container-{box_id.iloc[i]}"
-		company = str(shipping_company.iloc[i]) if not pd.isna(shipping_company.iloc[i]) else ""
-		meaningful_id = f"{company}-{name}" if company else name
-		
-		items.append(Container(
-			box_id=meaningful_id,
-			inner_w_mm=w_val,
-			inner_l_mm=l_val,
-			inner_h_mm=h_val,
-			tare_weight_g=float(tare_g.iloc[i]) if not pd.isna(tare_g.iloc[i]) else 0.0,
-			max_weight_g=float(max_g.iloc[i]) if not pd.isna(max_g.iloc[i]) else 10000.0,
-			material=None if material is None else (None if pd.isna(material.iloc[i]) else str(material.iloc[i])),
-			price_try=None if price is None else (None if pd.isna(price.iloc[i]) else float(price.iloc[i])),
-			stock=int(stock.iloc[i]) if not pd.isna(stock.iloc[i]) else 1,
-			box_name=None if pd.isna(box_name.iloc[i]) else str(box_name.iloc[i]),
-			shipping_company=None if pd.isna(shipping_company.iloc[i]) else str(shipping_company.iloc[i]),
-			container_type=container_type,
-		))
+	box_name = (df["box_name"].astype(str) if "box_name" in df.columns else pd.Series([None]*len(df), dtype=object))
+	shipping_company = (df["shipping_company"].astype(str) if "shipping_company" in df.columns else pd.Series([None]*len(df), dtype=object))
+	
+	# Skip containers with invalid width or length
+	valid = (w_mm > 0) & (l_mm > 0)
+	for i in (~valid).to_numpy().nonzero()[0]:
+		w_val = float(w_raw.iloc[i]) * (10.0 if w_unit == "cm" else 1.0) if not pd.isna(w_raw.iloc[i]) else 0
+		l_val = float(l_raw.iloc[i]) * (10.0 if l_unit == "cm" else 1.0) if not pd.isna(l_raw.iloc[i]) else 0
+		print(f"Skipping container {box_id.iloc[i]} with invalid width/length: {w_val}x{l_val}mm")
+	
+	# 3D boxes have a valid height; 2D packaging (envelopes, bags, protective material) gets a
+	# minimal 1mm thickness
+	is_box = h_mm > 0
+	
+	# Create more meaningful container IDs
+	name = box_name.where(box_name.notna(), "Container-" + box_id)
+	meaningful_id = name.where(shipping_company.isna(), shipping_company.astype(object) + "-" + name)
 	
-	print(f"Loaded {len(items)} containers: {boxes_count} 3D boxes, {envelopes_count} 2D packaging materials")
-	return items
+	out = pd.DataFrame({
+		"box_id": meaningful_id,
+		"inner_w_mm": w_mm,
+		"inner_l_mm": l_mm,
+		"inner_h_mm": h_mm.where(is_box, 1.0),
+		"tare_weight_g": tare_g.fillna(0.0),
+		"max_weight_g": max_g,
+		"material": material.where(material.notna(), None),
+		"price_try": price,
+		"stock": stock,
+		"box_name": box_name.where(box_name.notna(), None),
+		"shipping_company": shipping_company.where(shipping_company.notna(), None),
+		"container_type": is_box.map({True: "box", False: "envelope"}),
+	})[valid]
+	
+	boxes_count = int((out["container_type"] == "box").sum())
+	print(f"Loaded {len(out)} containers: {boxes_count} 3D boxes, {len(out) - boxes_count} 2D packaging materials")
+	return out
+
+
+def load_containers_csv(path: str) -> List[Container]:
+	df = containers_frame(path)
+	return [
+		Container(
+			box_id=box_id,
+			inner_w_mm=float(w),
+			inner_l_mm=float(l),
+			inner_h_mm=float(h),
+			tare_weight_g=float(tare),
+			max_weight_g=float(max_g),
+			material=None if material is None else str(material),
+			price_try=None if pd.isna(price) else float(price),
+			stock=int(stock),
+			box_name=None if box_name is None else str(box_name),
+			shipping_company=None if company is None else str(company),
+			container_type=container_type,
+		)
+		for box_id, w, l, h, tare, max_g, material, price, stock, box_name, company, container_type in zip(
+			df["box_id"].tolist(), df["inner_w_mm"].tolist(), df["inner_l_mm"].tolist(), df["inner_h_mm"].tolist(),
+			df["tare_weight_g"].tolist(), df["max_weight_g"].tolist(), df["material"].tolist(), df["price_try"].tolist(),
+			df["stock"].tolist(), df["box_name"].tolist(), df["shipping_company"].tolist(), df["container_type"].tolist())
+	]
 
 
 def load_orders_csv(orders_path: str, order_items_path: str) -> List[Order]:
@@ -159,7 +184,10 @@ def load_orders_csv(orders_path: str, order_items_path: str) -> List[Order]:
 	
 	orders: List[Order] = []
 	
-	for _, order_row in orders_df.iterrows():
+	# Order dates are parsed as one column rather than with a strptime per row
+	order_dates = list(pd.to_datetime(orders_df['order_date'].astype(str), format='%Y-%m-%d %H:%M:%S').dt.to_pydatetime())
+	
+	for order_date, (_, order_row) in zip(order_dates, orders_df.iterrows()):
 		order_id = str(order_row['order_id'])
 		
 		# Get items for this order
@@ -174,9 +202,6 @@ def load_orders_csv(orders_path: str, order_items_path: str) -> List[Order]:
 				total_price_try=float(item_row['total_price_try']) if pd.notna(item_row['total_price_try']) else None
 			))
 		
-		# Parse order date
-		order_date = datetime.strptime(str(order_row['order_date']), '%Y-%m-%d %H:%M:%S')
-		
 		order = Order(
 			order_id=order_id,
 			customer_name=str(order_row['customer_name']),
@@ -196,12 +221,8 @@ def load_orders_csv(orders_path: str, order_items_path: str) -> List[Order]:
 	return orders
 
 
-def save_order_to_csv(order: Order, orders_path: str, order_items_path: str):
-	"""Save a single order to CSV files"""
-	orders_p = Path(orders_path)
-	items_p = Path(order_items_path)
-	
-	# Prepare order data
+def _order_rows(order: Order) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+	"""The orders.csv row and order_items.csv rows of an order, keyed by column"""
 	order_data = {
 		'order_id': order.order_id,
 		'customer_name': order.customer_name,
@@ -215,7 +236,6 @@ def save_order_to_csv(order: Order, orders_path: str, order_items_path: str):
 		'notes': order.notes
 	}
 	
-	# Prepare items data
 	items_data = []
 	for item in order.items:
 		items_data.append({
@@ -225,6 +245,15 @@ def save_order_to_csv(order: Order, orders_path: str, order_items_path: str):
 			'unit_price_try': item.unit_price_try,
 			'total_price_try': item.total_price_try
 		})
+	return order_data, items_data
+
+
+def save_order_to_csv(order: Order, orders_path: str, order_items_path: str):
+	"""Save a single order to CSV files"""
+	orders_p = Path(orders_path)
+	items_p = Path(order_items_path)
+	
+	order_data, items_data = _order_rows(order)
 	
 	# Load existing data or create new
 	if orders_p.exists():
@@ -251,3 +280,84 @@ def save_order_to_csv(order: Order, orders_path: str, order_items_path: str):
 	# Save to CSV
 	orders_df.to_csv(orders_p, index=False)
 	items_df.to_csv(items_p, index=False)
+
+
+def _csv_header(path: Path) -> Optional[List[str]]:
+	"""Column names of a CSV file, None if it is missing or empty"""
+	if not path.exists() or path.stat().st_size == 0:
+		return None
+	with path.open(newline='', encoding='utf-8-sig') as f:
+		return next(csv.reader(f), None)
+
+
+def _append_csv_rows(path: Path, header: Optional[List[str]], fields: List[str], rows: List[Dict[str, Any]]):
+	"""Append rows to a CSV file, writing the header first if the file has none"""
+	# Rows must start on a new line even if the last one was written without a line end
+	missing_newline = False
+	if header is not None:
+		with path.open('rb') as f:
+			f.seek(-1, 2)
+			missing_newline = f.read(1) != b'\n'
+	with path.open('a', newline='', encoding='utf-8') as f:
+		if header is None:
+			f.write(','.join(fields) + '\n')
+		elif missing_newline:
+			f.write('\n')
+		csv.DictWriter(f, fieldnames=fields, lineterminator='\n').writerows(rows)
+
+
+def append_order_to_csv(order: Order, orders_path: str, order_items_path: str):
+	"""
+	Add a new order to the CSV files by appending its rows, without reading the stored orders.
+	Files whose columns differ from the ones written here get the full save_order_to_csv instead.
+	"""
+	orders_p = Path(orders_path)
+	items_p = Path(order_items_path)
+	
+	order_data, items_data = _order_rows(order)
+	order_fields = list(order_data)
+	item_fields = ['order_id', 'sku', 'quantity', 'unit_price_try', 'total_price_try']
+	
+	orders_header = _csv_header(orders_p)
+	items_header = _csv_header(items_p)
+	if orders_header not in (None, order_fields) or items_header not in (None, item_fields):
+		save_order_to_csv(order, orders_path, order_items_path)
+		return
+	
+	_append_csv_rows(orders_p, orders_header, order_fields, [order_data])
+	_append_csv_rows(items_p, items_header, item_fields, items_data)
+
+
+def _drop_order_rows(path: Path, order_id: str) -> bool:
+	"""Rewrite a CSV without the rows of an order, other rows as stored; False if there were none"""
+	# Read like _csv_header; a byte-order mark the file starts with is written back with it
+	with path.open('rb') as f:
+		encoding = 'utf-8-sig' if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 'utf-8'
+	with path.open(newline='', encoding=encoding) as f:
+		rows = list(csv.reader(f))
+	if not rows:
+		return False
+	id_col = rows[0].index('order_id')
+	kept = [rows[0]] + [row for row in rows[1:] if len(row) <= id_col or row[id_col] != order_id]
+	if len(kept) == len(rows):
+		return False
+	with path.open('w', newline='', encoding=encoding) as f:
+		csv.writer(f, lineterminator='\n').writerows(kept)
+	return True
+
+
+def delete_order_from_csv(order_id: str, orders_path: str, order_items_path: str) -> bool:
+	"""Remove an order and its items from the CSV files; False if the order is not stored"""
+	orders_p = Path(orders_path)
+	items_p = Path(order_items_path)
+	
+	if not orders_p.exists():
+		raise FileNotFoundError(f"Orders CSV not found: {orders_path}")
+	
+	# Rows are filtered as text; nothing is parsed into frames or Order objects, and the kept
+	# rows are written back unchanged
+	if not _drop_order_rows(orders_p, order_id):
+		return False
+	if items_p.exists():
+		_drop_order_rows(items_p, order_id)
+	return True
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, List
 from datetime import datetime
 
@@ -30,6 +30,11 @@ class Container:
 	box_name: Optional[str] = None
 	shipping_company: Optional[str] = None
 	container_type: str = "box"  # "box" for 3D containers, "envelope" for 2D packaging
+	price_try_safe: float = field(init=False, repr=False)  # price_try with None mapped to 0.0
+
+	def __post_init__(self):
+		"""Precompute the None-safe price used by the packing heuristics"""
+		self.price_try_safe = self.price_try or 0.0
 
 	@property
 	def is_3d_box(self) -> bool:
@@ -1,5 +1,10 @@
+import logging
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from .models import Product, Container, PlacementItem, PackedContainer
+from ._jit import njit
+
+logger = logging.getLogger(__name__)
 
 
 def orientations(w: float, l: float, h: float):
@@ -17,6 +22,23 @@ def orientations(w: float, l: float, h: float):
 		yield ow, ol, oh, rot
 
 
+@njit("float64(float64[:, :])", cache=True)
+def _sizes_volume(sizes: np.ndarray) -> float:
+	"""Sum of the row products of an (n, 3) size array, in one pass without temporaries"""
+	total = 0.0
+	for i in range(sizes.shape[0]):
+		total += sizes[i, 0] * sizes[i, 1] * sizes[i, 2]
+	return total
+
+
+def placements_volume(placements: List[PlacementItem]) -> float:
+	"""Total placed volume in mm³; vectorized once there are enough placements to pay for the array."""
+	if len(placements) < 8:
+		return sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in placements)
+	sizes = np.array([p.size_mm for p in placements], dtype=np.float64)
+	return float(_sizes_volume(sizes))
+
+
 def enhanced_item_sorting(products: List[Product]) -> List[Product]:
 	"""🚀 PHASE 1: Multi-criteria sorting for optimal packing efficiency."""
 	
@@ -72,6 +94,11 @@ def pack(products: List[Product], container: Container) -> Optional[PackedContai
 			placements=[],
 		)
 	
+	# Every item must be placed, so a group whose volume exceeds the container can never fit
+	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
+	if sum(p.width_mm * p.length_mm * p.height_mm for p in products) > container_volume:
+		return None
+	
 	placements: List[PlacementItem] = []
 	
 	# 🚀 PHASE 2: Use advanced 3D space analysis for optimal packing
@@ -928,7 +955,7 @@ def pack_multi_container(products: List[Product], containers: List[Container]) -
 	# Sort containers by cost per volume (best value first)
 	def cost_per_volume(container):
 		volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm / 1000.0  # cm³
-		price = container.price_try or 0
+		price = container.price_try_safe
 		return price / volume if volume > 0 else float('inf')
 	
 	sorted_containers = sorted(containers, key=cost_per_volume)
@@ -939,19 +966,19 @@ def pack_multi_container(products: List[Product], containers: List[Container]) -
 	# Strategy 1: Greedy - Fill each container to maximum capacity
 	greedy_result = pack_greedy_max_utilization(products, sorted_containers)
 	if greedy_result:
-		total_cost = sum(container.price_try or 0 for container, _ in greedy_result)
+		total_cost = sum(container.price_try_safe for container, _ in greedy_result)
 		strategies.append(("greedy", greedy_result, total_cost))
 	
 	# Strategy 2: Largest containers first (current approach but improved)
 	large_first_result = pack_largest_first_optimized(products, containers)
 	if large_first_result:
-		total_cost = sum(container.price_try or 0 for container, _ in large_first_result)
+		total_cost = sum(container.price_try_safe for container, _ in large_first_result)
 		strategies.append(("large_first", large_first_result, total_cost))
 	
 	# Strategy 3: Best fit - try to minimize wasted space
 	best_fit_result = pack_best_fit(products, sorted_containers)
 	if best_fit_result:
-		total_cost = sum(container.price_try or 0 for container, _ in best_fit_result)
+		total_cost = sum(container.price_try_safe for container, _ in best_fit_result)
 		strategies.append(("best_fit", best_fit_result, total_cost))
 	
 	if not strategies:
@@ -1033,7 +1060,7 @@ def enhanced_volume_density_sorting(products: List[Product]) -> List[Product]:
 def calculate_volume_density_score(container: Container, result: PackedContainer, products: List[Product]) -> float:
 	"""🚀 ENHANCED: Calculate volume-density efficiency score for greedy packing."""
 	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-	used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+	used_volume = placements_volume(result.placements)
 	
 	# Volume utilization (primary factor)
 	volume_utilization = used_volume / container_volume if container_volume > 0 else 0
@@ -1046,7 +1073,7 @@ def calculate_volume_density_score(container: Container, result: PackedContainer
 	item_count_factor = len(result.placements) / len(products) if products else 0
 	
 	# Cost efficiency factor
-	container_cost = container.price_try or 0
+	container_cost = container.price_try_safe
 	cost_efficiency = used_volume / max(container_cost, 1)
 	
 	# Combined score: prioritize volume utilization and density efficiency
@@ -1107,12 +1134,20 @@ def pack_best_fit(products: List[Product], containers: List[Container]) -> Optio
 	remaining_products = products.copy()
 	packed_containers = []
 	
+	# Container capacities are fixed, so compute them once for the residual check
+	container_volumes = [c.inner_w_mm * c.inner_l_mm * c.inner_h_mm for c in containers]
+	
 	while remaining_products:
 		best_pack = None
 		best_container = None
 		best_fit_score = float('-inf')
+		remaining_volume = sum(p.width_mm * p.length_mm * p.height_mm for p in remaining_products)
 		
-		for container in containers:
+		for container, container_volume in zip(containers, container_volumes):
+			# pack() places every item or none, so a negative residual capacity can never fit
+			if container_volume < remaining_volume:
+				continue
+			
 			result = pack(remaining_products, container)
 			if result and len(result.placements) > 0:
 				# 🚀 ENHANCED: Calculate comprehensive fit score instead of just waste ratio
@@ -1138,7 +1173,7 @@ def pack_best_fit(products: List[Product], containers: List[Container]) -> Optio
 def calculate_enhanced_best_fit_score(container: Container, result: PackedContainer, products: List[Product]) -> float:
 	"""🚀 ENHANCED: Calculate comprehensive best-fit score with shape compatibility."""
 	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-	used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+	used_volume = placements_volume(result.placements)
 	
 	# 1. Volume efficiency (minimize waste)
 	volume_utilization = used_volume / container_volume if container_volume > 0 else 0
@@ -1238,7 +1273,7 @@ def calculate_packing_density_score(result: PackedContainer, products: List[Prod
 	bbox_volume = (max_x - min_x) * (max_y - min_y) * (max_z - min_z)
 	
 	# Actual packed volume
-	packed_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+	packed_volume = placements_volume(result.placements)
 	
 	# Density ratio (higher = more compact packing)
 	density = packed_volume / bbox_volume if bbox_volume > 0 else 0
@@ -1494,13 +1529,13 @@ def calculate_genetic_fitness(solution: List[Tuple[Container, PackedContainer]],
 		return 0.0
 	
 	# Calculate multiple fitness factors
-	total_cost = sum(container.price_try or 0 for container, _ in solution)
+	total_cost = sum(container.price_try_safe for container, _ in solution)
 	total_containers = len(solution)
 	total_items_packed = sum(len(result.placements) for _, result in solution)
 	
 	# Volume utilization
 	total_volume_used = sum(
-		sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+		placements_volume(result.placements)
 		for _, result in solution
 	)
 	
@@ -1642,7 +1677,7 @@ def calculate_utilization_score(solution: List[Tuple[Container, PackedContainer]
 	total_utilization = 0.0
 	for container, result in solution:
 		container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-		used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+		used_volume = placements_volume(result.placements)
 		utilization = used_volume / container_volume if container_volume > 0 else 0
 		total_utilization += utilization
 	
@@ -1654,7 +1689,7 @@ def calculate_cost_efficiency_score(solution: List[Tuple[Container, PackedContai
 	if not solution:
 		return 0.0
 	
-	total_cost = sum(container.price_try or 0 for container, _ in solution)
+	total_cost = sum(container.price_try_safe for container, _ in solution)
 	total_items = sum(len(result.placements) for _, result in solution)
 	
 	return total_items / max(total_cost, 1) if total_cost > 0 else 0.0
@@ -1751,7 +1786,7 @@ def intelligent_single_container_selection(products: List[Product], containers:
 	for container in containers:
 		# Calculate container characteristics
 		container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-		container_price = container.price_try or 0
+		container_price = container.price_try_safe
 		
 		# Skip containers that are obviously too small
 		if container_volume < total_volume * 0.8:  # Need at least 80% volume match
@@ -1788,10 +1823,10 @@ def calculate_container_intelligence_score(container: Container, result: PackedC
 										total_weight: float, item_count: int) -> float:
 	"""🚀 PHASE 3: Calculate intelligent container selection score."""
 	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-	container_price = container.price_try or 0
+	container_price = container.price_try_safe
 	
 	# 1. Volume utilization (most important factor)
-	used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+	used_volume = placements_volume(result.placements)
 	volume_utilization = used_volume / container_volume if container_volume > 0 else 0
 	
 	# 2. Item packing efficiency (how many items fit)
@@ -1843,7 +1878,7 @@ def intelligent_multi_container_packing(products: List[Product], containers: Lis
 	container_scores = []
 	for container in containers:
 		container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-		container_price = container.price_try or 0
+		container_price = container.price_try_safe
 		
 		# Pre-score containers based on characteristics
 		base_score = calculate_container_base_score(container, products)
@@ -1863,19 +1898,23 @@ def intelligent_multi_container_packing(products: List[Product], containers: Lis
 	
 	best_solution = None
 	best_score = float('-inf')
+	failed_strategies = []
 	
 	for strategy_name, strategy_func in strategies:
 		try:
 			solution = strategy_func(products, sorted_containers)
-			if solution:
-				# Calculate solution score
-				solution_score = calculate_solution_score(solution, products)
-				if solution_score > best_score:
-					best_score = solution_score
-					best_solution = solution
 		except Exception as e:
-			print(f"⚠️ Strategy {strategy_name} failed: {e}")
+			failed_strategies.append(f"{strategy_name} ({e})")
 			continue
+		if solution:
+			# Calculate solution score
+			solution_score = calculate_solution_score(solution, products)
+			if solution_score > best_score:
+				best_score = solution_score
+				best_solution = solution
+	
+	if failed_strategies:
+		logger.warning("⚠️ Intelligent strategies failed: %s", ", ".join(failed_strategies))
 	
 	return best_solution
 
@@ -1883,7 +1922,7 @@ def intelligent_multi_container_packing(products: List[Product], containers: Lis
 def calculate_container_base_score(container: Container, products: List[Product]) -> float:
 	"""🚀 PHASE 3: Calculate base score for container without packing."""
 	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-	container_price = container.price_try or 0
+	container_price = container.price_try_safe
 	
 	total_volume = sum(p.width_mm * p.length_mm * p.height_mm for p in products)
 	
@@ -1906,12 +1945,29 @@ def calculate_container_base_score(container: Container, products: List[Product]
 	return base_score
 
 
+def build_sku_index(products: List[Product]) -> Dict[str, List[int]]:
+	"""Map each SKU to its indices in the original product list."""
+	sku_indices: Dict[str, List[int]] = {}
+	for idx, product in enumerate(products):
+		sku_indices.setdefault(product.sku, []).append(idx)
+	return sku_indices
+
+
+def mark_packed(remaining_mask: np.ndarray, sku_indices: Dict[str, List[int]], placements: List[PlacementItem]) -> None:
+	"""Clear the remaining-mask entries for every SKU that was placed."""
+	for sku in {p.sku for p in placements}:
+		remaining_mask[sku_indices[sku]] = False
+
+
 def intelligent_greedy_packing(products: List[Product], containers: List[Container]) -> Optional[List[Tuple[Container, PackedContainer]]]:
 	"""🚀 PHASE 3: Intelligent greedy packing with smart container selection."""
-	remaining_products = products.copy()
+	remaining_mask = np.ones(len(products), dtype=bool)
+	sku_indices = build_sku_index(products)
 	packed_containers = []
 	
-	while remaining_products:
+	while remaining_mask.any():
+		remaining_products = [products[i] for i in np.flatnonzero(remaining_mask)]
+		
 		best_pack = None
 		best_container = None
 		best_intelligence_score = float('-inf')
@@ -1938,18 +1994,20 @@ def intelligent_greedy_packing(products: List[Product], containers: List[Contain
 		packed_containers.append((best_container, best_pack))
 		
 		# Remove packed items
-		packed_skus = [p.sku for p in best_pack.placements]
-		remaining_products = [p for p in remaining_products if p.sku not in packed_skus]
+		mark_packed(remaining_mask, sku_indices, best_pack.placements)
 	
 	return packed_containers
 
 
 def intelligent_best_fit_packing(products: List[Product], containers: List[Container]) -> Optional[List[Tuple[Container, PackedContainer]]]:
 	"""🚀 PHASE 3: Intelligent best-fit packing with volume optimization."""
-	remaining_products = products.copy()
+	remaining_mask = np.ones(len(products), dtype=bool)
+	sku_indices = build_sku_index(products)
 	packed_containers = []
 	
-	while remaining_products:
+	while remaining_mask.any():
+		remaining_products = [products[i] for i in np.flatnonzero(remaining_mask)]
+		
 		best_pack = None
 		best_container = None
 		best_waste_ratio = float('inf')
@@ -1959,7 +2017,7 @@ def intelligent_best_fit_packing(products: List[Product], containers: List[Conta
 			result = pack(remaining_products, container)
 			if result and len(result.placements) > 0:
 				# Calculate waste ratio
-				used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+				used_volume = placements_volume(result.placements)
 				container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
 				waste_ratio = (container_volume - used_volume) / container_volume if container_volume > 0 else 1
 				utilization = used_volume / container_volume if container_volume > 0 else 0
@@ -1977,18 +2035,23 @@ def intelligent_best_fit_packing(products: List[Product], containers: List[Conta
 		packed_containers.append((best_container, best_pack))
 		
 		# Remove packed items
-		packed_skus = [p.sku for p in best_pack.placements]
-		remaining_products = [p for p in remaining_products if p.sku not in packed_skus]
+		mark_packed(remaining_mask, sku_indices, best_pack.placements)
 	
 	return packed_containers
 
 
 def intelligent_hybrid_packing(products: List[Product], containers: List[Container]) -> Optional[List[Tuple[Container, PackedContainer]]]:
 	"""🚀 PHASE 3: Hybrid packing strategy combining multiple approaches."""
-	remaining_products = products.copy()
+	if not products or not containers:
+		return None
+	
+	remaining_mask = np.ones(len(products), dtype=bool)
+	sku_indices = build_sku_index(products)
 	packed_containers = []
 	
-	while remaining_products:
+	while remaining_mask.any():
+		remaining_products = [products[i] for i in np.flatnonzero(remaining_mask)]
+		
 		# Try different strategies and pick the best one for current items
 		strategies = [
 			("greedy", intelligent_greedy_single_pack),
@@ -2001,18 +2064,15 @@ def intelligent_hybrid_packing(products: List[Product], containers: List[Contain
 		best_score = float('-inf')
 		
 		for strategy_name, strategy_func in strategies:
-			try:
-				pack_result = strategy_func(remaining_products, containers)
-				if pack_result:
-					container, result = pack_result
-					# Calculate hybrid score
-					score = calculate_hybrid_packing_score(container, result, remaining_products)
-					if score > best_score:
-						best_score = score
-						best_container = container
-						best_pack = result
-			except Exception as e:
-				continue
+			pack_result = strategy_func(remaining_products, containers)
+			if pack_result:
+				container, result = pack_result
+				# Calculate hybrid score
+				score = calculate_hybrid_packing_score(container, result, remaining_products)
+				if score > best_score:
+					best_score = score
+					best_container = container
+					best_pack = result
 		
 		if not best_pack:
 			return None
@@ -2020,18 +2080,20 @@ def intelligent_hybrid_packing(products: List[Product], containers: List[Contain
 		packed_containers.append((best_container, best_pack))
 		
 		# Remove packed items
-		packed_skus = [p.sku for p in best_pack.placements]
-		remaining_products = [p for p in remaining_products if p.sku not in packed_skus]
+		mark_packed(remaining_mask, sku_indices, best_pack.placements)
 	
 	return packed_containers
 
 
 def intelligent_volume_optimized_packing(products: List[Product], containers: List[Container]) -> Optional[List[Tuple[Container, PackedContainer]]]:
 	"""🚀 PHASE 3: Volume-optimized packing for maximum space utilization."""
-	remaining_products = products.copy()
+	remaining_mask = np.ones(len(products), dtype=bool)
+	sku_indices = build_sku_index(products)
 	packed_containers = []
 	
-	while remaining_products:
+	while remaining_mask.any():
+		remaining_products = [products[i] for i in np.flatnonzero(remaining_mask)]
+		
 		best_pack = None
 		best_container = None
 		best_volume_score = float('-inf')
@@ -2040,7 +2102,7 @@ def intelligent_volume_optimized_packing(products: List[Product], containers: Li
 			result = pack(remaining_products, container)
 			if result and len(result.placements) > 0:
 				# Calculate volume optimization score
-				used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+				used_volume = placements_volume(result.placements)
 				container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
 				
 				volume_utilization = used_volume / container_volume if container_volume > 0 else 0
@@ -2061,8 +2123,7 @@ def intelligent_volume_optimized_packing(products: List[Product], containers: Li
 		packed_containers.append((best_container, best_pack))
 		
 		# Remove packed items
-		packed_skus = [p.sku for p in best_pack.placements]
-		remaining_products = [p for p in remaining_products if p.sku not in packed_skus]
+		mark_packed(remaining_mask, sku_indices, best_pack.placements)
 	
 	return packed_containers
 
@@ -2092,7 +2153,7 @@ def intelligent_best_fit_single_pack(products: List[Product], containers: List[C
 	for container in containers:
 		result = pack(products, container)
 		if result:
-			used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+			used_volume = placements_volume(result.placements)
 			container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
 			waste = (container_volume - used_volume) / container_volume if container_volume > 0 else 1
 			
@@ -2113,7 +2174,7 @@ def intelligent_volume_optimized_single_pack(products: List[Product], containers
 	for container in containers:
 		result = pack(products, container)
 		if result:
-			used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+			used_volume = placements_volume(result.placements)
 			container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
 			volume_utilization = used_volume / container_volume if container_volume > 0 else 0
 			
@@ -2130,7 +2191,7 @@ def intelligent_volume_optimized_single_pack(products: List[Product], containers
 def calculate_hybrid_packing_score(container: Container, result: PackedContainer, products: List[Product]) -> float:
 	"""🚀 PHASE 3: Calculate hybrid packing score."""
 	container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm
-	used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+	used_volume = placements_volume(result.placements)
 	
 	volume_utilization = used_volume / container_volume if container_volume > 0 else 0
 	item_efficiency = len(result.placements) / len(products) if products else 0
@@ -2150,11 +2211,11 @@ def calculate_solution_score(solution: List[Tuple[Container, PackedContainer]],
 	if not solution:
 		return 0.0
 	
-	total_cost = sum(container.price_try or 0 for container, _ in solution)
+	total_cost = sum(container.price_try_safe for container, _ in solution)
 	total_containers = len(solution)
 	total_items_packed = sum(len(result.placements) for _, result in solution)
 	total_volume_used = sum(
-		sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+		placements_volume(result.placements)
 		for _, result in solution
 	)
 	
@@ -2197,7 +2258,7 @@ def optimized_utilization_packing(products: List[Product], containers: List[Cont
 				result = pack(products, container)
 				if result and len(result.placements) == len(products):
 					# Calculate utilization score
-					used_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements)
+					used_volume = placements_volume(result.placements)
 					utilization = used_volume / container_volume
 					
 					# Size appropriateness bonus
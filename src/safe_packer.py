@@ -5,7 +5,12 @@ This module wraps the core packing algorithms with product compatibility rules
 to ensure hazardous materials, liquids, electronics, etc. are never packed together.
 """
 
-from typing import List, Optional, Tuple, Dict
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Optional, Set, Tuple, Dict
+import numpy as np
 from .models import Product, Container, PackedContainer
 from .packer import (
     pack, 
@@ -14,21 +19,24 @@ from .packer import (
     pack_best_fit,
     pack_largest_first_optimized
 )
-from .compatibility import CompatibilityChecker
+from .compatibility import CATEGORY_VALUES, CompatibilityChecker
+from ._jit import njit
 
+logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
 class SafePackingResult:
     """Result of safe packing operation with compatibility info"""
-    def __init__(
-        self, 
-        packed_containers: List[Tuple[Container, PackedContainer]],
-        compatibility_groups: List[List[Product]],
-        warnings: List[str] = None
-    ):
-        self.packed_containers = packed_containers
-        self.compatibility_groups = compatibility_groups
-        self.warnings = warnings or []
-        self.success = len(packed_containers) > 0
+    packed_containers: List[Tuple[Container, PackedContainer]]
+    compatibility_groups: List[List[Product]]
+    warnings: List[str] = field(default_factory=list)
+    # Category values per packed container, aligned with packed_containers
+    container_categories: List[Set[str]] = field(default_factory=list)
+    success: bool = field(init=False, default=False)
+    
+    def __post_init__(self):
+        self.success = len(self.packed_containers) > 0
     
     def to_dict(self) -> Dict:
         """Convert result to dictionary for API response"""
@@ -41,6 +49,50 @@ class SafePackingResult:
         }
 
 
+def _to_arrays(products: List[Product]) -> Dict[str, np.ndarray]:
+    """Materialize per-product width, length and height (mm) as NumPy arrays"""
+    n = len(products)
+    return {
+        "w": np.fromiter((p.width_mm for p in products), dtype=np.float64, count=n),
+        "l": np.fromiter((p.length_mm for p in products), dtype=np.float64, count=n),
+        "h": np.fromiter((p.height_mm for p in products), dtype=np.float64, count=n),
+    }
+
+
+@njit(cache=True)
+def _container_fit_kernel(item_dims: np.ndarray, bin_dims: np.ndarray, total_volume: float) -> np.ndarray:
+    """
+    Flag the containers that could possibly hold a whole group
+    
+    item_dims and bin_dims are (n, 3) arrays with each row sorted ascending.
+    A container is rejected when its volume is below the group's total volume
+    or some item fits in none of its orientations; pack() places every item
+    or returns None, so it can never succeed for a rejected container.
+    """
+    fits = np.ones(bin_dims.shape[0], dtype=np.bool_)
+    for j in range(bin_dims.shape[0]):
+        bw = bin_dims[j, 0]
+        bl = bin_dims[j, 1]
+        bh = bin_dims[j, 2]
+        if bw * bl * bh * (1.0 + 1e-9) < total_volume:
+            fits[j] = False
+            continue
+        for i in range(item_dims.shape[0]):
+            if item_dims[i, 0] > bw or item_dims[i, 1] > bl or item_dims[i, 2] > bh:
+                fits[j] = False
+                break
+    return fits
+
+
+def _category_lookup(product_lookup: Dict[str, Product]) -> Callable[[str], str]:
+    """Build a memoized SKU -> primary category value classifier"""
+    @lru_cache(maxsize=None)
+    def category_of(sku: str) -> str:
+        return CATEGORY_VALUES[CompatibilityChecker.get_product_category(product_lookup[sku])]
+    
+    return category_of
+
+
 def pack_with_compatibility_constraints(
     products: List[Product],
     containers: List[Container],
@@ -65,108 +117,161 @@ def pack_with_compatibility_constraints(
     if not products or not containers:
         return None
     
-    print(f"\n{'='*60}")
-    print(f"🔒 SAFE PACKING WITH COMPATIBILITY CONSTRAINTS")
-    print(f"{'='*60}")
-    print(f"Total products: {len(products)}")
-    print(f"Available containers: {len(containers)}")
+    logger.info(
+        "🔒 Safe packing with compatibility constraints: %d products, %d containers",
+        len(products), len(containers)
+    )
+    
+    product_lookup = {p.sku: p for p in products}
+    category_of = _category_lookup(product_lookup)
+    
+    # Item volumes per SKU, used to feed groups to the strategies largest-first
+    arrays = _to_arrays(products)
+    volumes = arrays["w"] * arrays["l"] * arrays["h"]
+    volume_by_sku = dict(zip((p.sku for p in products), volumes.tolist()))
+    
+    # Cheapest-first order for single-container attempts, shared by all groups
+    price_sorted_containers = sorted(containers, key=lambda c: c.price_try_safe)
+    
+    # Sorted inner dimensions per container for the fit kernel
+    bin_dims = np.sort(np.array(
+        [(c.inner_w_mm, c.inner_l_mm, c.inner_h_mm) for c in containers], dtype=np.float64
+    ).reshape(-1, 3), axis=1)
+    
+    # Early reject: an item that fits no container in any orientation can never be packed
+    item_dims = np.sort(np.column_stack((arrays["w"], arrays["l"], arrays["h"])), axis=1)
+    placeable = (item_dims[:, None, :] <= bin_dims[None, :, :]).all(axis=2).any(axis=1)
+    if not placeable.all():
+        logger.warning(
+            "❌ %d product(s) fit no available container, skipping packing",
+            int(np.count_nonzero(~placeable))
+        )
+        return None
     
     # Step 1: Group products by compatibility
-    print(f"\n📊 Step 1: Analyzing product compatibility...")
+    logger.debug("📊 Step 1: Analyzing product compatibility...")
     compatibility_groups = CompatibilityChecker.group_compatible_products(products)
     
-    print(f"✅ Created {len(compatibility_groups)} compatible group(s):")
-    for i, group in enumerate(compatibility_groups, 1):
-        categories = set()
-        for product in group:
-            cat = CompatibilityChecker.get_product_category(product)
-            categories.add(cat.value)
-        print(f"   Group {i}: {len(group)} items - Categories: {', '.join(categories)}")
-        
-        # Show any hazmat items
-        hazmat_items = [p for p in group if p.hazmat_class]
-        if hazmat_items:
-            print(f"            ⚠️  Hazmat: {len(hazmat_items)} items")
-        
-        fragile_items = [p for p in group if p.fragile]
-        if fragile_items:
-            print(f"            🔹 Fragile: {len(fragile_items)} items")
+    # A single mutually-compatible group cannot violate constraints by construction,
+    # so the group bookkeeping and the final validation pass are skipped for it.
+    single_group = len(compatibility_groups) == 1
+    
+    # Remember which group each SKU landed in so validation can skip pairwise checks.
+    # A SKU split across groups is incompatible with itself and gets -1 (always re-checked).
+    sku_to_group: Dict[str, int] = {}
+    if not single_group:
+        for group_id, group in enumerate(compatibility_groups):
+            for product in group:
+                previous = sku_to_group.get(product.sku, group_id)
+                sku_to_group[product.sku] = group_id if previous == group_id else -1
+    
+    logger.info("✅ Created %d compatible group(s)", len(compatibility_groups))
     
     # Step 2: Pack each compatible group
-    print(f"\n📦 Step 2: Packing each compatible group...")
+    logger.debug("📦 Step 2: Packing each compatible group...")
     all_packed_containers = []
+    all_container_categories = []
     warnings = []
     
     for group_idx, group in enumerate(compatibility_groups, 1):
-        print(f"\n   Packing Group {group_idx} ({len(group)} items)...")
+        # Categories are resolved once per group and reused for logging and warnings
+        group_categories = set(category_of(p.sku) for p in group)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "   Packing Group %d (%d items) - Categories: %s",
+                group_idx, len(group), ', '.join(group_categories)
+            )
+            
+            # Show any hazmat items
+            hazmat_items = [p for p in group if p.hazmat_class]
+            if hazmat_items:
+                logger.debug("            ⚠️  Hazmat: %d items", len(hazmat_items))
+            
+            fragile_items = [p for p in group if p.fragile]
+            if fragile_items:
+                logger.debug("            🔹 Fragile: %d items", len(fragile_items))
+        
+        # Decreasing-volume order turns the strategies into their FFD/BFD variants
+        group = sorted(group, key=lambda p: volume_by_sku[p.sku], reverse=True)
+        
+        # Drop containers that cannot hold the whole group before any pack() call
+        group_arrays = _to_arrays(group)
+        item_dims = np.sort(np.column_stack((group_arrays["w"], group_arrays["l"], group_arrays["h"])), axis=1)
+        group_volume = float(np.sum(group_arrays["w"] * group_arrays["l"] * group_arrays["h"]))
+        fits = _container_fit_kernel(item_dims, bin_dims, group_volume)
+        feasible_ids = {id(c) for c, ok in zip(containers, fits) if ok}
+        group_containers = [c for c in containers if id(c) in feasible_ids]
+        group_price_sorted = [c for c in price_sorted_containers if id(c) in feasible_ids]
+        if not group_containers:
+            logger.warning("❌ No container can hold group %d with %d items", group_idx, len(group))
+            return None
         
         # Select packing strategy
         if strategy == "auto":
             # Auto-select based on group characteristics
             if len(group) <= 3:
-                packing_result = pack_single_container_attempt(group, containers)
+                packing_result = pack_single_container_attempt(group, group_price_sorted, pre_sorted=True)
             elif len(group) > 10:
-                packing_result = pack_greedy_max_utilization(group, containers)
+                packing_result = pack_greedy_max_utilization(group, group_containers)
             else:
-                packing_result = pack_best_fit(group, containers)
+                packing_result = pack_best_fit(group, group_containers)
         elif strategy == "greedy":
-            packing_result = pack_greedy_max_utilization(group, containers)
+            packing_result = pack_greedy_max_utilization(group, group_containers)
         elif strategy == "best_fit":
-            packing_result = pack_best_fit(group, containers)
+            packing_result = pack_best_fit(group, group_containers)
         elif strategy == "large_first":
-            packing_result = pack_largest_first_optimized(group, containers)
+            packing_result = pack_largest_first_optimized(group, group_containers)
         else:
-            packing_result = pack_multi_container(group, containers)
+            packing_result = pack_multi_container(group, group_containers)
         
         if packing_result:
             all_packed_containers.extend(packing_result)
-            print(f"   ✅ Group {group_idx} packed into {len(packing_result)} container(s)")
+            all_container_categories.extend(group_categories for _ in packing_result)
+            logger.debug("   ✅ Group %d packed into %d container(s)", group_idx, len(packing_result))
             
             # Add warning if group requires multiple containers
             if len(packing_result) > 1:
-                categories = set(CompatibilityChecker.get_product_category(p).value for p in group)
                 warnings.append(
-                    f"Group {group_idx} ({', '.join(categories)}) required "
+                    f"Group {group_idx} ({', '.join(group_categories)}) required "
                     f"{len(packing_result)} containers due to size/weight constraints"
                 )
         else:
-            print(f"   ❌ Failed to pack Group {group_idx}")
+            logger.warning("❌ Failed to pack group %d with %d items", group_idx, len(group))
             warnings.append(f"Failed to pack group {group_idx} with {len(group)} items")
             return None  # Can't continue if any group fails
     
     # Step 3: Final validation
-    print(f"\n🔍 Step 3: Validating packed containers...")
-    if not validate_packing_safety(all_packed_containers, products):
+    if single_group:
+        logger.debug("🔍 Step 3: Skipped validation (single compatible group)")
+    elif not validate_packing_safety(all_packed_containers, products, sku_to_group, product_lookup):
         warnings.append("⚠️  Safety validation detected potential issues")
     else:
-        print(f"   ✅ All containers passed safety validation")
-    
-    # Summary
-    print(f"\n{'='*60}")
-    print(f"✅ SAFE PACKING COMPLETE")
-    print(f"{'='*60}")
-    print(f"Total containers used: {len(all_packed_containers)}")
-    print(f"Compatibility groups: {len(compatibility_groups)}")
-    print(f"Warnings: {len(warnings)}")
-    if warnings:
-        for warning in warnings:
-            print(f"   ⚠️  {warning}")
-    print(f"{'='*60}\n")
+        logger.debug("🔍 Step 3: ✅ All containers passed safety validation")
+    
+    # Summary, emitted as one record so concurrent requests do not interleave its lines
+    summary_lines = [
+        f"✅ Safe packing complete: {len(all_packed_containers)} container(s), "
+        f"{len(compatibility_groups)} compatibility group(s), {len(warnings)} warning(s)"
+    ]
+    summary_lines.extend(f"   ⚠️  {warning}" for warning in warnings)
+    logger.log(logging.WARNING if warnings else logging.INFO, "\n".join(summary_lines))
     
     return SafePackingResult(
         packed_containers=all_packed_containers,
         compatibility_groups=compatibility_groups,
-        warnings=warnings
+        warnings=warnings,
+        container_categories=all_container_categories
     )
 
 
 def pack_single_container_attempt(
     products: List[Product],
-    containers: List[Container]
+    containers: List[Container],
+    pre_sorted: bool = False
 ) -> Optional[List[Tuple[Container, PackedContainer]]]:
-    """Try to pack products in a single container"""
+    """Try to pack products in a single container (pre_sorted: containers already cheapest-first)"""
     # Sort containers by cost (cheapest first)
-    sorted_containers = sorted(containers, key=lambda c: c.price_try or 0)
+    sorted_containers = containers if pre_sorted else sorted(containers, key=lambda c: c.price_try_safe)
     
     for container in sorted_containers:
         result = pack(products, container)
@@ -180,21 +285,32 @@ def pack_single_container_attempt(
 
 def validate_packing_safety(
     packed_containers: List[Tuple[Container, PackedContainer]],
-    original_products: List[Product]
+    original_products: List[Product],
+    sku_to_group: Optional[Dict[str, int]] = None,
+    product_lookup: Optional[Dict[str, Product]] = None
 ) -> bool:
     """
     Validate that no incompatible products ended up in the same container
     
-    This is a safety check to catch any bugs in the packing algorithm
+    This is a safety check to catch any bugs in the packing algorithm.
+    If sku_to_group is given, containers holding a single compatibility
+    group are accepted without the pairwise scan.
     """
-    # Build product lookup
-    product_lookup = {p.sku: p for p in original_products}
+    # Build product lookup unless the caller already has one
+    if product_lookup is None:
+        product_lookup = {p.sku: p for p in original_products}
     
     all_valid = True
     
     for container_tuple in packed_containers:
         container, packed = container_tuple
         
+        # Fast path: groups are mutually compatible by construction
+        if sku_to_group is not None:
+            group_ids = {sku_to_group.get(placement.sku, -1) for placement in packed.placements}
+            if len(group_ids) <= 1 and -1 not in group_ids:
+                continue
+        
         # Get all products in this container
         container_products = []
         for placement in packed.placements:
@@ -203,14 +319,14 @@ def validate_packing_safety(
         
         # Check if all products are compatible with each other
         if not CompatibilityChecker.can_pack_together(container_products):
-            print(f"   ⚠️  WARNING: Container {container.box_id} contains incompatible products!")
+            logger.warning("⚠️  Container %s contains incompatible products!", container.box_id)
             
             # Find which products are incompatible
             for i, p1 in enumerate(container_products):
                 for p2 in container_products[i+1:]:
                     if not CompatibilityChecker.are_compatible(p1, p2):
                         reason = CompatibilityChecker.get_incompatibility_reason(p1, p2)
-                        print(f"      - {p1.sku} ↔️ {p2.sku}: {reason}")
+                        logger.warning("      - %s ↔️ %s: %s", p1.sku, p2.sku, reason)
             
             all_valid = False
     
@@ -224,6 +340,8 @@ def get_packing_report(
     """
     Generate detailed packing report with compatibility analysis
     """
+    product_lookup = {p.sku: p for p in products}
+    
     report = {
         "total_products": len(products),
         "total_containers": len(safe_result.packed_containers),
@@ -233,21 +351,25 @@ def get_packing_report(
         "container_details": []
     }
     
-    # Analyze products
-    hazmat_count = sum(1 for p in products if p.hazmat_class)
-    fragile_count = sum(1 for p in products if p.fragile)
-    
-    categories = {}
+    # Analyze products in a single pass
+    category_of = _category_lookup(product_lookup)
+    hazmat_count = 0
+    fragile_count = 0
+    categories = defaultdict(int)
     for product in products:
-        cat = CompatibilityChecker.get_product_category(product)
-        categories[cat.value] = categories.get(cat.value, 0) + 1
+        hazmat_count += bool(product.hazmat_class)
+        fragile_count += bool(product.fragile)
+        categories[category_of(product.sku)] += 1
     
     report["product_analysis"] = {
         "hazmat_items": hazmat_count,
         "fragile_items": fragile_count,
-        "categories": categories
+        "categories": dict(categories)
     }
     
+    # Categories are recorded at packing time; derive them only for hand-built results
+    precomputed = len(safe_result.container_categories) == len(safe_result.packed_containers)
+    
     # Container details
     for i, (container, packed) in enumerate(safe_result.packed_containers, 1):
         container_info = {
@@ -260,13 +382,15 @@ def get_packing_report(
         }
         
         # Get categories in this container
-        container_categories = set()
-        for placement in packed.placements:
-            # Find the original product
-            product = next((p for p in products if p.sku == placement.sku), None)
-            if product:
-                cat = CompatibilityChecker.get_product_category(product)
-                container_categories.add(cat.value)
+        if precomputed:
+            container_categories = safe_result.container_categories[i - 1]
+        else:
+            container_categories = set()
+            for placement in packed.placements:
+                # Find the original product
+                product = product_lookup.get(placement.sku)
+                if product:
+                    container_categories.add(category_of(product.sku))
         
         container_info["categories_in_container"] = list(container_categories)
         report["container_details"].append(container_info)
@@ -1,9 +1,12 @@
-from typing import List, Optional, Tuple
-from pydantic import BaseModel, Field
+import re
+from typing import List, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, conlist, field_validator
 from datetime import datetime
 
 
 class APIProduct(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	sku: str
 	width_mm: float
 	length_mm: float
@@ -15,6 +18,8 @@ class APIProduct(BaseModel):
 
 
 class APIContainer(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	box_id: str
 	inner_w_mm: float
 	inner_l_mm: float
@@ -28,19 +33,25 @@ class APIContainer(BaseModel):
 
 
 class PackRequest(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	order_id: str = Field(..., description="Client order identifier")
 	products: List[APIProduct]
 	containers: List[APIContainer]
 
 
 class Placement(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	sku: str
-	position_mm: Tuple[float, float, float]
-	size_mm: Tuple[float, float, float]
-	rotation: Tuple[int, int, int]
+	position_mm: conlist(float, min_length=3, max_length=3)
+	size_mm: conlist(float, min_length=3, max_length=3)
+	rotation: conlist(int, min_length=3, max_length=3)
 
 
 class PackResponse(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	order_id: str
 	box_id: Optional[str]
 	placements: List[Placement]
@@ -48,18 +59,41 @@ class PackResponse(BaseModel):
 	price_try: Optional[float]
 
 
+# /pack builds its payload as plain dicts and skips response validation; these
+# mirror Placement and PackResponse, which stay the documented response model
+class PlacementDict(TypedDict):
+	sku: str
+	position_mm: List[float]
+	size_mm: List[float]
+	rotation: List[int]
+
+
+class PackResponseDict(TypedDict):
+	order_id: str
+	box_id: Optional[str]
+	placements: List[PlacementDict]
+	utilization: float
+	price_try: Optional[float]
+
+
 # Order-based API models
 class OrderItem(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	sku: str
 	quantity: int = Field(ge=1)
 
 
 class OrderPackRequest(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	order_id: str
 	items: List[OrderItem]
 
 
 class ContainerResult(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	container_id: str
 	container_name: Optional[str] = None
 	shipping_company: Optional[str] = None
@@ -75,6 +109,8 @@ class ContainerResult(BaseModel):
 	inner_h_mm: Optional[float] = None
 
 class OrderPackResponse(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	order_id: str
 	success: bool
 	containers: List[ContainerResult] = []
@@ -99,20 +135,36 @@ class OrderPackResponse(BaseModel):
 
 # Order Management API models
 class APIOrderItem(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	sku: str
 	quantity: int = Field(ge=1)
 	unit_price_try: Optional[float] = None
 	total_price_try: Optional[float] = None
 
 
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+
+
 class CreateOrderRequest(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	customer_name: str = Field(..., min_length=1)
-	customer_email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
+	customer_email: str
 	items: List[APIOrderItem]
 	notes: Optional[str] = None
 
+	@field_validator('customer_email')
+	@classmethod
+	def check_email(cls, v: str) -> str:
+		if '@' not in v or not _EMAIL_RE.match(v):
+			raise ValueError('customer_email must look like name@domain.tld')
+		return v
+
 
 class UpdateOrderRequest(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	customer_name: Optional[str] = None
 	customer_email: Optional[str] = None
 	items: Optional[List[APIOrderItem]] = None
@@ -120,6 +172,8 @@ class UpdateOrderRequest(BaseModel):
 
 
 class OrderResponse(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	order_id: str
 	customer_name: str
 	customer_email: str
@@ -134,5 +188,7 @@ class OrderResponse(BaseModel):
 
 
 class OrderListResponse(BaseModel):
+	model_config = ConfigDict(frozen=True)
+
 	orders: List[OrderResponse]
 	total_count: int 
\ No newline at end of file
@@ -1,3914 +1,315 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from typing import List, Optional, Tuple, Dict
-from .schemas import PackRequest, PackResponse, Placement, OrderPackRequest, OrderPackResponse, ContainerResult, CreateOrderRequest, UpdateOrderRequest, OrderResponse, OrderListResponse, APIOrderItem
+from .schemas import (PackRequest, PackResponse, Placement, OrderPackRequest, OrderPackResponse, ContainerResult, CreateOrderRequest, UpdateOrderRequest, OrderResponse, OrderListResponse, APIOrderItem,
+                      PlacementDict, PackResponseDict)
 from .models import Product, Container, Order, OrderItem, PackedContainer
-from .io import load_products_csv, load_containers_csv, load_orders_csv, save_order_to_csv
+from .io import load_products_csv, load_containers_csv, load_orders_csv, save_order_to_csv, append_order_to_csv, delete_order_from_csv
 from .packer import (pack, find_optimal_multi_packing, pack_greedy_max_utilization, pack_best_fit, 
                     pack_largest_first_optimized, adaptive_strategy_selection, genetic_algorithm_packing,
-                    multi_objective_packing, ensemble_packing, optimized_utilization_packing)
+                    multi_objective_packing, ensemble_packing, optimized_utilization_packing, placements_volume)
 from .ml_strategy_selector import strategy_predictor
+from ._scoring import score_candidates
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from datetime import datetime
-import uuid
-
-
-app = FastAPI(title="TetraboX API", version="0.1.0")
-
-# Mount static files directory
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-@app.get("/favicon.ico")
-def favicon():
-    """Serve favicon from static directory"""
-    from fastapi.responses import FileResponse
-    import os
-    favicon_path = os.path.join("static", "favicon.ico")
-    if os.path.exists(favicon_path):
-        return FileResponse(favicon_path, media_type="image/x-icon")
-    else:
-        # Fallback to simple transparent pixel if file doesn't exist
-        from fastapi.responses import Response
-        return Response(content=b'\x00\x00\x01\x00\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\x00\x16\x00\x00\x00', media_type="image/x-icon")
-
-@app.get("/health")
-def health_check():
-	"""Health check endpoint for DigitalOcean App Platform"""
-	return {"status": "healthy", "service": "TetraboX"}
-
-def try_aggressive_partial_packing(products: List[Product], containers: List[Container]) -> Optional[List[Tuple[Container, PackedContainer]]]:
-	"""
-	Optimized partial packing with smart container selection and utilization maximization.
-	"""
-	# Sort containers by cost efficiency (price per volume)
-	def container_efficiency(c):
-		volume = c.inner_w_mm * c.inner_l_mm * c.inner_h_mm / 1000.0
-		price = c.price_try or 0
-		return price / volume if volume > 0 else float('inf')
-	
-	sorted_containers = sorted(containers, key=container_efficiency)
-	
-	# Sort products by volume (smallest first for better packing)
-	sorted_products = sorted(products, key=lambda p: p.width_mm * p.length_mm * p.height_mm)
-	
-	remaining_products = sorted_products.copy()
-	packed_containers = []
-	max_containers = min(10, len(products))
-	
-	iteration = 0
-	while remaining_products and iteration < max_containers:
-		iteration += 1
-		
-		best_pack = None
-		best_container = None
-		best_score = -1
-		
-		# Try different group sizes: start with many items, reduce if needed
-		group_sizes = [min(len(remaining_products), size) for size in [12, 10, 8, 6, 4, 3, 2, 1]]
-		
-		for group_size in group_sizes:
-			test_group = remaining_products[:group_size]
-			
-			# Try each container type and find the best utilization/cost ratio
-			for container in sorted_containers:
-				result = pack(test_group, container)
-				if result and len(result.placements) > 0:
-					# Calculate comprehensive score
-					packed_count = len(result.placements)
-					total_item_volume = sum(p.size_mm[0] * p.size_mm[1] * p.size_mm[2] for p in result.placements) / 1000.0
-					container_volume = container.inner_w_mm * container.inner_l_mm * container.inner_h_mm / 1000.0
-					utilization = total_item_volume / container_volume if container_volume > 0 else 0
-					
-					# Only consider solutions with good utilization (minimum 40%)
-					if utilization < 0.4:
-						continue
-					
-					# Score heavily favors utilization (85%) + item count (15%)
-					item_ratio = packed_count / group_size
-					score = (utilization * 0.85) + (item_ratio * 0.15)
-					
-					# Strong bonus for high utilization
-					if utilization >= 0.8:
-						score *= 1.5  # 50% bonus for 80%+ utilization
-					elif utilization >= 0.7:
-						score *= 1.3  # 30% bonus for 70%+ utilization
-					elif utilization >= 0.6:
-						score *= 1.2  # 20% bonus for 60%+ utilization
-					
-					# Penalty for expensive containers unless utilization is very high
-					if (container.price_try or 0) > 50 and utilization < 0.75:
-						score *= 0.8
-					
-					if score > best_score:
-						best_pack = result
-						best_container = container
-						best_score = score
-			
-			# If we found a high-utilization solution, don't try smaller groups
-			if best_score > 0.6:  # High threshold for good utilization
-				break
-		
-		if not best_pack:
-			# Skip this iteration if we can't pack anything
-			if remaining_products:
-				remaining_products.pop(0)  # Remove first item to try with others
-			continue
-		else:
-			# Add this container to solution
-			packed_containers.append((best_container, best_pack))
-			
-			# Remove packed items
-			packed_skus = [p.sku for p in best_pack.placements]
-			for sku in packed_skus:
-				for i, product in enumerate(remaining_products):
-					if product.sku == sku:
-						remaining_products.pop(i)
-						break
-	
-	# Return partial result if we packed at least 5% of items
-	packed_item_count = len(products) - len(remaining_products)
-	success_threshold = max(1, len(products) * 0.05)
-	
-	if packed_containers and packed_item_count >= success_threshold:
-		return packed_containers
-	
-	return None
-
-
-@app.get("/static/localization.js")
-def get_localization():
-	"""Serve the localization JavaScript file"""
-	import os
-	localization_path = os.path.join(os.path.dirname(__file__), "localization.js")
-	with open(localization_path, 'r', encoding='utf-8') as f:
-		content = f.read()
-	return HTMLResponse(content=content, media_type="application/javascript")
-
-@app.get("/", response_class=HTMLResponse)
-def index():
-	return """
-<!doctype html>
-<html>
-<head>
-<meta charset=\"utf-8\" />
-<title>TetraboX Order Packer</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-
-* {
-  box-sizing: border-box;
-}
-
-body { 
-  font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; 
-  margin: 0; 
-  display: flex; 
-  height: 100vh; 
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  position: relative;
-  overflow: hidden;
-}
-
-body::before {
-  content: '';
-  position: absolute;
-  width: 200%;
-  height: 200%;
-  background: radial-gradient(circle, rgba(255,255,255,0.1) 1px, transparent 1px);
-  background-size: 50px 50px;
-  animation: moveBackground 20s linear infinite;
-  z-index: 0;
-}
-
-@keyframes moveBackground {
-  0% { transform: translate(0, 0); }
-  100% { transform: translate(50px, 50px); }
-}
-
-.sidebar {
-  width: 400px;
-  background: linear-gradient(135deg, rgba(255, 255, 255, 0.98) 0%, rgba(248, 250, 252, 0.98) 100%);
-  backdrop-filter: blur(20px);
-  border-right: 2px solid rgba(102, 126, 234, 0.1);
-  padding: 0;
-  box-shadow: 4px 0 32px rgba(0,0,0,0.12);
-  overflow-y: auto;
-  position: fixed;
-  height: 100vh;
-  left: 0;
-  top: 0;
-  z-index: 10;
-  transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.sidebar.collapsed {
-  transform: translateX(-100%);
-}
-
-.sidebar-header {
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  padding: 30px 25px;
-  position: sticky;
-  top: 0;
-  z-index: 20;
-  box-shadow: 0 4px 20px rgba(102, 126, 234, 0.3);
-}
-
-.sidebar-content {
-  padding: 25px;
-}
-
-.sidebar h3 {
-  font-size: 26px;
-  font-weight: 800;
-  color: white;
-  margin: 0;
-  display: flex;
-  align-items: center;
-  gap: 12px;
-  letter-spacing: -0.5px;
-}
-
-.sidebar-subtitle {
-  font-size: 13px;
-  color: rgba(255,255,255,0.9);
-  font-weight: 500;
-  margin-top: 6px;
-  letter-spacing: 0.3px;
-}
-
-.sidebar h4 {
-  font-size: 12px;
-  font-weight: 700;
-  color: #64748b;
-  margin: 0 0 12px 0;
-  display: flex;
-  align-items: center;
-  gap: 8px;
-  text-transform: uppercase;
-  letter-spacing: 1px;
-}
-
-.main-content {
-  margin-left: 400px;
-  padding: 30px;
-  width: calc(100% - 400px);
-  overflow-y: auto;
-  z-index: 1;
-  transition: margin-left 0.3s cubic-bezier(0.4, 0, 0.2, 1), width 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.main-content.expanded {
-  margin-left: 0;
-  width: 100%;
-}
-.sku-panel {
-  background: white;
-  border: 2px solid rgba(102, 126, 234, 0.1);
-  border-radius: 16px;
-  padding: 0;
-  margin-bottom: 20px;
-  box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-  overflow: hidden;
-  transition: all 0.3s ease;
-}
-
-.sku-panel:hover {
-  box-shadow: 0 8px 30px rgba(102, 126, 234, 0.12);
-  transform: translateY(-2px);
-}
-
-.sku-list {
-  max-height: 420px;
-  overflow-y: auto;
-  border: none;
-  border-radius: 0;
-  background: transparent;
-}
-
-.sku-list::-webkit-scrollbar {
-  width: 10px;
-}
-
-.sku-list::-webkit-scrollbar-track {
-  background: rgba(241, 245, 249, 0.5);
-  border-radius: 5px;
-  margin: 4px;
-}
-
-.sku-list::-webkit-scrollbar-thumb {
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  border-radius: 5px;
-  border: 2px solid rgba(255,255,255,0.5);
-}
-
-.sku-list::-webkit-scrollbar-thumb:hover {
-  background: linear-gradient(135deg, #5568d3 0%, #653a8b 100%);
-}
-
-.sku-item {
-  padding: 18px 20px;
-  border-bottom: 1px solid rgba(226, 232, 240, 0.4);
-  cursor: pointer;
-  transition: all 0.35s cubic-bezier(0.4, 0, 0.2, 1);
-  position: relative;
-  background: white;
-  overflow: hidden;
-}
-
-.sku-item::before {
-  content: '';
-  position: absolute;
-  left: 0;
-  top: 0;
-  height: 100%;
-  width: 5px;
-  background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-  transform: scaleY(0);
-  transition: transform 0.35s cubic-bezier(0.4, 0, 0.2, 1);
-  box-shadow: 2px 0 8px rgba(102, 126, 234, 0.3);
-}
-
-.sku-item::after {
-  content: '';
-  position: absolute;
-  right: -100%;
-  top: 0;
-  height: 100%;
-  width: 100%;
-  background: linear-gradient(90deg, transparent 0%, rgba(102, 126, 234, 0.03) 100%);
-  transition: right 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.sku-item:hover {
-  background: white;
-  transform: translateX(6px);
-  box-shadow: 0 4px 12px rgba(102, 126, 234, 0.15), 0 2px 4px rgba(0,0,0,0.05);
-}
-
-.sku-item:hover::before {
-  transform: scaleY(1);
-}
-
-.sku-item:hover::after {
-  right: 0;
-}
-
-.sku-item:active {
-  transform: translateX(4px) scale(0.99);
-}
-
-.sku-item:last-child {
-  border-bottom: none;
-}
-
-.sku-code {
-  font-weight: 700;
-  color: #667eea;
-  font-size: 14px;
-  letter-spacing: -0.03em;
-}
-
-.sku-name {
-  font-size: 12px;
-  color: #64748b;
-  margin-top: 4px;
-  line-height: 1.5;
-  font-weight: 500;
-}
-
-input, button { 
-  padding: 12px 16px; 
-  margin: 4px;
-  border: 2px solid #e2e8f0;
-  border-radius: 10px;
-  font-family: 'Inter', sans-serif;
-  font-size: 14px;
-  transition: all 0.3s ease;
-}
-
-input:focus {
-  outline: none;
-  border-color: #667eea;
-  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-}
-
-button { 
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-  color: white; 
-  border: none; 
-  cursor: pointer; 
-  font-weight: 600;
-  box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-  transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-button:hover { 
-  transform: translateY(-2px);
-  box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-}
-
-button:active {
-  transform: translateY(0) scale(0.98);
-}
-
-/* Premium Search Input Styling */
-#orderSearch {
-  transition: all 0.3s ease;
-}
-
-#orderSearch:focus {
-  border-color: #667eea;
-  box-shadow: 0 0 0 4px rgba(102, 126, 234, 0.1), 0 4px 12px rgba(102, 126, 234, 0.15);
-  outline: none;
-  transform: translateY(-1px);
-}
-
-/* Load Orders Button Animation */
-@keyframes pulse-subtle {
-  0%, 100% { box-shadow: 0 4px 16px rgba(0,0,0,0.15); }
-  50% { box-shadow: 0 6px 20px rgba(102, 126, 234, 0.3); }
-}
-
-/* Smooth fade-in animation for stats */
-@keyframes fadeInUp {
-  from {
-    opacity: 0;
-    transform: translateY(10px);
-  }
-  to {
-    opacity: 1;
-    transform: translateY(0);
-  }
-}
-
-#orderStats {
-  animation: fadeInUp 0.4s ease-out;
-}
-
-.search-box {
-  width: calc(100% - 8px);
-  margin-bottom: 15px;
-  padding: 14px 16px;
-  font-size: 14px;
-  border: 2px solid #e2e8f0;
-  border-radius: 12px;
-  background: white;
-  transition: all 0.3s ease;
-}
-
-.search-box:focus {
-  border-color: #667eea;
-  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-  outline: none;
-}
-
-.order-list {
-  background: white; 
-  border: 1px solid #e2e8f0; 
-  border-radius: 12px; 
-  padding: 15px; 
-  max-height: 250px; 
-  overflow-y: auto;
-  font-size: 12px;
-  box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-}
-
-.order-list::-webkit-scrollbar {
-  width: 6px;
-}
-
-.order-list::-webkit-scrollbar-track {
-  background: #f1f5f9;
-}
-
-.order-list::-webkit-scrollbar-thumb {
-  background: #cbd5e1;
-  border-radius: 3px;
-}
-
-#log {
-  white-space: pre; 
-  background: #1e293b; 
-  color: #e2e8f0;
-  padding: 20px; 
-  border: 1px solid #334155;
-  border-radius: 12px;
-  font-family: 'Courier New', monospace;
-  font-size: 12px;
-}
-
-h1, h2 {
-  color: white;
-  margin-top: 0;
-  font-weight: 700;
-  text-shadow: 0 2px 10px rgba(0,0,0,0.2);
-}
-
-h3, h4 {
-  margin-top: 0;
-}
-
-/* Modal Styles */
-.modal {
-  display: none;
-  position: fixed;
-  z-index: 1000;
-  left: 0;
-  top: 0;
-  width: 100%;
-  height: 100%;
-  background-color: rgba(0,0,0,0.7);
-  backdrop-filter: blur(4px);
-  animation: fadeIn 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.modal-content {
-  background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-  margin: 2% auto;
-  border-radius: 20px;
-  width: 95%;
-  max-width: 1400px;
-  max-height: 92vh;
-  overflow-y: auto;
-  animation: slideIn 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-  box-shadow: 0 20px 60px rgba(0,0,0,0.4);
-  border: 1px solid rgba(255,255,255,0.3);
-}
-
-.modal-content::-webkit-scrollbar {
-  width: 10px;
-}
-
-.modal-content::-webkit-scrollbar-track {
-  background: #f1f5f9;
-}
-
-.modal-content::-webkit-scrollbar-thumb {
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  border-radius: 5px;
-}
-
-.modal-header {
-  display: flex;
-  justify-content: space-between;
-  align-items: center;
-  padding: 25px 30px;
-  border-bottom: 1px solid #e2e8f0;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  border-radius: 20px 20px 0 0;
-}
-
-.modal-header h2 {
-  margin: 0;
-  color: white;
-  font-weight: 700;
-  font-size: 24px;
-  text-shadow: 0 2px 10px rgba(0,0,0,0.2);
-}
-
-.close {
-  font-size: 32px;
-  font-weight: 300;
-  cursor: pointer;
-  color: rgba(255,255,255,0.8);
-  transition: all 0.3s ease;
-  line-height: 1;
-  width: 40px;
-  height: 40px;
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  border-radius: 50%;
-}
-
-.close:hover {
-  color: white;
-  background: rgba(255,255,255,0.2);
-  transform: rotate(90deg);
-}
-
-.modal-body {
-  padding: 30px;
-}
-
-.modal-tabs {
-  display: flex;
-  gap: 10px;
-  margin: 25px 0;
-  border-bottom: 2px solid #e2e8f0;
-  padding-bottom: 0;
-}
-
-.tab-button {
-  padding: 12px 24px;
-  border: none;
-  background: transparent;
-  cursor: pointer;
-  border-radius: 10px 10px 0 0;
-  transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-  font-weight: 600;
-  font-size: 14px;
-  color: #64748b;
-  position: relative;
-}
-
-.tab-button::after {
-  content: '';
-  position: absolute;
-  bottom: -2px;
-  left: 0;
-  right: 0;
-  height: 2px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  transform: scaleX(0);
-  transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-}
-
-.tab-button.active {
-  background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-  color: #5a67d8;
-}
-
-.tab-button.active::after {
-  transform: scaleX(1);
-}
-
-.tab-button:hover:not(.active) {
-  background: rgba(102, 126, 234, 0.05);
-  color: #5a67d8;
-}
-
-.tab-content {
-  display: none;
-  padding: 20px 0;
-}
-
-.tab-content.active {
-  display: block;
-}
-
-.compact-result {
-  background: white;
-  border: 2px solid #10b981;
-  border-radius: 16px;
-  padding: 20px 24px;
-  margin: 20px 0;
-  display: flex;
-  justify-content: space-between;
-  align-items: center;
-  box-shadow: 0 8px 24px rgba(16, 185, 129, 0.15);
-  transition: all 0.3s ease;
-}
-
-.compact-result:hover {
-  transform: translateY(-2px);
-  box-shadow: 0 12px 32px rgba(16, 185, 129, 0.2);
-}
-
-.result-summary {
-  flex: 1;
-}
-
-.result-summary strong {
-  color: #059669;
-  font-size: 16px;
-  font-weight: 700;
-}
-
-.result-summary small {
-  color: #64748b;
-  font-size: 13px;
-}
-
-.result-actions {
-  display: flex;
-  gap: 12px;
-}
-
-.result-actions button {
-  padding: 10px 20px;
-  font-size: 14px;
-  border-radius: 10px;
-  box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-}
-
-@keyframes fadeIn {
-  from { opacity: 0; }
-  to { opacity: 1; }
-}
-
-@keyframes slideIn {
-  from { 
-    transform: translateY(-30px) scale(0.95); 
-    opacity: 0; 
-  }
-  to { 
-    transform: translateY(0) scale(1); 
-    opacity: 1; 
-  }
-}
-
-/* Premium Card Styles */
-.premium-card {
-  background: white;
-  border-radius: 16px;
-  padding: 24px;
-  box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-  margin-bottom: 20px;
-  border: 1px solid rgba(102, 126, 234, 0.1);
-  transition: all 0.3s ease;
-}
-
-/* Hide selected order section in create tab */
-.hidden-in-create-tab {
-  display: none !important;
-  visibility: hidden !important;
-  opacity: 0 !important;
-  height: 0 !important;
-  overflow: hidden !important;
-}
-
-.premium-card:hover {
-  box-shadow: 0 8px 30px rgba(0,0,0,0.12);
-  transform: translateY(-2px);
-}
-
-.header-badge {
-  display: inline-block;
-  padding: 6px 14px;
-  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-  color: white;
-  border-radius: 20px;
-  font-size: 12px;
-  font-weight: 600;
-  margin-left: 12px;
-  box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3);
-}
-</style>
-</head>
-<body>
-
-<!-- Sidebar Toggle Button -->
-<div id="sidebarToggle" onclick="toggleSidebar()" style="position: fixed; bottom: 20px; left: 20px; z-index: 1001; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); backdrop-filter: blur(20px); border-radius: 16px; padding: 14px; box-shadow: 0 12px 40px rgba(102, 126, 234, 0.4), 0 4px 16px rgba(0,0,0,0.1); border: 1px solid rgba(255,255,255,0.3); cursor: pointer; transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1); color: white; display: flex; align-items: center; justify-content: center; min-width: 48px; min-height: 48px;" title="Toggle Order List" onmouseover="this.style.transform='translateY(-2px)'; this.style.boxShadow='0 16px 50px rgba(102, 126, 234, 0.5), 0 8px 24px rgba(0,0,0,0.15)'" onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 12px 40px rgba(102, 126, 234, 0.4), 0 4px 16px rgba(0,0,0,0.1)'">
-  <svg width="22" height="22" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-    <line x1="3" y1="6" x2="21" y2="6"></line>
-    <line x1="3" y1="12" x2="21" y2="12"></line>
-    <line x1="3" y1="18" x2="21" y2="18"></line>
-  </svg>
-</div>
-
-<div class="sidebar" id="sidebar">
-  <div class="sidebar-header">
-    <div style="display: flex; align-items: center; gap: 14px; margin-bottom: 16px;">
-      <div style="width: 56px; height: 56px; background: linear-gradient(135deg, rgba(255,255,255,0.25) 0%, rgba(255,255,255,0.15) 100%); border-radius: 16px; display: flex; align-items: center; justify-content: center; backdrop-filter: blur(15px); box-shadow: 0 8px 24px rgba(0,0,0,0.15), inset 0 1px 0 rgba(255,255,255,0.3);">
-        <svg width="30" height="30" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-          <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-          <polyline points="7.5 4.21 12 6.81 16.5 4.21"></polyline>
-          <polyline points="7.5 19.79 7.5 14.6 3 12"></polyline>
-          <polyline points="21 12 16.5 14.6 16.5 19.79"></polyline>
-          <polyline points="3.27 6.96 12 12.01 20.73 6.96"></polyline>
-          <line x1="12" y1="22.08" x2="12" y2="12"></line>
-        </svg>
-      </div>
-      <div style="flex: 1;">
-        <h3 style="margin-bottom: 4px; font-size: 22px;" data-tr="Sipariş Tarayıcısı" data-en="Order Browser">Sipariş Tarayıcısı</h3>
-        <div class="sidebar-subtitle" style="font-size: 13px; opacity: 0.95;" data-tr="Siparişleri görüntüleyin ve seçin" data-en="Browse and select orders">Siparişleri görüntüleyin ve seçin</div>
-      </div>
-    </div>
-    
-  </div>
-  
-  <div class="sidebar-content">
-    <!-- Tab Navigation -->
-    <div style="margin-bottom: 20px; background: white; border-radius: 16px; padding: 8px; box-shadow: 0 4px 20px rgba(0,0,0,0.08); border: 1px solid rgba(102, 126, 234, 0.1);">
-      <div style="display: flex; gap: 4px;">
-        <button id="createOrderTab" onclick="switchTab('create')" style="flex: 1; padding: 14px 20px; border: none; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 12px; cursor: pointer; font-weight: 700; font-size: 13px; transition: all 0.3s ease; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);">
-          <div style="display: flex; align-items: center; justify-content: center; gap: 8px;">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-              <polyline points="14 2 14 8 20 8"></polyline>
-              <line x1="16" y1="13" x2="8" y2="13"></line>
-              <line x1="16" y1="17" x2="8" y2="17"></line>
-            </svg>
-            <span data-tr="Sipariş Oluştur" data-en="Create Order">Sipariş Oluştur</span>
-          </div>
-        </button>
-        <button id="existingOrdersTab" onclick="switchTab('existing')" style="flex: 1; padding: 14px 20px; border: none; background: transparent; color: #64748b; border-radius: 12px; cursor: pointer; font-weight: 600; font-size: 13px; transition: all 0.3s ease;">
-          <div style="display: flex; align-items: center; justify-content: center; gap: 8px;">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-            </svg>
-            <span data-tr="Mevcut Siparişler" data-en="Existing Orders">Mevcut Siparişler</span>
-          </div>
-        </button>
-      </div>
-    </div>
-
-    <!-- Custom Order Creation Tab -->
-    <div id="createOrderContent" class="tab-content active">
-      <div style="margin-bottom: 20px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 16px; padding: 18px; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);">
-        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 12px;">
-          <div style="width: 40px; height: 40px; background: rgba(255,255,255,0.2); border-radius: 10px; display: flex; align-items: center; justify-content: center;">
-            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-              <polyline points="14 2 14 8 20 8"></polyline>
-            </svg>
-          </div>
-          <div>
-            <div style="color: white; font-size: 18px; font-weight: 700; letter-spacing: -0.3px;" data-tr="Özel Sipariş Oluştur" data-en="Create Custom Order">Özel Sipariş Oluştur</div>
-            <div style="color: rgba(255,255,255,0.9); font-size: 12px; font-weight: 500;" data-tr="Ürünleri seçin ve test edin" data-en="Select products and test">Ürünleri seçin ve test edin</div>
-          </div>
-        </div>
-      </div>
-
-      <!-- Order ID Input -->
-      <div style="margin-bottom: 16px;">
-        <label style="display: block; font-size: 12px; font-weight: 600; color: #64748b; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 0.5px;" data-tr="Sipariş ID" data-en="Order ID">Sipariş ID</label>
-        <input type="text" id="customOrderId" placeholder="ORD-TEST-001" style="width: calc(100% - 8px); padding: 14px 16px; margin: 0; border: 2px solid rgba(102, 126, 234, 0.15); border-radius: 12px; background: white; font-size: 14px; font-weight: 600; transition: all 0.3s ease; box-shadow: 0 2px 8px rgba(0,0,0,0.05);" data-tr-placeholder="ORD-TEST-001" data-en-placeholder="ORD-TEST-001">
-      </div>
-
-      <!-- Product Search -->
-      <div style="margin-bottom: 16px;">
-        <label style="display: block; font-size: 12px; font-weight: 600; color: #64748b; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 0.5px;" data-tr="Ürün Ara" data-en="Search Products">Ürün Ara</label>
-        <div style="position: relative;">
-          <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="#94a3b8" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="position: absolute; left: 16px; top: 50%; transform: translateY(-50%); pointer-events: none;">
-            <circle cx="11" cy="11" r="8"></circle>
-            <path d="m21 21-4.35-4.35"></path>
-          </svg>
-          <input type="text" id="skuSearch" oninput="filterSkus()" placeholder="SKU, marka, model, kategori ile ara..." style="width: calc(100% - 8px); padding: 14px 16px 14px 44px; margin: 0; border: 2px solid rgba(102, 126, 234, 0.15); border-radius: 12px; background: white; font-size: 13px; font-weight: 500; transition: all 0.3s ease; box-shadow: 0 2px 8px rgba(0,0,0,0.05);" data-tr-placeholder="SKU, marka, model, kategori ile ara..." data-en-placeholder="Search by SKU, brand, model, category...">
-        </div>
-      </div>
-
-      <!-- Product List -->
-      <div class="sku-panel">
-        <div class="sku-list" id="skuList">
-          <div style="padding: 60px 20px; text-align: center; color: #64748b;">
-            <div style="width: 64px; height: 64px; margin: 0 auto 24px; background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(5, 150, 105, 0.15) 100%); border-radius: 20px; display: flex; align-items: center; justify-content: center; box-shadow: 0 8px 20px rgba(16, 185, 129, 0.15);">
-              <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="color: #10b981;">
-                <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-              </svg>
-            </div>
-            <div style="font-weight: 700; margin-bottom: 8px; font-size: 16px; color: #2d3748;" data-tr="Ürünler Yükleniyor" data-en="Loading Products">Ürünler Yükleniyor</div>
-            <div style="font-size: 13px; font-weight: 500; color: #94a3b8; line-height: 1.6;" data-tr="Ürün listesi hazırlanıyor..." data-en="Preparing product list...">Ürün listesi hazırlanıyor...</div>
-          </div>
-        </div>
-      </div>
-
-      <!-- Selected Items -->
-      <div id="selectedItemsPanel" style="display: none; margin-top: 20px; background: white; border-radius: 16px; padding: 20px; box-shadow: 0 4px 20px rgba(0,0,0,0.08); border: 2px solid #10b981;">
-        <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 16px;">
-          <div style="display: flex; align-items: center; gap: 10px;">
-            <div style="width: 32px; height: 32px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 8px; display: flex; align-items: center; justify-content: center;">
-              <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-                <path d="M16 4h2a2 2 0 0 1 2 2v14a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V6a2 2 0 0 1 2-2h2"></path>
-                <rect x="8" y="2" width="8" height="4" rx="1" ry="1"></rect>
-              </svg>
-            </div>
-            <div>
-              <div style="font-size: 16px; font-weight: 700; color: #2d3748;" data-tr="Seçilen Ürünler" data-en="Selected Items">Seçilen Ürünler</div>
-              <div style="font-size: 12px; color: #64748b;" id="selectedItemsCount">0 ürün</div>
-            </div>
-          </div>
-          <button onclick="clearCustomOrder()" style="padding: 8px 16px; background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; border: none; border-radius: 8px; cursor: pointer; font-weight: 600; font-size: 12px; transition: all 0.3s ease;">
-            <span data-tr="Temizle" data-en="Clear">Temizle</span>
-          </button>
-        </div>
-        <div id="selectedItemsList" style="max-height: 200px; overflow-y: auto;">
-          <!-- Selected items will be populated here -->
-        </div>
-        <div style="margin-top: 16px; padding-top: 16px; border-top: 1px solid #e2e8f0;">
-          <button onclick="packCustomOrder()" style="width: 100%; padding: 14px 20px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; border: none; border-radius: 12px; cursor: pointer; font-weight: 700; font-size: 14px; transition: all 0.3s ease; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);">
-            <span data-tr="Siparişi Paketle" data-en="Pack Order">Siparişi Paketle</span>
-          </button>
-        </div>
-      </div>
-    </div>
-
-    <!-- Existing Orders Tab -->
-    <div id="existingOrdersContent" class="tab-content">
-      <div style="margin-bottom: 16px; background: linear-gradient(135deg, rgba(102, 126, 234, 0.05) 0%, rgba(118, 75, 162, 0.05) 100%); border-radius: 12px; padding: 16px; border: 1px solid rgba(102, 126, 234, 0.1);">
-        <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 8px;">
-          <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="#667eea" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-            <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-          </svg>
-          <div style="font-size: 14px; font-weight: 600; color: #667eea;" data-tr="Mevcut Siparişler" data-en="Existing Orders">Mevcut Siparişler</div>
-        </div>
-        <div style="font-size: 12px; color: #64748b; line-height: 1.5;" data-tr="Aşağıdaki siparişler arasından seçim yapabilir veya yukarıdaki sekmede kendi siparişinizi oluşturabilirsiniz." data-en="You can choose from the orders below or create your own order in the tab above.">Aşağıdaki siparişler arasından seçim yapabilir veya yukarıdaki sekmede kendi siparişinizi oluşturabilirsiniz.</div>
-      </div>
-
-      <!-- Order Statistics -->
-      <div id="orderStats" style="display: none; margin-bottom: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 16px; padding: 18px; box-shadow: 0 8px 24px rgba(102, 126, 234, 0.3);">
-        <div style="display: grid; grid-template-columns: 1fr; gap: 12px; text-align: center;">
-          <div>
-            <div style="font-size: 24px; font-weight: 800; color: white; margin-bottom: 2px;" id="totalOrders">0</div>
-            <div style="font-size: 10px; font-weight: 600; color: rgba(255,255,255,0.8); text-transform: uppercase; letter-spacing: 0.5px;" data-tr="Toplam Sipariş" data-en="Total Orders">Toplam Sipariş</div>
-          </div>
-        </div>
-      </div>
-      
-      <!-- Search and Filter -->
-      <div style="margin-bottom: 16px;">
-        <div style="position: relative;">
-          <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="#94a3b8" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="position: absolute; left: 16px; top: 50%; transform: translateY(-50%); pointer-events: none;">
-            <circle cx="11" cy="11" r="8"></circle>
-            <path d="m21 21-4.35-4.35"></path>
-          </svg>
-          <input type="text" id="orderSearch" oninput="filterOrders()" placeholder="ID veya müşteri adı ile ara..." style="width: calc(100% - 8px); padding: 14px 16px 14px 44px; margin: 0; border: 2px solid rgba(102, 126, 234, 0.15); border-radius: 12px; background: white; font-size: 13px; font-weight: 500; transition: all 0.3s ease; box-shadow: 0 2px 8px rgba(0,0,0,0.05);" data-tr-placeholder="ID veya müşteri adı ile ara..." data-en-placeholder="Search by ID or customer...">
-        </div>
-      </div>
-      
-      <div class="sku-panel">
-        <div class="sku-list" id="orderList">
-          <div style="padding: 60px 20px; text-align: center; color: #64748b;">
-            <div style="width: 64px; height: 64px; margin: 0 auto 24px; background: linear-gradient(135deg, rgba(102, 126, 234, 0.15) 0%, rgba(118, 75, 162, 0.15) 100%); border-radius: 20px; display: flex; align-items: center; justify-content: center; box-shadow: 0 8px 20px rgba(102, 126, 234, 0.15);">
-              <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="color: #667eea;">
-                <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-              </svg>
-            </div>
-            <div style="font-weight: 700; margin-bottom: 8px; font-size: 16px; color: #2d3748;">No Orders Loaded</div>
-            <div style="font-size: 13px; font-weight: 500; color: #94a3b8; line-height: 1.6;">Click "Load Orders" above to view<br>available orders</div>
-          </div>
-        </div>
-      </div>
-    </div>
-    
-    <!-- Order Details Section Spacer -->
-    <div style="margin-top: 20px; margin-bottom: 14px;"></div>
-    <!-- Premium Responsive Order Details Card -->
-    <div id="selectedOrderCard" style="display: none; background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%); border: 3px solid rgba(102, 126, 234, 0.2); border-radius: 20px; padding: 0; box-shadow: 0 8px 32px rgba(102, 126, 234, 0.15), 0 4px 16px rgba(0,0,0,0.1); overflow: hidden; transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1); min-height: 200px; position: relative;">
-      <!-- Dynamic Card Header (populated by JavaScript) -->
-      <div id="selectedOrderCardHeader" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 16px 20px; border-bottom: 2px solid rgba(255,255,255,0.1); position: relative; overflow: hidden;">
-        <div style="position: absolute; top: -10px; right: -10px; width: 60px; height: 60px; background: rgba(255,255,255,0.1); border-radius: 50%; animation: pulse 2s ease-in-out infinite;"></div>
-        <div style="display: flex; align-items: center; gap: 12px; position: relative; z-index: 2;">
-          <div style="width: 36px; height: 36px; background: rgba(255,255,255,0.25); border-radius: 10px; display: flex; align-items: center; justify-content: center; backdrop-filter: blur(10px); box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-              <polyline points="14 2 14 8 20 8"></polyline>
-            </svg>
-          </div>
-          <div>
-            <div style="color: white; font-size: 16px; font-weight: 800; letter-spacing: -0.3px; margin-bottom: 2px;">Seçilen Sipariş Detayları</div>
-            <div style="color: rgba(255,255,255,0.9); font-size: 11px; font-weight: 500;">Detayları görüntülemek için siparişe tıklayın</div>
-          </div>
-        </div>
-      </div>
-      
-      <!-- Card Content Area -->
-      <div id="selectedOrderInfo" style="font-size: 13px; padding: 0; min-height: 160px; position: relative;">
-        <div style="text-align: center; padding: 40px 20px; color: #94a3b8; background: linear-gradient(135deg, #f8fafc 0%, #ffffff 100%); border-radius: 16px;">
-          <div style="width: 60px; height: 60px; margin: 0 auto 20px; background: linear-gradient(135deg, rgba(102, 126, 234, 0.15) 0%, rgba(118, 75, 162, 0.15) 100%); border-radius: 16px; display: flex; align-items: center; justify-content: center;">
-            <svg width="28" height="28" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round" style="color: #667eea;">
-              <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-              <line x1="9" y1="9" x2="15" y2="9"></line>
-              <line x1="9" y1="15" x2="15" y2="15"></line>
-            </svg>
-          </div>
-          <div style="font-weight: 700; font-size: 16px; margin-bottom: 8px; color: #2d3748;">No Order Selected</div>
-          <div style="font-size: 13px; color: #64748b; line-height: 1.5;">Select an order to view details</div>
-        </div>
-      </div>
-    </div>
-    
-    <!-- Add enhanced animations -->
-    <style>
-      @keyframes pulse {
-        0%, 100% { transform: scale(1); opacity: 0.7; }
-        50% { transform: scale(1.1); opacity: 0.4; }
-      }
-      @keyframes float {
-        0%, 100% { transform: translateY(0px) rotate(0deg); }
-        50% { transform: translateY(-8px) rotate(1deg); }
-      }
-      #selectedOrderCard:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 12px 40px rgba(102, 126, 234, 0.2), 0 6px 20px rgba(0,0,0,0.15);
-        border-color: rgba(102, 126, 234, 0.3);
-      }
-    </style>
-    <button onclick="clearSelection()" style="width: 100%; margin-top: 14px; padding: 13px 20px; background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; border: none; border-radius: 12px; cursor: pointer; font-weight: 700; font-size: 13px; box-shadow: 0 4px 14px rgba(239, 68, 68, 0.35); transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1); display: flex; align-items: center; justify-content: center; gap: 8px;">
-      <svg width="17" height="17" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-        <polyline points="3 6 5 6 21 6"></polyline>
-        <path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"></path>
-      </svg>
-      <span>Clear Selection</span>
-    </button>
-  </div>
-</div>
-
-<div class="main-content">
-<div style="margin-bottom: 30px;">
-  <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-    <div>
-      <h1 style="font-size: 48px; margin-bottom: 8px; display: flex; align-items: center; gap: 15px; font-weight: 800; letter-spacing: -1px;">
-        TetraboX
-        <span class="header-badge">PRO</span>
-      </h1>
-      <p style="color: rgba(255,255,255,0.9); font-size: 18px; margin: 0; font-weight: 400; letter-spacing: 0.5px;" data-tr="AI Destekli 3D Konteyner Optimizasyon Platformu" data-en="AI-Powered 3D Container Optimization Platform">
-        AI Destekli 3D Konteyner Optimizasyon Platformu
-      </p>
-    </div>
-    
-    <!-- Language Switcher -->
-    <div style="display: flex; align-items: center; gap: 12px; background: rgba(255,255,255,0.1); backdrop-filter: blur(10px); padding: 8px 16px; border-radius: 25px; border: 1px solid rgba(255,255,255,0.2);">
-      <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="color: rgba(255,255,255,0.8);">
-        <circle cx="12" cy="12" r="10"></circle>
-        <path d="M2 12h20"></path>
-        <path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"></path>
-      </svg>
-      <span style="color: rgba(255,255,255,0.9); font-size: 14px; font-weight: 500;" data-tr="Dil" data-en="Language">Dil</span>
-      <div style="display: flex; background: rgba(255,255,255,0.1); border-radius: 20px; padding: 2px;">
-        <button id="lang-tr" onclick="switchToTurkish()" style="padding: 6px 12px; border: none; background: #667eea; color: white; border-radius: 18px; font-size: 12px; font-weight: 600; cursor: pointer; transition: all 0.3s ease;">
-          TR
-        </button>
-        <button id="lang-en" onclick="switchToEnglish()" style="padding: 6px 12px; border: none; background: transparent; color: rgba(255,255,255,0.7); border-radius: 18px; font-size: 12px; font-weight: 600; cursor: pointer; transition: all 0.3s ease;">
-          EN
-        </button>
-      </div>
-    </div>
-  </div>
-</div>
-
-<div class="premium-card" id="orderPackingControls" style="display: none; border: 2px solid #10b981;">
-	<div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 12px;">
-		<div>
-			<div style="font-size: 12px; color: #64748b; font-weight: 500; margin-bottom: 4px;" data-tr="SEÇİLEN SİPARİŞ" data-en="SELECTED ORDER">SEÇİLEN SİPARİŞ</div>
-			<div id="currentOrderId" style="color: #5a67d8; font-weight: 700; font-size: 20px;">-</div>
-		</div>
-		<button onclick="packSelectedOrder()" style="padding: 14px 28px; font-size: 15px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; border: none; border-radius: 12px; cursor: pointer; font-weight: 700; box-shadow: 0 4px 15px rgba(16, 185, 129, 0.3);" data-tr="Siparişi Paketle" data-en="Pack Order">
-			Siparişi Paketle
-		</button>
-	</div>
-</div>
-
-<div class="premium-card" id="quickStartGuide" style="background: linear-gradient(135deg, rgba(255,255,255,0.95) 0%, rgba(255,255,255,0.9) 100%); border: 2px solid rgba(255,255,255,0.5);">
-	<div style="display: flex; align-items: center; gap: 12px; margin-bottom: 20px;">
-		<div style="width: 52px; height: 52px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 14px; display: flex; align-items: center; justify-content: center; box-shadow: 0 6px 16px rgba(102, 126, 234, 0.35);">
-			<svg width="28" height="28" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-				<path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-				<polyline points="14 2 14 8 20 8"></polyline>
-				<line x1="16" y1="13" x2="8" y2="13"></line>
-				<line x1="16" y1="17" x2="8" y2="17"></line>
-				<polyline points="10 9 9 9 8 9"></polyline>
-			</svg>
-		</div>
-		<div>
-			<h3 style="margin: 0; font-size: 20px; color: #2d3748; font-weight: 700; letter-spacing: -0.5px;" data-tr="Hızlı Başlangıç Rehberi" data-en="Quick Start Guide">Hızlı Başlangıç Rehberi</h3>
-			<p style="margin: 0; font-size: 14px; color: #64748b; font-weight: 400;" data-tr="Paketleme optimizasyonunuz için bu adımları takip edin" data-en="Follow these steps to optimize your packing">Paketleme optimizasyonunuz için bu adımları takip edin</p>
-		</div>
-	</div>
-	<ol style="margin: 0; padding-left: 24px; color: #4a5568; line-height: 2; font-size: 14px;">
-		<li data-tr="Uygulama açıldığında siparişler otomatik olarak yüklenir" data-en="Orders are automatically loaded when you open the application">Uygulama açıldığında siparişler otomatik olarak yüklenir</li>
-		<li data-tr="ID veya müşteri adı ile siparişinizi arayın" data-en="Search for your order by ID or customer name">ID veya müşteri adı ile siparişinizi arayın</li>
-		<li data-tr="Detayları görüntülemek için herhangi bir siparişe tıklayın" data-en="Click on any order to select it and view details">Detayları görüntülemek için herhangi bir siparişe tıklayın</li>
-		<li data-tr="Optimizasyon algoritmasını çalıştırmak için <strong style='color: #2d3748;'>'Siparişi Paketle'</strong> tıklayın" data-en="Click <strong style='color: #2d3748;'>'Pack Order'</strong> to run the optimization algorithm">Optimizasyon algoritmasını çalıştırmak için <strong style="color: #2d3748;">"Siparişi Paketle"</strong> tıklayın</li>
-		<li data-tr="Sonuçları 3D, 2D veya ham JSON formatında görüntüleyin" data-en="View packing results in 3D, 2D, or raw JSON format">Sonuçları 3D, 2D veya ham JSON formatında görüntüleyin</li>
-	</ol>
-</div>
-
-<div id="resultsSection" style="display: none; margin-top: 30px;">
-  <h3 style="color: white; font-size: 28px; margin-bottom: 15px; font-weight: 700; letter-spacing: -0.5px;">Packing Results</h3>
-  
-  <div id="compactResult" class="premium-card" style="display: none;"></div>
-  
-  <div class="premium-card">
-    <div id="summary"></div>
-    
-    <div class="modal-tabs">
-      <button class="tab-button active" onclick="showTab('3d')" data-tr="3D Görünüm" data-en="3D View">3D Görünüm</button>
-      <button class="tab-button" onclick="showTab('2d')" data-tr="2D Görünümler" data-en="2D Views">2D Görünümler</button>
-      <button class="tab-button" onclick="showTab('json')" data-tr="Ham Veri" data-en="Raw Data">Ham Veri</button>
-    </div>
-    
-    <div id="tab-3d" class="tab-content active">
-      <div id="viz3d" style="width: 100%; min-height: 500px;"></div>
-    </div>
-    
-    <div id="tab-2d" class="tab-content">
-      <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 24px; padding: 30px 0;">
-        <div class="premium-card" style="margin: 0; border: 2px solid #10b981; background: linear-gradient(135deg, #ffffff 0%, #f0fdf4 100%);">
-          <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 16px;">
-            <div style="width: 40px; height: 40px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);">
-              <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-                <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-                <path d="M9 9h6v6H9z"></path>
-              </svg>
-            </div>
-            <div>
-              <h4 style="color: #059669; margin: 0; font-size: 16px; font-weight: 700; letter-spacing: -0.3px;" data-tr="Kuş Bakışı Görünüm" data-en="Bird's Eye View">Kuş Bakışı Görünüm</h4>
-              <p style="color: #6b7280; margin: 0; font-size: 12px; font-weight: 500;" data-tr="Yukarıdan bakış" data-en="Looking down from above">Yukarıdan bakış</p>
-            </div>
-          </div>
-          <canvas id="vizTop" width="320" height="320" style="border: 2px solid #10b981; border-radius: 12px; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.15);"></canvas>
-        </div>
-        <div class="premium-card" style="margin: 0; border: 2px solid #3b82f6; background: linear-gradient(135deg, #ffffff 0%, #eff6ff 100%);">
-          <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 16px;">
-            <div style="width: 40px; height: 40px; background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);">
-              <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-                <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-                <path d="M8 3v18"></path>
-                <path d="M16 3v18"></path>
-              </svg>
-            </div>
-            <div>
-              <h4 style="color: #1d4ed8; margin: 0; font-size: 16px; font-weight: 700; letter-spacing: -0.3px;" data-tr="Ön Görünüm" data-en="Front View">Ön Görünüm</h4>
-              <p style="color: #6b7280; margin: 0; font-size: 12px; font-weight: 500;" data-tr="Konteyner yüzüne bakış" data-en="Looking at the container face">Konteyner yüzüne bakış</p>
-            </div>
-          </div>
-          <canvas id="vizFront" width="320" height="320" style="border: 2px solid #3b82f6; border-radius: 12px; box-shadow: 0 4px 12px rgba(59, 130, 246, 0.15);"></canvas>
-        </div>
-        <div class="premium-card" style="margin: 0; border: 2px solid #8b5cf6; background: linear-gradient(135deg, #ffffff 0%, #faf5ff 100%);">
-          <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 16px;">
-            <div style="width: 40px; height: 40px; background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3);">
-              <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-                <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-                <path d="M3 8h18"></path>
-                <path d="M3 16h18"></path>
-              </svg>
-            </div>
-            <div>
-              <h4 style="color: #7c3aed; margin: 0; font-size: 16px; font-weight: 700; letter-spacing: -0.3px;" data-tr="Yan Görünüm" data-en="Side View">Yan Görünüm</h4>
-              <p style="color: #6b7280; margin: 0; font-size: 12px; font-weight: 500;" data-tr="Yandan bakış" data-en="Looking from the side">Yandan bakış</p>
-            </div>
-          </div>
-          <canvas id="vizSide" width="320" height="320" style="border: 2px solid #8b5cf6; border-radius: 12px; box-shadow: 0 4px 12px rgba(139, 92, 246, 0.15);"></canvas>
-        </div>
-      </div>
-    </div>
-    
-    <div id="tab-json" class="tab-content">
-      <pre id="log" style="max-height: 500px; overflow-y: auto;"></pre>
-    </div>
-  </div>
-</div>
-<script src="/static/localization.js"></script>
-<script>
-let allOrders = [];
-let selectedOrder = null;
-let sidebarCollapsed = false;
-let allSkus = [];
-let selectedItems = [];
-let nameCache = {};
-let currentTab = 'create';
-
-// Make allOrders globally accessible for localization
-window.allOrders = allOrders;
-
-// Toggle sidebar function
-function toggleSidebar() {
-  const sidebar = document.getElementById('sidebar');
-  const mainContent = document.querySelector('.main-content');
-  const toggleButton = document.getElementById('sidebarToggle');
-  
-  sidebarCollapsed = !sidebarCollapsed;
-  
-  if (sidebarCollapsed) {
-    sidebar.classList.add('collapsed');
-    mainContent.classList.add('expanded');
-    // Change icon to show sidebar is hidden (hamburger menu)
-    toggleButton.innerHTML = `
-      <svg width="22" height="22" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-        <line x1="3" y1="6" x2="21" y2="6"></line>
-        <line x1="3" y1="12" x2="21" y2="12"></line>
-        <line x1="3" y1="18" x2="21" y2="18"></line>
-      </svg>
-    `;
-    toggleButton.title = 'Show Order List';
-  } else {
-    sidebar.classList.remove('collapsed');
-    mainContent.classList.remove('expanded');
-    // Change icon to show sidebar is visible (X icon)
-    toggleButton.innerHTML = `
-      <svg width="22" height="22" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-        <line x1="18" y1="6" x2="6" y2="18"></line>
-        <line x1="6" y1="6" x2="18" y2="18"></line>
-      </svg>
-    `;
-    toggleButton.title = 'Hide Order List';
-  }
-  
-  // Ensure button stays visible
-  toggleButton.style.display = 'flex';
-  toggleButton.style.visibility = 'visible';
-}
-
-// Initialize localization when DOM is loaded
-document.addEventListener('DOMContentLoaded', function() {
-  console.log('DOM loaded, checking localization...');
-  console.log('localization object:', typeof localization);
-  if (typeof localization !== 'undefined') {
-    console.log('localization methods:', Object.keys(localization));
-  }
-  
-  // Immediately hide selected order card when DOM loads
-  const selectedOrderCard = document.getElementById('selectedOrderCard');
-  if (selectedOrderCard) {
-    console.log('Immediately hiding selectedOrderCard on DOM load');
-    selectedOrderCard.style.display = 'none';
-    selectedOrderCard.classList.add('hidden-in-create-tab');
-  }
-  
-  initializeLocalization();
-});
-
-// Initialize localization with retry logic
-function initializeLocalization() {
-  console.log('initializeLocalization called, localization type:', typeof localization);
-  if (typeof localization !== 'undefined') {
-    console.log('Localization is available, setting up...');
-    console.log('Available methods:', Object.keys(localization));
-    
-    // Set up the override for switchLanguage
-    const originalSwitchLanguage = localization.switchLanguage;
-    console.log('originalSwitchLanguage type:', typeof originalSwitchLanguage);
-    
-    if (typeof originalSwitchLanguage === 'function') {
-      localization.switchLanguage = function(lang) {
-        console.log('Override switchLanguage called with:', lang);
-        originalSwitchLanguage.call(localization, lang);
-        updateLanguageButtons();
-      };
-    } else {
-      console.error('switchLanguage is not a function:', originalSwitchLanguage);
-    }
-    
-    // Initialize and update UI
-    localization.initializeLanguage();
-    updateLanguageButtons();
-    console.log('Localization initialized successfully');
-  } else {
-    console.log('Localization not available, retrying in 100ms...');
-    // Retry after a short delay if localization is not yet loaded
-    setTimeout(initializeLocalization, 100);
-  }
-}
-
-// Update language button states
-function updateLanguageButtons() {
-  const currentLang = window.currentLanguage || 'tr'; // Use global variable
-  
-  const trBtn = document.getElementById('lang-tr');
-  const enBtn = document.getElementById('lang-en');
-  
-  if (trBtn && enBtn) {
-    if (currentLang === 'tr') {
-      trBtn.style.background = '#667eea';
-      trBtn.style.color = 'white';
-      enBtn.style.background = 'transparent';
-      enBtn.style.color = 'rgba(255,255,255,0.7)';
-    } else {
-      trBtn.style.background = 'transparent';
-      trBtn.style.color = 'rgba(255,255,255,0.7)';
-      enBtn.style.background = '#667eea';
-      enBtn.style.color = 'white';
-    }
-  }
-}
-
-
-// Safe wrapper functions for language switching
-function switchToTurkish() {
-  if (typeof localization !== 'undefined' && typeof localization.switchLanguage === 'function') {
-    localization.switchLanguage('tr');
-    updateLanguageButtons();
-  } else {
-    // Fallback: try to call the function directly if it exists globally
-    if (typeof switchLanguage === 'function') {
-      switchLanguage('tr');
-      updateLanguageButtons();
-    }
-  }
-}
-
-function switchToEnglish() {
-  if (typeof localization !== 'undefined' && typeof localization.switchLanguage === 'function') {
-    localization.switchLanguage('en');
-    updateLanguageButtons();
-  } else {
-    // Fallback: try to call the function directly if it exists globally
-    if (typeof switchLanguage === 'function') {
-      switchLanguage('en');
-      updateLanguageButtons();
-    }
-  }
-}
-
-// Load orders from API
-// Order management functions
-async function loadAllOrders(){
-  const orderListEl = document.getElementById('orderList');
-  
-  // Show loading state
-  orderListEl.innerHTML = '<div style="padding: 20px; text-align: center; color: #666;"><div style="display: inline-block; width: 20px; height: 20px; border: 3px solid #f3f3f3; border-top: 3px solid #007bff; border-radius: 50%; animation: spin 1s linear infinite;"></div><br><br>Loading Orders...</div><style>@keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }</style>';
-  
-  try {
-    console.log('Fetching orders from /orders');
-    const res = await fetch('/orders?limit=100');
-    console.log('Response status:', res.status);
-    
-    if(!res.ok) {
-      const errorText = await res.text();
-      console.error('Server error:', errorText);
-      throw new Error('HTTP ' + res.status + ': ' + errorText);
-    }
-    
-    const data = await res.json();
-    allOrders = data.orders || [];
-    window.allOrders = allOrders; // Update global reference
-    console.log('Loaded orders:', allOrders.length);
-    
-    if(!allOrders || allOrders.length === 0) {
-      orderListEl.innerHTML = '<div style="padding: 20px; text-align: center; color: #f39c12;">⚠️ No orders found in database</div>';
-      return;
-    }
-    
-    renderOrderList(allOrders);
-    console.log('Orders loaded successfully');
-  } catch(e) {
-    console.error('Error loading orders:', e);
-    orderListEl.innerHTML = '<div style="padding: 20px; color: red; text-align: center;"><strong>❌ Error loading orders</strong><br><small>' + e.message + '</small><br><br><button onclick="loadAllOrders()" style="padding: 8px 16px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer;">🔄 Retry</button></div>';
-  }
-}
-
-function renderOrderList(orders){
-  const el = document.getElementById('orderList');
-  if(!orders || orders.length === 0) {
-    el.innerHTML = `
-      <div style="padding: 60px 20px; text-align: center; color: #64748b;">
-        <div style="width: 64px; height: 64px; margin: 0 auto 20px; background: linear-gradient(135deg, rgba(239, 68, 68, 0.15) 0%, rgba(220, 38, 38, 0.15) 100%); border-radius: 20px; display: flex; align-items: center; justify-content: center;">
-          <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="color: #ef4444;">
-            <circle cx="12" cy="12" r="10"></circle>
-            <line x1="15" y1="9" x2="9" y2="15"></line>
-            <line x1="9" y1="9" x2="15" y2="15"></line>
-          </svg>
-        </div>
-        <div style="font-weight: 700; margin-bottom: 8px; font-size: 16px; color: #2d3748;" data-tr="Sipariş Bulunamadı" data-en="No Orders Found">Sipariş Bulunamadı</div>
-        <div style="font-size: 13px; font-weight: 500; color: #94a3b8;" data-tr="Aramanızı ayarlamayı deneyin" data-en="Try adjusting your search">Aramanızı ayarlamayı deneyin</div>
-      </div>
-    `;
-    document.getElementById('orderStats').style.display = 'none';
-    return;
-  }
-  
-  // Update statistics
-  document.getElementById('orderStats').style.display = 'block';
-  document.getElementById('totalOrders').textContent = orders.length;
-  
-  const header = `
-    <div style="padding: 16px 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; display: flex; align-items: center; justify-content: space-between; box-shadow: 0 4px 14px rgba(102, 126, 234, 0.3);">
-      <div style="display: flex; align-items: center; gap: 10px;">
-        <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-          <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-        </svg>
-        <span style="font-weight: 700; font-size: 13px; letter-spacing: 0.5px;" data-tr="SİPARİŞ LİSTESİ" data-en="ORDER LIST">SİPARİŞ LİSTESİ</span>
-      </div>
-      <span style="background: rgba(255,255,255,0.25); padding: 5px 12px; border-radius: 14px; font-size: 13px; font-weight: 800; backdrop-filter: blur(10px); box-shadow: 0 2px 8px rgba(0,0,0,0.1);">${orders.length}</span>
-    </div>
-  `;
-  
-  const orderItems = orders.slice(0, 50).map(order => {
-    const orderDate = new Date(order.order_date).toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
-    return `
-      <div class="sku-item" onclick="selectOrder('${order.order_id}')" style="cursor: pointer;">
-        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 8px;">
-          <div>
-            <div class="sku-code" style="font-size: 14px; margin-bottom: 4px; display: flex; align-items: center; gap: 6px;">
-              <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round" style="opacity: 0.6;">
-                <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-                <polyline points="14 2 14 8 20 8"></polyline>
-              </svg>
-              ${order.order_id}
-            </div>
-          </div>
-        </div>
-        <div class="sku-name" style="font-size: 13px; font-weight: 600; color: #2d3748; margin-bottom: 8px;">👤 ${order.customer_name}</div>
-        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 6px; font-size: 11px; color: #64748b; font-weight: 600;">
-          <div style="display: flex; align-items: center; gap: 4px;">
-            <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round" style="color: #667eea;">
-              <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-            </svg>
-            <span data-tr="${order.total_items} ürün" data-en="${order.total_items} items">${window.currentLanguage === 'en' ? order.total_items + ' items' : order.total_items + ' ürün'}</span>
-          </div>
-          <div style="display: flex; align-items: center; gap: 4px; justify-self: end;">
-            <span style="color: #10b981; font-weight: 700;">${order.total_price_try}₺</span>
-          </div>
-        </div>
-        <div style="margin-top: 8px; padding-top: 8px; border-top: 1px solid rgba(226, 232, 240, 0.5); font-size: 10px; color: #94a3b8; font-weight: 600; display: flex; align-items: center; gap: 4px;">
-          <svg width="11" height="11" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <rect x="3" y="4" width="18" height="18" rx="2" ry="2"></rect>
-            <line x1="16" y1="2" x2="16" y2="6"></line>
-            <line x1="8" y1="2" x2="8" y2="6"></line>
-            <line x1="3" y1="10" x2="21" y2="10"></line>
-          </svg>
-          <span>${orderDate}</span>
-        </div>
-      </div>
-    `;
-  }).join('');
-  
-  const footer = orders.length > 50 ? `
-    <div style="padding: 16px 20px; text-align: center; background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); border-top: 2px solid #e2e8f0;">
-      <div style="font-size: 12px; font-weight: 700; color: #64748b; margin-bottom: 4px;">Showing first 50 orders</div>
-      <div style="font-size: 11px; font-weight: 500; color: #94a3b8;">Total available: ${orders.length} orders</div>
-    </div>
-  ` : '';
-  
-  el.innerHTML = header + orderItems + footer;
-}
-
-
-function selectOrder(orderId) {
-  selectedOrder = allOrders.find(order => order.order_id === orderId);
-  if(!selectedOrder) {
-    console.error('Order not found:', orderId);
-    return;
-  }
-  
-  console.log('Selected order:', selectedOrder);
-  
-  // Update UI
-  document.getElementById('currentOrderId').textContent = selectedOrder.order_id;
-  
-  // Only show selected order section if we're on the existing orders tab
-  if (currentTab === 'existing') {
-    document.getElementById('orderPackingControls').style.display = 'block';
-    document.getElementById('orderPackingControls').classList.remove('hidden-in-create-tab');
-    
-    // Also show the selected order card
-    const selectedOrderCard = document.getElementById('selectedOrderCard');
-    if (selectedOrderCard) {
-      selectedOrderCard.style.display = 'block';
-      selectedOrderCard.classList.remove('hidden-in-create-tab');
-    }
-  }
-  
-  // Update selected order info
-  updateSelectedOrderInfo();
-}
-
-function updateSelectedOrderInfo() {
-  const el = document.getElementById('selectedOrderInfo');
-  const cardEl = document.getElementById('selectedOrderCard');
-  
-  if(!selectedOrder) {
-    // Show clean empty state
-    el.innerHTML = `
-      <div style="text-align: center; padding: 40px 20px; color: #94a3b8; background: linear-gradient(135deg, #f8fafc 0%, #ffffff 100%); border-radius: 16px;">
-        <div style="width: 60px; height: 60px; margin: 0 auto 20px; background: linear-gradient(135deg, rgba(102, 126, 234, 0.15) 0%, rgba(118, 75, 162, 0.15) 100%); border-radius: 16px; display: flex; align-items: center; justify-content: center;">
-          <svg width="28" height="28" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round" style="color: #667eea;">
-            <rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect>
-            <line x1="9" y1="9" x2="15" y2="9"></line>
-            <line x1="9" y1="15" x2="15" y2="15"></line>
-          </svg>
-        </div>
-        <div style="font-weight: 700; font-size: 16px; margin-bottom: 8px; color: #2d3748;">No Order Selected</div>
-        <div style="font-size: 13px; color: #64748b; line-height: 1.5;">Select an order to view details</div>
-      </div>
-    `;
-    
-    // Update card header to show empty state
-    const headerEl = document.getElementById('selectedOrderCardHeader');
-    if(headerEl) {
-      headerEl.innerHTML = `
-        <div style="position: absolute; top: -10px; right: -10px; width: 60px; height: 60px; background: rgba(255,255,255,0.1); border-radius: 50%; animation: pulse 2s ease-in-out infinite;"></div>
-        <div style="display: flex; align-items: center; gap: 12px; position: relative; z-index: 2;">
-          <div style="width: 36px; height: 36px; background: rgba(255,255,255,0.25); border-radius: 10px; display: flex; align-items: center; justify-content: center; backdrop-filter: blur(10px); box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-              <polyline points="14 2 14 8 20 8"></polyline>
-            </svg>
-          </div>
-          <div>
-            <div style="color: white; font-size: 16px; font-weight: 800; letter-spacing: -0.3px; margin-bottom: 2px;">Seçilen Sipariş Detayları</div>
-            <div style="color: rgba(255,255,255,0.9); font-size: 11px; font-weight: 500;">Detayları görüntülemek için siparişe tıklayın</div>
-          </div>
-        </div>
-      `;
-    }
-    return;
-  }
-  
-  // Update card header to show selected order
-  const headerEl = document.getElementById('selectedOrderCardHeader');
-  if(headerEl) {
-    headerEl.innerHTML = `
-      <div style="position: absolute; top: -10px; right: -10px; width: 60px; height: 60px; background: rgba(255,255,255,0.1); border-radius: 50%; animation: pulse 2s ease-in-out infinite;"></div>
-      <div style="display: flex; align-items: center; justify-content: space-between; position: relative; z-index: 2;">
-        <div style="display: flex; align-items: center; gap: 12px;">
-          <div style="width: 36px; height: 36px; background: rgba(255,255,255,0.25); border-radius: 10px; display: flex; align-items: center; justify-content: center; backdrop-filter: blur(10px); box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-            <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-              <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
-              <polyline points="14 2 14 8 20 8"></polyline>
-            </svg>
-          </div>
-          <div>
-            <div style="color: white; font-size: 16px; font-weight: 800; letter-spacing: -0.3px; margin-bottom: 2px;">📋 ${selectedOrder.order_id}</div>
-            <div style="color: rgba(255,255,255,0.9); font-size: 11px; font-weight: 500;">${selectedOrder.customer_name}</div>
-          </div>
-        </div>
-      </div>
-    `;
-  }
-  
-  const orderDate = new Date(selectedOrder.order_date).toLocaleDateString('en-GB', { day: '2-digit', month: '2-digit', year: 'numeric' });
-  
-  el.innerHTML = `
-    <!-- Essential Stats Bar -->
-    <div style="background: linear-gradient(135deg, rgba(102, 126, 234, 0.05) 0%, rgba(118, 75, 162, 0.05) 100%); padding: 16px 20px; border-bottom: 2px solid #e2e8f0;">
-      <div style="display: flex; justify-content: space-between; align-items: center; background: white; padding: 12px 16px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.05);">
-        <div style="text-align: center;">
-          <div style="color: #1e293b; font-size: 20px; font-weight: 800;">${selectedOrder.total_items}</div>
-          <div style="color: #64748b; font-size: 10px; font-weight: 600; text-transform: uppercase;" data-tr="ÜRÜNLER" data-en="Items">ÜRÜNLER</div>
-        </div>
-        <div style="width: 1px; height: 30px; background: #e2e8f0;"></div>
-        <div style="text-align: center;">
-          <div style="color: #059669; font-size: 20px; font-weight: 800;">${selectedOrder.total_price_try}₺</div>
-          <div style="color: #64748b; font-size: 10px; font-weight: 600; text-transform: uppercase;" data-tr="TOPLAM" data-en="Total">TOPLAM</div>
-        </div>
-        <div style="width: 1px; height: 30px; background: #e2e8f0;"></div>
-        <div style="text-align: center;">
-          <div style="color: #1e293b; font-size: 14px; font-weight: 700;">${orderDate}</div>
-          <div style="color: #64748b; font-size: 10px; font-weight: 600; text-transform: uppercase;" data-tr="TARİH" data-en="Date">TARİH</div>
-        </div>
-      </div>
-    </div>
-    
-    <!-- Simple Product List -->
-    <div style="background: white; padding: 16px; border-radius: 0 0 16px 16px;">
-      <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 12px;">
-        <div style="width: 24px; height: 24px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 6px; display: flex; align-items: center; justify-content: center;">
-          <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-          </svg>
-        </div>
-        <div style="font-size: 14px; font-weight: 700; color: #1e293b;" data-tr="Ürünler (${selectedOrder.items.length})" data-en="Products (${selectedOrder.items.length})">Ürünler (${selectedOrder.items.length})</div>
-      </div>
-      
-      <!-- Clean Product List -->
-      <div style="max-height: 200px; overflow-y: auto; padding: 4px;">
-        ${selectedOrder.items.map((item, index) => {
-          const colors = ['#667eea', '#764ba2', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6'];
-          const colorIndex = item.sku.charCodeAt(0) % colors.length;
-          const productColor = colors[colorIndex];
-          
-          return `
-            <div style="display: flex; justify-content: space-between; align-items: center; padding: 10px 12px; margin: 4px 0; background: #f8fafc; border-radius: 8px; border-left: 3px solid ${productColor}; transition: all 0.2s ease;">
-              <div style="display: flex; align-items: center; gap: 10px;">
-                <div style="width: 8px; height: 8px; background: ${productColor}; border-radius: 50%;"></div>
-                <span style="font-size: 13px; font-weight: 600; color: #1e293b;">${item.sku}</span>
-              </div>
-              <span style="background: ${productColor}; color: white; padding: 4px 8px; border-radius: 12px; font-size: 11px; font-weight: 700; min-width: 30px; text-align: center;">${item.quantity}</span>
-            </div>
-          `;
-        }).join('')}
-      </div>
-    </div>
-  `;
-}
-
-function filterOrders(){
-  const query = document.getElementById('orderSearch').value.toLowerCase().trim();
-  if(!query) {
-    renderOrderList(allOrders);
-    return;
-  }
-  
-  const filtered = allOrders.filter(order => {
-    return order.order_id.toLowerCase().includes(query) || 
-           order.customer_name.toLowerCase().includes(query) ||
-           order.customer_email.toLowerCase().includes(query);
-  });
-  
-  renderOrderList(filtered);
-}
-
-function clearSelection() {
-  selectedOrder = null;
-  document.getElementById('orderPackingControls').style.display = 'none';
-  document.getElementById('currentOrderId').textContent = '-';
-  updateSelectedOrderInfo();
-  
-  // Clear any existing results
-  document.getElementById('resultsSection').style.display = 'none';
-  document.getElementById('compactResult').style.display = 'none';
-}
-
-async function packSelectedOrder() {
-  if(!selectedOrder) {
-    alert('Please select an order first');
-    return;
-  }
-  
-  console.log('Packing order:', selectedOrder.order_id);
-  
-  // Ensure toggle button stays visible during packing
-  const toggleButton = document.getElementById('sidebarToggle');
-  if (toggleButton) {
-    toggleButton.style.display = 'flex';
-    toggleButton.style.visibility = 'visible';
-    toggleButton.style.zIndex = '1001';
-  }
-  
-  // Show the results section immediately to ensure loading spinner is visible
-  const resultsSection = document.getElementById('resultsSection');
-  if (resultsSection) {
-    resultsSection.style.display = 'block';
-  }
-  
-  // Hide previous results and show loading state
-  const compactEl = document.getElementById('compactResult');
-  const summaryEl = document.getElementById('summary');
-  const logEl = document.getElementById('log');
-  
-  // Hide all previous results completely
-  if (summaryEl) {
-    summaryEl.innerHTML = '';
-    summaryEl.style.display = 'none';
-  }
-  if (logEl) {
-    logEl.textContent = '';
-    logEl.style.display = 'none';
-  }
-  
-  // Clear and show compact result with loading spinner
-  compactEl.innerHTML = '';
-  compactEl.style.display = 'block';
-  compactEl.innerHTML = `
-    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 20px; padding: 40px; text-align: center; box-shadow: 0 20px 60px rgba(102, 126, 234, 0.4); position: relative; overflow: hidden; min-width: 400px; max-width: 500px; margin: 20px auto;">
-      <!-- Subtle animated background -->
-      <div style="position: absolute; top: -20%; left: -20%; width: 140%; height: 140%; background: radial-gradient(circle, rgba(255,255,255,0.05) 1px, transparent 1px); background-size: 30px 30px; animation: slowFloat 8s ease-in-out infinite;"></div>
-      
-      <!-- Premium loading spinner -->
-      <div style="position: relative; z-index: 2;">
-        <div style="width: 80px; height: 80px; margin: 0 auto 24px; position: relative;">
-          <!-- Outer rotating ring -->
-          <div style="position: absolute; top: 0; left: 0; width: 80px; height: 80px; border: 4px solid rgba(255,255,255,0.2); border-radius: 50%; border-top: 4px solid #ffffff; animation: spin 1.2s linear infinite;"></div>
-          <!-- Inner pulsing ring -->
-          <div style="position: absolute; top: 12px; left: 12px; width: 56px; height: 56px; border: 3px solid rgba(255,255,255,0.3); border-radius: 50%; border-right: 3px solid #ffffff; animation: spin 0.8s linear infinite reverse;"></div>
-          <!-- Center pulsing dot -->
-          <div style="position: absolute; top: 50%; left: 50%; width: 12px; height: 12px; background: #ffffff; border-radius: 50%; transform: translate(-50%, -50%); animation: pulse 1.5s ease-in-out infinite;"></div>
-        </div>
-        
-        <!-- Loading text with gradient -->
-        <div style="color: white; font-size: 24px; font-weight: 700; margin-bottom: 8px; background: linear-gradient(135deg, #ffffff 0%, #e0e7ff 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">
-          Packing Order
-        </div>
-        <div style="color: rgba(255,255,255,0.9); font-size: 18px; font-weight: 600; margin-bottom: 16px;">
-          ${selectedOrder.order_id}
-        </div>
-        
-        <!-- Progress dots -->
-        <div style="display: flex; justify-content: center; gap: 8px; margin-top: 20px;">
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.2s;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.4s;"></div>
-        </div>
-        
-        <!-- Status text -->
-        <div style="color: rgba(255,255,255,0.8); font-size: 14px; font-weight: 500; margin-top: 16px; opacity: 0.9;">
-          Optimizing container selection...
-        </div>
-      </div>
-    </div>
-    
-    <style>
-      @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-      }
-      
-      @keyframes pulse {
-        0%, 100% { transform: translate(-50%, -50%) scale(1); opacity: 1; }
-        50% { transform: translate(-50%, -50%) scale(1.2); opacity: 0.7; }
-      }
-      
-      @keyframes bounce {
-        0%, 80%, 100% { transform: scale(0.8); opacity: 0.5; }
-        40% { transform: scale(1.2); opacity: 1; }
-      }
-      
-      @keyframes slowFloat {
-        0%, 100% { transform: translate(0, 0) rotate(0deg); }
-        50% { transform: translate(-5px, -5px) rotate(90deg); }
-      }
-    </style>
-  `;
-  
-  try {
-    // Convert order to pack request format
-    const packRequest = {
-      order_id: selectedOrder.order_id,
-      items: selectedOrder.items.map(item => ({
-        sku: item.sku,
-        quantity: item.quantity
-      }))
-    };
-    
-    const res = await fetch('/pack/order', { 
-      method:'POST', 
-      headers:{'Content-Type':'application/json'}, 
-      body: JSON.stringify(packRequest)
-    });
-    
-    if (!res.ok) {
-      const errorText = await res.text();
-      console.error('Pack order failed:', errorText);
-      throw new Error(`HTTP ${res.status}: ${errorText}`);
-    }
-    
-    const j = await res.json();
-    
-    // Store result globally
-    window.packingResult = j;
-    
-    // Show results section
-    document.getElementById('resultsSection').style.display = 'block';
-    
-    // Show compact result
-    showCompactResult(j);
-    
-    // Render all views inline
-    renderSummary(j);
-    render3D(j);
-    render2DViews(j);
-    document.getElementById('log').textContent = JSON.stringify(j, null, 2);
-    
-    // Scroll to results
-    setTimeout(() => {
-      document.getElementById('resultsSection').scrollIntoView({ behavior: 'smooth', block: 'start' });
-    }, 100);
-    
-  } catch(error) {
-    document.getElementById('resultsSection').style.display = 'block';
-    compactEl.innerHTML = '<div style="color: #dc3545; padding: 20px; text-align: center;"><strong>❌ Error:</strong> ' + error.message + '</div>';
-  }
-}
-
-// Pagination variables
-let currentPage = 1;
-let productsPerPage = 30; // 3 columns x 10 rows for compact layout
-
-async function loadAllSkus(){
-  const skuListEl = document.getElementById('skuList');
-  
-  // Show loading state
-  skuListEl.innerHTML = '<div style="padding: 60px 20px; text-align: center; color: #64748b;"><div style="width: 64px; height: 64px; margin: 0 auto 24px; background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(5, 150, 105, 0.15) 100%); border-radius: 20px; display: flex; align-items: center; justify-content: center; box-shadow: 0 8px 20px rgba(16, 185, 129, 0.15);"><div style="display: inline-block; width: 32px; height: 32px; border: 3px solid #f3f3f3; border-top: 3px solid #10b981; border-radius: 50%; animation: spin 1s linear infinite;"></div></div><div style="font-weight: 700; margin-bottom: 8px; font-size: 16px; color: #2d3748;" data-tr="Ürünler Yükleniyor" data-en="Loading Products">Ürünler Yükleniyor</div><div style="font-size: 13px; font-weight: 500; color: #94a3b8; line-height: 1.6;" data-tr="Tüm ürünler hazırlanıyor..." data-en="Preparing all products...">Tüm ürünler hazırlanıyor...</div></div><style>@keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }</style>';
-  
-  try {
-    console.log('Fetching all SKUs from /skus?limit=2000');
-    const res = await fetch('/skus?limit=2000');
-    console.log('Response status:', res.status);
-    
-    if(!res.ok) {
-      const errorText = await res.text();
-      console.error('Server error:', errorText);
-      throw new Error('HTTP ' + res.status + ': ' + errorText);
-    }
-    
-    allSkus = await res.json();
-    console.log('Loaded SKUs:', allSkus.length);
-    console.log('First few SKUs:', allSkus.slice(0, 3));
-    
-    if(!allSkus || allSkus.length === 0) {
-      skuListEl.innerHTML = '<div style="padding: 20px; text-align: center; color: #f39c12;">⚠️ No SKUs found in database</div>';
-      return;
-    }
-    
-    // Cache names
-    allSkus.forEach(sku => {
-      nameCache[sku.sku] = (sku.brand||'') + ' ' + (sku.model||'') + (sku.variant?(' ' + sku.variant):'');
-    });
-    
-    currentPage = 1; // Reset to first page
-    renderSkuGrid(allSkus);
-    console.log('SKUs loaded successfully');
-  } catch(e) {
-    console.error('Error loading SKUs:', e);
-    skuListEl.innerHTML = '<div style="padding: 20px; color: red; text-align: center;"><strong>❌ Error loading SKUs</strong><br><small>' + e.message + '</small><br><br><button onclick="loadAllSkus()" style="padding: 8px 16px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer;">🔄 Retry</button></div>';
-  }
-}
-
-function renderSkuGrid(skus){
-  const el = document.getElementById('skuList');
-  if(!skus || skus.length === 0) {
-    el.innerHTML = `
-      <div style="padding: 60px 20px; text-align: center; color: #64748b;">
-        <div style="width: 64px; height: 64px; margin: 0 auto 24px; background: linear-gradient(135deg, rgba(239, 68, 68, 0.15) 0%, rgba(220, 38, 38, 0.15) 100%); border-radius: 20px; display: flex; align-items: center; justify-content: center;">
-          <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="color: #ef4444;">
-            <circle cx="12" cy="12" r="10"></circle>
-            <line x1="15" y1="9" x2="9" y2="15"></line>
-            <line x1="9" y1="9" x2="15" y2="15"></line>
-          </svg>
-        </div>
-        <div style="font-weight: 700; margin-bottom: 8px; font-size: 16px; color: #2d3748;" data-tr="Ürün Bulunamadı" data-en="No Products Found">Ürün Bulunamadı</div>
-        <div style="font-size: 13px; font-weight: 500; color: #94a3b8;" data-tr="Aramanızı ayarlamayı deneyin" data-en="Try adjusting your search">Aramanızı ayarlamayı deneyin</div>
-      </div>
-    `;
-    return;
-  }
-  
-  const totalPages = Math.ceil(skus.length / productsPerPage);
-  const startIndex = (currentPage - 1) * productsPerPage;
-  const endIndex = startIndex + productsPerPage;
-  const currentSkus = skus.slice(startIndex, endIndex);
-  
-  const header = `
-    <div style="padding: 12px 16px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; display: flex; align-items: center; justify-content: space-between; box-shadow: 0 2px 8px rgba(16, 185, 129, 0.2);">
-      <div style="display: flex; align-items: center; gap: 8px;">
-        <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-          <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-        </svg>
-        <span style="font-weight: 700; font-size: 12px; letter-spacing: 0.3px;" data-tr="ÜRÜN LİSTESİ" data-en="PRODUCT LIST">PRODUCT LIST</span>
-      </div>
-      <span style="background: rgba(255,255,255,0.25); padding: 4px 10px; border-radius: 12px; font-size: 11px; font-weight: 700; backdrop-filter: blur(10px);">${skus.length}</span>
-    </div>
-  `;
-  
-  const gridContainer = `
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(160px, 1fr)); gap: 8px; padding: 12px; background: #f8fafc; min-height: 400px; max-width: 100%;">
-  `;
-  
-  const skuCards = currentSkus.map(sku => {
-    const name = (sku.brand||'') + ' ' + (sku.model||'') + (sku.variant?(' ' + sku.variant):'');
-    const isSelected = selectedItems.some(item => item.sku === sku.sku);
-    
-    return `
-      <div class="product-card" onclick="addItemBySku('${sku.sku}')" style="
-        background: white; 
-        border-radius: 6px; 
-        padding: 8px; 
-        cursor: pointer; 
-        transition: all 0.2s ease;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        border: 1px solid ${isSelected ? '#10b981' : '#e5e7eb'};
-        position: relative;
-        height: 85px;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-      " onmouseover="this.style.transform='translateY(-1px)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.15)'; this.style.borderColor='#10b981'" onmouseout="this.style.transform='translateY(0px)'; this.style.boxShadow='0 1px 3px rgba(0,0,0,0.1)'; this.style.borderColor='${isSelected ? '#10b981' : '#e5e7eb'}'">
-        
-        ${isSelected ? '<div style="position: absolute; top: 4px; right: 4px; background: #10b981; color: white; width: 14px; height: 14px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 9px; font-weight: 700;">✓</div>' : ''}
-        
-        <div style="flex: 1; display: flex; flex-direction: column; justify-content: space-between;">
-          <div>
-            <div style="font-size: 10px; font-weight: 600; color: #10b981; text-transform: uppercase; letter-spacing: 0.2px; margin-bottom: 2px;">${sku.sku}</div>
-            <div style="font-size: 11px; font-weight: 600; color: #1f2937; line-height: 1.2; word-break: break-word; margin-bottom: 3px; overflow: hidden; text-overflow: ellipsis; display: -webkit-box; -webkit-line-clamp: 2; -webkit-box-orient: vertical;">${name}</div>
-            <div style="font-size: 9px; color: #6b7280; font-weight: 500;">${sku.brand || 'Unknown'}</div>
-          </div>
-          
-          <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 6px;">
-            <div style="font-size: 8px; color: #9ca3af; text-transform: uppercase; letter-spacing: 0.3px;">${(sku.category || 'Unknown').substring(0, 8)}</div>
-            <div style="font-size: 9px; color: #10b981; font-weight: 600;" data-tr="Ekle" data-en="Add">+</div>
-          </div>
-        </div>
-      </div>
-    `;
-  }).join('');
-  
-  const gridEnd = `</div>`;
-  
-  const pagination = totalPages > 1 ? `
-    <div style="padding: 12px 16px; background: white; border-top: 1px solid #e5e7eb; display: flex; align-items: center; justify-content: space-between;">
-      <div style="font-size: 11px; color: #6b7280; font-weight: 500;">
-        <span data-tr="Sayfa" data-en="Page">Page</span> ${currentPage}/${totalPages} • ${startIndex + 1}-${Math.min(endIndex, skus.length)} of ${skus.length} products
-      </div>
-      <div style="display: flex; gap: 6px;">
-        <button onclick="changePage(${currentPage - 1})" ${currentPage === 1 ? 'disabled' : ''} style="
-          padding: 6px 10px; 
-          border: 1px solid #d1d5db; 
-          background: ${currentPage === 1 ? '#f9fafb' : 'white'}; 
-          color: ${currentPage === 1 ? '#9ca3af' : '#374151'}; 
-          border-radius: 6px; 
-          cursor: ${currentPage === 1 ? 'not-allowed' : 'pointer'}; 
-          font-size: 11px; 
-          font-weight: 600;
-          transition: all 0.2s ease;
-        " onmouseover="if(${currentPage !== 1}) this.style.backgroundColor='#f3f4f6'" onmouseout="if(${currentPage !== 1}) this.style.backgroundColor='white'">
-          ←
-        </button>
-        <button onclick="changePage(${currentPage + 1})" ${currentPage === totalPages ? 'disabled' : ''} style="
-          padding: 6px 10px; 
-          border: 1px solid #d1d5db; 
-          background: ${currentPage === totalPages ? '#f9fafb' : 'white'}; 
-          color: ${currentPage === totalPages ? '#9ca3af' : '#374151'}; 
-          border-radius: 6px; 
-          cursor: ${currentPage === totalPages ? 'not-allowed' : 'pointer'}; 
-          font-size: 11px; 
-          font-weight: 600;
-          transition: all 0.2s ease;
-        " onmouseover="if(${currentPage !== totalPages}) this.style.backgroundColor='#f3f4f6'" onmouseout="if(${currentPage !== totalPages}) this.style.backgroundColor='white'">
-          →
-        </button>
-      </div>
-    </div>
-  ` : '';
-  
-  el.innerHTML = header + gridContainer + skuCards + gridEnd + pagination;
-}
-
-function getCategoryIcon(category) {
-  const icons = {
-    'Electronics': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="3" width="20" height="14" rx="2" ry="2"></rect><line x1="8" y1="21" x2="16" y2="21"></line><line x1="12" y1="17" x2="12" y2="21"></line></svg>',
-    'Home & Kitchen': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M3 9l9-7 9 7v11a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2z"></path><polyline points="9,22 9,12 15,12 15,22"></polyline></svg>',
-    'Sports & Fitness': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M6.5 6.5h11v11h-11z"></path><path d="M6.5 6.5L12 12l5.5-5.5"></path><path d="M6.5 17.5L12 12l5.5 5.5"></path></svg>',
-    'Beauty & Personal Care': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="3"></circle><path d="M12 1v6m0 6v6m11-7h-6m-6 0H1"></path></svg>',
-    'Books & Media': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M4 19.5A2.5 2.5 0 0 1 6.5 17H20"></path><path d="M6.5 2H20v20H6.5A2.5 2.5 0 0 1 4 19.5v-15A2.5 2.5 0 0 1 6.5 2z"></path></svg>',
-    'Garden & Outdoor': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M12 2L2 7l10 5 10-5-10-5z"></path><path d="M2 17l10 5 10-5"></path><path d="M2 12l10 5 10-5"></path></svg>',
-    'Shoes': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path></svg>',
-    'Textile': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path></svg>',
-    'Phone': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="5" y="2" width="14" height="20" rx="2" ry="2"></rect><line x1="12" y1="18" x2="12.01" y2="18"></line></svg>',
-    'Laptop': '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="3" width="20" height="14" rx="2" ry="2"></rect><line x1="8" y1="21" x2="16" y2="21"></line><line x1="12" y1="17" x2="12" y2="21"></line></svg>'
-  };
-  return icons[category] || icons['Electronics'];
-}
-
-function changePage(page) {
-  if (page < 1) return;
-  
-  // Get current filtered results
-  const query = document.getElementById('skuSearch').value.toLowerCase().trim();
-  let currentSkus = allSkus;
-  
-  if (query) {
-    currentSkus = allSkus.filter(sku => {
-      const name = ((sku.brand||'') + ' ' + (sku.model||'') + ' ' + (sku.variant||'')).toLowerCase();
-      return sku.sku.toLowerCase().includes(query) || name.includes(query) || (sku.category || '').toLowerCase().includes(query);
-    });
-  }
-  
-  const totalPages = Math.ceil(currentSkus.length / productsPerPage);
-  if (page > totalPages) return;
-  
-  currentPage = page;
-  renderSkuGrid(currentSkus);
-}
-
-function filterSkus(){
-  const query = document.getElementById('skuSearch').value.toLowerCase().trim();
-  if(!query) {
-    currentPage = 1; // Reset to first page when clearing search
-    renderSkuGrid(allSkus);
-    return;
-  }
-  
-  const filtered = allSkus.filter(sku => {
-    const name = ((sku.brand||'') + ' ' + (sku.model||'') + ' ' + (sku.variant||'')).toLowerCase();
-    return sku.sku.toLowerCase().includes(query) || name.includes(query) || (sku.category || '').toLowerCase().includes(query);
-  });
-  
-  currentPage = 1; // Reset to first page when filtering
-  renderSkuGrid(filtered);
-}
-
-async function addItemBySku(sku, quantity = 1){
-  // Get product name if not cached
-  if(!nameCache[sku]){
-    try{
-      const res = await fetch('/skus?q=' + encodeURIComponent(sku));
-      const arr = await res.json();
-      if(arr && arr.length){
-        const r = arr[0];
-        nameCache[sku] = (r.brand||'') + ' ' + (r.model||'') + (r.variant?(' ' + r.variant):'');
-      } else {
-        nameCache[sku] = '';
-      }
-    }catch(e){ nameCache[sku] = ''; }
-  }
-  
-  // Add to custom order if we're in create tab
-  if (currentTab === 'create') {
-    console.log('Adding to custom order:', sku, quantity);
-    addItemToCustomOrder(sku, quantity);
-  } else {
-    // Legacy behavior for existing orders
-    const existing = items.find(item => item.sku === sku);
-    if(existing) {
-      existing.quantity += quantity;
-    } else {
-      items.push({sku, quantity});
-    }
-    updateItemList();
-  }
-}
-
-function changeQuantity(idx, delta){
-  if(items[idx]){
-    items[idx].quantity = Math.max(1, items[idx].quantity + delta);
-    updateItemList();
-  }
-}
-
-function removeItem(idx){ 
-  items.splice(idx, 1); 
-  updateItemList(); 
-}
-
-function clearOrder(){
-  items.length = 0;
-  updateItemList();
-}
-// Tab switching functionality
-function switchTab(tabName) {
-  currentTab = tabName;
-  
-  // Update tab buttons
-  const createTab = document.getElementById('createOrderTab');
-  const existingTab = document.getElementById('existingOrdersTab');
-  const createContent = document.getElementById('createOrderContent');
-  const existingContent = document.getElementById('existingOrdersContent');
-  
-  if (tabName === 'create') {
-    // Switch to create order tab
-    createTab.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-    createTab.style.color = 'white';
-    createTab.style.boxShadow = '0 4px 12px rgba(102, 126, 234, 0.3)';
-    
-    existingTab.style.background = 'transparent';
-    existingTab.style.color = '#64748b';
-    existingTab.style.boxShadow = 'none';
-    
-    createContent.style.display = 'block';
-    existingContent.style.display = 'none';
-    
-    // Hide selected order section in create tab
-    const orderPackingControls = document.getElementById('orderPackingControls');
-    if (orderPackingControls) {
-      orderPackingControls.style.display = 'none';
-      orderPackingControls.classList.add('hidden-in-create-tab');
-    }
-    
-    // Hide selected order card in create tab
-    const selectedOrderCard = document.getElementById('selectedOrderCard');
-    if (selectedOrderCard) {
-      console.log('Hiding selectedOrderCard in create tab');
-      selectedOrderCard.style.display = 'none';
-      selectedOrderCard.classList.add('hidden-in-create-tab');
-      console.log('selectedOrderCard classes:', selectedOrderCard.classList.toString());
-    }
-    
-    // Load SKUs if not already loaded
-    if (allSkus.length === 0) {
-      loadAllSkus();
-    }
-  } else {
-    // Switch to existing orders tab
-    existingTab.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-    existingTab.style.color = 'white';
-    existingTab.style.boxShadow = '0 4px 12px rgba(102, 126, 234, 0.3)';
-    
-    createTab.style.background = 'transparent';
-    createTab.style.color = '#64748b';
-    createTab.style.boxShadow = 'none';
-    
-    createContent.style.display = 'none';
-    existingContent.style.display = 'block';
-    
-    // Show selected order section in existing orders tab
-    const orderPackingControls = document.getElementById('orderPackingControls');
-    if (orderPackingControls) {
-      orderPackingControls.style.display = 'block';
-      orderPackingControls.classList.remove('hidden-in-create-tab');
-    }
-    
-    // Show selected order card in existing orders tab (only if an order is selected)
-    const selectedOrderCard = document.getElementById('selectedOrderCard');
-    if (selectedOrderCard) {
-      if (selectedOrder) {
-        selectedOrderCard.style.display = 'block';
-        selectedOrderCard.classList.remove('hidden-in-create-tab');
-      } else {
-        selectedOrderCard.style.display = 'none';
-        selectedOrderCard.classList.add('hidden-in-create-tab');
-      }
-    }
-    
-    // Load orders if not already loaded
-    if (allOrders.length === 0) {
-      loadAllOrders();
-    }
-  }
-}
-
-// Custom order creation functions
-function addItemToCustomOrder(sku, quantity = 1) {
-  console.log('addItemToCustomOrder called with:', sku, quantity);
-  const existingItem = selectedItems.find(item => item.sku === sku);
-  if (existingItem) {
-    existingItem.quantity += quantity;
-    console.log('Updated existing item, new quantity:', existingItem.quantity);
-  } else {
-    selectedItems.push({ sku, quantity });
-    console.log('Added new item, selectedItems now:', selectedItems);
-  }
-  updateSelectedItemsDisplay();
-  
-  // Re-render the product grid to show updated selection state
-  const query = document.getElementById('skuSearch').value.toLowerCase().trim();
-  let currentSkus = allSkus;
-  
-  if (query) {
-    currentSkus = allSkus.filter(sku => {
-      const name = ((sku.brand||'') + ' ' + (sku.model||'') + ' ' + (sku.variant||'')).toLowerCase();
-      return sku.sku.toLowerCase().includes(query) || name.includes(query) || (sku.category || '').toLowerCase().includes(query);
-    });
-  }
-  
-  renderSkuGrid(currentSkus);
-}
-
-function removeItemFromCustomOrder(sku) {
-  selectedItems = selectedItems.filter(item => item.sku !== sku);
-  updateSelectedItemsDisplay();
-  
-  // Re-render the product grid to show updated selection state
-  const query = document.getElementById('skuSearch').value.toLowerCase().trim();
-  let currentSkus = allSkus;
-  
-  if (query) {
-    currentSkus = allSkus.filter(sku => {
-      const name = ((sku.brand||'') + ' ' + (sku.model||'') + ' ' + (sku.variant||'')).toLowerCase();
-      return sku.sku.toLowerCase().includes(query) || name.includes(query) || (sku.category || '').toLowerCase().includes(query);
-    });
-  }
-  
-  renderSkuGrid(currentSkus);
-}
-
-function updateCustomOrderQuantity(sku, quantity) {
-  const item = selectedItems.find(item => item.sku === sku);
-  if (item) {
-    if (quantity <= 0) {
-      removeItemFromCustomOrder(sku);
-    } else {
-      item.quantity = quantity;
-      updateSelectedItemsDisplay();
-      
-      // Re-render the product grid to show updated selection state
-      const query = document.getElementById('skuSearch').value.toLowerCase().trim();
-      let currentSkus = allSkus;
-      
-      if (query) {
-        currentSkus = allSkus.filter(sku => {
-          const name = ((sku.brand||'') + ' ' + (sku.model||'') + ' ' + (sku.variant||'')).toLowerCase();
-          return sku.sku.toLowerCase().includes(query) || name.includes(query) || (sku.category || '').toLowerCase().includes(query);
-        });
-      }
-      
-      renderSkuGrid(currentSkus);
-    }
-  }
-}
-
-function updateSelectedItemsDisplay() {
-  const panel = document.getElementById('selectedItemsPanel');
-  const countEl = document.getElementById('selectedItemsCount');
-  const listEl = document.getElementById('selectedItemsList');
-  
-  if (selectedItems.length === 0) {
-    panel.style.display = 'none';
-    return;
-  }
-  
-  panel.style.display = 'block';
-  countEl.textContent = `${selectedItems.length} ${window.currentLanguage === 'en' ? 'items' : 'ürün'}`;
-  
-  const itemsHtml = selectedItems.map(item => {
-    const name = nameCache[item.sku] || item.sku;
-    return `
-      <div style="display: flex; justify-content: space-between; align-items: center; padding: 12px; margin: 4px 0; background: #f8fafc; border-radius: 8px; border: 1px solid #e2e8f0;">
-        <div style="flex: 1;">
-          <div style="font-size: 13px; font-weight: 600; color: #2d3748;">${item.sku}</div>
-          <div style="font-size: 11px; color: #64748b; margin-top: 2px;">${name}</div>
-        </div>
-        <div style="display: flex; align-items: center; gap: 8px;">
-          <button onclick="updateCustomOrderQuantity('${item.sku}', ${item.quantity - 1})" style="width: 28px; height: 28px; background: #ef4444; color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: 700; font-size: 14px;">-</button>
-          <span style="min-width: 30px; text-align: center; font-weight: 600; color: #2d3748;">${item.quantity}</span>
-          <button onclick="updateCustomOrderQuantity('${item.sku}', ${item.quantity + 1})" style="width: 28px; height: 28px; background: #10b981; color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: 700; font-size: 14px;">+</button>
-          <button onclick="removeItemFromCustomOrder('${item.sku}')" style="width: 28px; height: 28px; background: #64748b; color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: 700; font-size: 12px; margin-left: 4px;">×</button>
-        </div>
-      </div>
-    `;
-  }).join('');
-  
-  listEl.innerHTML = itemsHtml;
-}
-
-function clearCustomOrder() {
-  selectedItems = [];
-  updateSelectedItemsDisplay();
-}
+from itertools import chain
+import numpy as np
+import concurrent.futures
+import csv
+import gzip
+import hashlib
+import heapq
+import logging
+import os
+import secrets
+import threading
+import time
+
+try:
+	import orjson  # noqa: F401 - only needed by ORJSONResponse at render time
+	from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+	from fastapi.responses import JSONResponse as DefaultResponse
+
+logger = logging.getLogger(__name__)
+
+# pack() is pure Python and holds the GIL, so parallel container trials need worker processes.
+# Opt in with TETRABOX_PARALLEL_PACK=1: pool startup and pickling outweigh the gain on small orders
+PARALLEL_PACK = os.environ.get("TETRABOX_PARALLEL_PACK", "0") == "1"
+PARALLEL_PACK_MIN_ITEMS = 6
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	"""Start the container-trial process pool with the app (if enabled) and shut it down with it"""
+	app.state.pack_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) if PARALLEL_PACK else None
+	try:
+		yield
+	finally:
+		if app.state.pack_pool is not None:
+			app.state.pack_pool.shutdown(cancel_futures=True)
+			app.state.pack_pool = None
 
-async function packCustomOrder() {
-  console.log('packCustomOrder called, selectedItems:', selectedItems);
-  
-  if (selectedItems.length === 0) {
-    alert(window.currentLanguage === 'en' ? 'Please add some items to the order' : 'Lütfen siparişe bazı ürünler ekleyin');
-    return;
-  }
-  
-  const orderId = document.getElementById('customOrderId').value.trim() || 'ORD-TEST-001';
-  
-  // Show the results section immediately to ensure loading spinner is visible
-  const resultsSection = document.getElementById('resultsSection');
-  if (resultsSection) {
-    resultsSection.style.display = 'block';
-  }
-  
-  // Show loading state
-  const compactEl = document.getElementById('compactResult');
-  const summaryEl = document.getElementById('summary');
-  const logEl = document.getElementById('log');
-  
-  if (summaryEl) {
-    summaryEl.innerHTML = '';
-    summaryEl.style.display = 'none';
-  }
-  if (logEl) {
-    logEl.textContent = '';
-    logEl.style.display = 'none';
-  }
-  
-  compactEl.innerHTML = '';
-  compactEl.style.display = 'block';
-  compactEl.innerHTML = `
-    <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 20px; padding: 40px; text-align: center; box-shadow: 0 20px 60px rgba(16, 185, 129, 0.4); position: relative; overflow: hidden; min-width: 400px; max-width: 500px; margin: 20px auto;">
-      <div style="position: absolute; top: -20%; left: -20%; width: 140%; height: 140%; background: radial-gradient(circle, rgba(255,255,255,0.05) 1px, transparent 1px); background-size: 30px 30px; animation: slowFloat 8s ease-in-out infinite;"></div>
-      
-      <div style="position: relative; z-index: 2;">
-        <div style="width: 80px; height: 80px; margin: 0 auto 24px; position: relative;">
-          <div style="position: absolute; top: 0; left: 0; width: 80px; height: 80px; border: 4px solid rgba(255,255,255,0.2); border-radius: 50%; border-top: 4px solid #ffffff; animation: spin 1.2s linear infinite;"></div>
-          <div style="position: absolute; top: 12px; left: 12px; width: 56px; height: 56px; border: 3px solid rgba(255,255,255,0.3); border-radius: 50%; border-right: 3px solid #ffffff; animation: spin 0.8s linear infinite reverse;"></div>
-          <div style="position: absolute; top: 50%; left: 50%; width: 12px; height: 12px; background: #ffffff; border-radius: 50%; transform: translate(-50%, -50%); animation: pulse 1.5s ease-in-out infinite;"></div>
-        </div>
-        
-        <div style="color: white; font-size: 24px; font-weight: 700; margin-bottom: 8px; background: linear-gradient(135deg, #ffffff 0%, #e0fdf4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">
-          Processing Custom Order
-        </div>
-        <div style="color: rgba(255,255,255,0.9); font-size: 18px; font-weight: 600; margin-bottom: 16px;">
-          ${orderId}
-        </div>
-        
-        <div style="display: flex; justify-content: center; gap: 8px; margin-top: 20px;">
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.2s;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.4s;"></div>
-        </div>
-        
-        <div style="color: rgba(255,255,255,0.8); font-size: 14px; font-weight: 500; margin-top: 16px; opacity: 0.9;">
-          Analyzing ${selectedItems.length} items...
-        </div>
-      </div>
-    </div>
-  `;
-  
-  try {
-    const packRequest = {
-      order_id: orderId,
-      items: selectedItems
-    };
-    
-    const res = await fetch('/pack/order', { 
-      method: 'POST', 
-      headers: {'Content-Type': 'application/json'}, 
-      body: JSON.stringify(packRequest)
-    });
-    
-    if (!res.ok) {
-      const errorText = await res.text();
-      console.error('Pack order failed:', errorText);
-      throw new Error(`HTTP ${res.status}: ${errorText}`);
-    }
-    
-    const j = await res.json();
-    
-    // Store result globally
-    window.packingResult = j;
-    
-    // Show results section
-    document.getElementById('resultsSection').style.display = 'block';
-    
-    // Show compact result
-    showCompactResult(j);
-    
-    // Render all views inline
-    renderSummary(j);
-    render3D(j);
-    render2DViews(j);
-    document.getElementById('log').textContent = JSON.stringify(j, null, 2);
-    
-    // Scroll to results
-    setTimeout(() => {
-      document.getElementById('resultsSection').scrollIntoView({ behavior: 'smooth', block: 'start' });
-    }, 100);
-    
-  } catch(error) {
-    document.getElementById('resultsSection').style.display = 'block';
-    compactEl.innerHTML = '<div style="color: #dc3545; padding: 20px; text-align: center;"><strong>❌ Error:</strong> ' + error.message + '</div>';
-  }
-}
 
-// Auto-load orders on page load
-window.addEventListener('DOMContentLoaded', () => {
-  console.log('Page loaded, initializing order system...');
-  
-  // Initialize language first
-  initializeLanguage();
-  
-  updateSelectedOrderInfo(); // Initialize empty order display
-  
-  // Ensure selected order section is hidden on page load
-  const orderPackingControls = document.getElementById('orderPackingControls');
-  if (orderPackingControls) {
-    orderPackingControls.style.display = 'none';
-    orderPackingControls.classList.add('hidden-in-create-tab');
-  }
-  
-  // Ensure selected order card is hidden on page load
-  const selectedOrderCard = document.getElementById('selectedOrderCard');
-  if (selectedOrderCard) {
-    console.log('Hiding selectedOrderCard on page load');
-    selectedOrderCard.style.display = 'none';
-    selectedOrderCard.classList.add('hidden-in-create-tab');
-    console.log('selectedOrderCard classes after page load:', selectedOrderCard.classList.toString());
-  } else {
-    console.log('selectedOrderCard element not found!');
-  }
-  
-  // Start with create order tab and load SKUs
-  switchTab('create');
-  loadAllSkus();
-  
-  // Force hide selected order card after a short delay to ensure it's hidden
-  setTimeout(() => {
-    const selectedOrderCard = document.getElementById('selectedOrderCard');
-    if (selectedOrderCard) {
-      console.log('Force hiding selectedOrderCard after timeout');
-      selectedOrderCard.style.display = 'none';
-      selectedOrderCard.classList.add('hidden-in-create-tab');
-    }
-  }, 100);
-});
+app = FastAPI(title="TetraboX API", version="0.1.0", default_response_class=DefaultResponse, lifespan=lifespan)
 
-// Keyboard shortcuts
-document.addEventListener('keydown', (e) => {
-  if(e.key === 'Escape') {
-    clearSelection();
-  }
-});
-async function submitOrder(){
-  const orderId = document.getElementById('orderId').value.trim() || 'ORD-1';
-  const body = { order_id: orderId, items: items };
-  
-  // Hide previous results and show loading state
-  const compactEl = document.getElementById('compactResult');
-  const summaryEl = document.getElementById('summary');
-  const logEl = document.getElementById('log');
-  
-  // Hide all previous results completely
-  if (summaryEl) {
-    summaryEl.innerHTML = '';
-    summaryEl.style.display = 'none';
-  }
-  if (logEl) {
-    logEl.textContent = '';
-    logEl.style.display = 'none';
-  }
-  
-  // Clear and show compact result with loading spinner
-  compactEl.innerHTML = '';
-  compactEl.style.display = 'block';
-  compactEl.innerHTML = `
-    <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 20px; padding: 40px; text-align: center; box-shadow: 0 20px 60px rgba(16, 185, 129, 0.4); position: relative; overflow: hidden; min-width: 400px; max-width: 500px; margin: 20px auto;">
-      <!-- Subtle animated background -->
-      <div style="position: absolute; top: -20%; left: -20%; width: 140%; height: 140%; background: radial-gradient(circle, rgba(255,255,255,0.05) 1px, transparent 1px); background-size: 30px 30px; animation: slowFloat 8s ease-in-out infinite;"></div>
-      
-      <!-- Premium loading spinner -->
-      <div style="position: relative; z-index: 2;">
-        <div style="width: 80px; height: 80px; margin: 0 auto 24px; position: relative;">
-          <!-- Outer rotating ring -->
-          <div style="position: absolute; top: 0; left: 0; width: 80px; height: 80px; border: 4px solid rgba(255,255,255,0.2); border-radius: 50%; border-top: 4px solid #ffffff; animation: spin 1.2s linear infinite;"></div>
-          <!-- Inner pulsing ring -->
-          <div style="position: absolute; top: 12px; left: 12px; width: 56px; height: 56px; border: 3px solid rgba(255,255,255,0.3); border-radius: 50%; border-right: 3px solid #ffffff; animation: spin 0.8s linear infinite reverse;"></div>
-          <!-- Center pulsing dot -->
-          <div style="position: absolute; top: 50%; left: 50%; width: 12px; height: 12px; background: #ffffff; border-radius: 50%; transform: translate(-50%, -50%); animation: pulse 1.5s ease-in-out infinite;"></div>
-        </div>
-        
-        <!-- Loading text with gradient -->
-        <div style="color: white; font-size: 24px; font-weight: 700; margin-bottom: 8px; background: linear-gradient(135deg, #ffffff 0%, #e0fdf4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">
-          Processing Order
-        </div>
-        <div style="color: rgba(255,255,255,0.9); font-size: 18px; font-weight: 600; margin-bottom: 16px;">
-          ${orderId}
-        </div>
-        
-        <!-- Progress dots -->
-        <div style="display: flex; justify-content: center; gap: 8px; margin-top: 20px;">
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.2s;"></div>
-          <div style="width: 8px; height: 8px; background: rgba(255,255,255,0.6); border-radius: 50%; animation: bounce 1.4s ease-in-out infinite both; animation-delay: 0.4s;"></div>
-        </div>
-        
-        <!-- Status text -->
-        <div style="color: rgba(255,255,255,0.8); font-size: 14px; font-weight: 500; margin-top: 16px; opacity: 0.9;">
-          Analyzing items and containers...
-        </div>
-      </div>
-    </div>
-    
-    <style>
-      @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-      }
-      
-      @keyframes pulse {
-        0%, 100% { transform: translate(-50%, -50%) scale(1); opacity: 1; }
-        50% { transform: translate(-50%, -50%) scale(1.2); opacity: 0.7; }
-      }
-      
-      @keyframes bounce {
-        0%, 80%, 100% { transform: scale(0.8); opacity: 0.5; }
-        40% { transform: scale(1.2); opacity: 1; }
-      }
-      
-      @keyframes slowFloat {
-        0%, 100% { transform: translate(0, 0) rotate(0deg); }
-        50% { transform: translate(-5px, -5px) rotate(90deg); }
-      }
-    </style>
-  `;
-  
-  try {
-    const res = await fetch('/pack/order', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify(body)});
-    
-    if (!res.ok) {
-      const errorText = await res.text();
-      console.error('Pack order failed:', errorText);
-      throw new Error(`HTTP ${res.status}: ${errorText}`);
-    }
-    
-    const j = await res.json();
-    
-    // Store result globally for modal
-    window.packingResult = j;
-    
-    // Show compact result
-    showCompactResult(j);
-    
-    // Prepare modal content (but don't show yet)
-    renderSummary(j);
-    document.getElementById('log').textContent = JSON.stringify(j, null, 2);
-    
-  } catch(error) {
-    compactEl.innerHTML = '<div style="color: #dc3545;">❌ Error: ' + error.message + '</div>';
-  }
-}
+# Mount static files directory
+app.mount("/static", StaticFiles(directory="static"), name="static")
 
-function showCompactResult(j) {
-  const el = document.getElementById('compactResult');
-  el.style.display = 'block';
-  
-  // Show summary and log elements if they were hidden
-  const summaryEl = document.getElementById('summary');
-  const logEl = document.getElementById('log');
-  if (summaryEl) summaryEl.style.display = 'block';
-  if (logEl) logEl.style.display = 'block';
-  
-  // Remove any existing overlay
-  const existingOverlay = document.querySelector('[style*="position: fixed"][style*="backdrop-filter: blur"]');
-  if (existingOverlay) {
-    existingOverlay.remove();
-  }
-  
-  if(!j || !j.success) {
-    el.innerHTML = `
-      <div style="background: white; border: 2px solid #ef4444; border-radius: 16px; padding: 32px; box-shadow: 0 4px 20px rgba(239, 68, 68, 0.15); text-align: center;">
-        <div style="width: 64px; height: 64px; background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); border-radius: 16px; display: inline-flex; align-items: center; justify-content: center; margin-bottom: 16px; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.3);">
-          <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round">
-            <circle cx="12" cy="12" r="10"></circle>
-            <line x1="15" y1="9" x2="9" y2="15"></line>
-            <line x1="9" y1="9" x2="15" y2="15"></line>
-          </svg>
-        </div>
-        <div style="font-size: 22px; font-weight: 700; color: #dc2626; margin-bottom: 8px;">No Suitable Container Found</div>
-        <div style="color: #64748b; font-size: 14px;">Unable to pack items even with multiple containers</div>
-      </div>
-    `;
-    return;
-  }
-  
-  const isMultiContainer = j.container_count > 1;
-  const containerText = isMultiContainer ? 
-    `${j.container_count} containers` : 
-    `${j.container_name || 'Unknown'} (${j.shipping_company || 'Unknown'})`;
-  
-  el.innerHTML = `
-    <div style="background: white; border: 2px solid #10b981; border-radius: 16px; padding: 24px; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.15);">
-      <div style="display: flex; align-items: center; gap: 20px;">
-        <div style="width: 64px; height: 64px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); border-radius: 16px; display: flex; align-items: center; justify-content: center; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);">
-          <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="3" stroke-linecap="round" stroke-linejoin="round">
-            <polyline points="20 6 9 17 4 12"></polyline>
-          </svg>
-        </div>
-        <div style="flex: 1;">
-          <div style="font-size: 24px; font-weight: 800; color: #059669; margin-bottom: 8px; letter-spacing: -0.5px;">
-            <span data-tr="Paketleme Tamamlandı" data-en="Packing Complete">${window.currentLanguage === 'en' ? 'Packing Complete' : 'Paketleme Tamamlandı'}</span>
-            ${isMultiContainer ? '<span style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 5px 14px; border-radius: 14px; font-size: 12px; margin-left: 12px; box-shadow: 0 2px 8px rgba(245, 158, 11, 0.3); font-weight: 700; letter-spacing: 0.5px;">MULTI-BOX</span>' : ''}
-          </div>
-          <div style="color: #64748b; font-size: 15px; line-height: 1.6; font-weight: 500;">
-            <strong style="color: #2d3748;">${containerText}</strong> • 
-            <strong style="color: #2d3748;">${j.total_items || j.placements?.length || 0}</strong> <span data-tr="ürün" data-en="items">${window.currentLanguage === 'en' ? 'items' : 'ürün'}</span> • 
-            <strong style="color: #5a67d8;">${(j.utilization*100).toFixed(1)}%</strong> <span data-tr="kullanım" data-en="utilization">${window.currentLanguage === 'en' ? 'utilization' : 'kullanım'}</span> • 
-            <strong style="color: #059669;">${(j.total_price || j.price_try || 0).toFixed(2)}₺</strong>
-          </div>
-        </div>
-      </div>
-    </div>
-  `;
-}
+@app.get("/favicon.ico")
+def favicon():
+    """Serve favicon from static directory"""
+    favicon_path = os.path.join("static", "favicon.ico")
+    if os.path.exists(favicon_path):
+        return FileResponse(favicon_path, media_type="image/x-icon")
+    else:
+        # Fallback to simple transparent pixel if file doesn't exist
+        return Response(content=b'\x00\x00\x01\x00\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\x00\x16\x00\x00\x00', media_type="image/x-icon")
 
-// Modal functions removed - now using inline display
+@app.get("/health")
+def health_check():
+	"""Health check endpoint for DigitalOcean App Platform"""
+	return {"status": "healthy", "service": "TetraboX"}
 
-function showTab(tabName) {
-  // Hide all tabs
-  document.querySelectorAll('.tab-content').forEach(tab => tab.classList.remove('active'));
-  document.querySelectorAll('.tab-button').forEach(btn => btn.classList.remove('active'));
-  
-  // Show selected tab
-  document.getElementById('tab-' + tabName).classList.add('active');
-  document.querySelector(`[onclick="showTab('${tabName}')"]`).classList.add('active');
-  
-  // Re-render 3D if switching to 3D tab (for proper sizing)
-  if(tabName === '3d' && window.packingResult) {
-    setTimeout(() => render3D(window.packingResult), 100);
-  }
-  
-  // Scroll to results section
-  setTimeout(() => {
-    document.getElementById('tab-' + tabName).scrollIntoView({ behavior: 'smooth', block: 'nearest' });
-  }, 150);
-}
+# Candidate scores closer than this are treated as a tie and broken by container price
+SCORE_TIE_EPSILON = 0.01
 
-function renderSummary(j){
-  const el = document.getElementById('summary');
-  if(!j || !j.success){ 
-    el.innerHTML = '<div style="padding: 20px; text-align: center; color: #dc3545;">❌ No feasible container found.</div>'; 
-    return; 
-  }
-  
-  const isMultiContainer = j.container_count > 1;
-  
-  if(isMultiContainer) {
-    // Premium multi-container summary
-    el.innerHTML = `
-      <div style="margin-bottom: 30px;">
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 24px; border-radius: 16px; box-shadow: 0 8px 24px rgba(102, 126, 234, 0.25); margin-bottom: 24px;">
-          <h3 style="margin: 0 0 20px 0; color: white; font-size: 28px; font-weight: 800; display: flex; align-items: center; gap: 12px; letter-spacing: -0.5px;">
-            Multi-Container Packing
-            <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; border-radius: 20px; font-size: 14px; font-weight: 700; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">${j.container_count} Boxes</span>
-          </h3>
-          
-          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 16px;">
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">TOTAL CONTAINERS</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${j.container_count}</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">TOTAL ITEMS</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${j.total_items}</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">TOTAL PRICE</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${j.total_price.toFixed(2)}₺</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">AVG UTILIZATION</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${(j.utilization*100).toFixed(1)}%</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">TOTAL VOLUME</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${(j.container_volume_cm3/1000).toFixed(1)}L</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;">ALGORITHM</div>
-              <div style="color: #fbbf24; font-size: 16px; font-weight: 700;">Greedy Max</div>
-            </div>
-          </div>
-        </div>
-        
-        <div style="background: white; padding: 24px; border-radius: 16px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-          <h4 style="margin: 0 0 20px 0; color: #2d3748; font-size: 22px; font-weight: 700; display: flex; align-items: center; gap: 10px; letter-spacing: -0.5px;">
-            Container Breakdown
-            <span style="background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%); padding: 5px 13px; border-radius: 20px; font-size: 13px; color: #64748b; font-weight: 600;">${j.containers.length} containers</span>
-          </h4>
-          
-          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 16px;">
-            ${j.containers.map((container, idx) => {
-              const utilization = container.utilization * 100;
-              const utilizationColor = utilization >= 70 ? '#10b981' : utilization >= 60 ? '#f59e0b' : '#ef4444';
-              return `
-                <div style="background: linear-gradient(135deg, #f8fafc 0%, #ffffff 100%); border: 2px solid #e2e8f0; border-radius: 12px; padding: 18px; transition: all 0.3s ease; position: relative; overflow: hidden;">
-                  <div style="position: absolute; top: 0; left: 0; right: 0; height: 4px; background: linear-gradient(90deg, ${utilizationColor} ${utilization}%, #e5e7eb ${utilization}%);"></div>
-                  
-                  <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
-                    <div style="display: flex; align-items: center; gap: 8px;">
-                      <div style="width: 32px; height: 32px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-size: 14px;">${idx+1}</div>
-                      <div>
-                        <div style="font-weight: 700; color: #2d3748; font-size: 15px;">${container.container_name || 'Unknown'}</div>
-                        <div style="font-size: 12px; color: #64748b;">${container.shipping_company || 'Unknown'}</div>
-                      </div>
-                    </div>
-                    <div style="background: ${utilizationColor}; color: white; padding: 4px 10px; border-radius: 20px; font-size: 12px; font-weight: 700;">
-                      ${utilization.toFixed(1)}%
-                    </div>
-                  </div>
-                  
-                  <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 12px; margin-top: 12px;">
-                    <div style="background: #f8fafc; padding: 10px; border-radius: 8px;">
-                      <div style="color: #64748b; font-size: 11px; font-weight: 500; margin-bottom: 2px;">ITEMS</div>
-                      <div style="color: #2d3748; font-size: 18px; font-weight: 700;">${container.placements.length}</div>
-                    </div>
-                    <div style="background: #f8fafc; padding: 10px; border-radius: 8px;">
-                      <div style="color: #64748b; font-size: 11px; font-weight: 500; margin-bottom: 2px;">PRICE</div>
-                      <div style="color: #059669; font-size: 18px; font-weight: 700;">${(container.price_try || 0).toFixed(2)}₺</div>
-                    </div>
-                    <div style="background: #f8fafc; padding: 10px; border-radius: 8px;">
-                      <div style="color: #64748b; font-size: 11px; font-weight: 500; margin-bottom: 2px;">VOLUME</div>
-                      <div style="color: #2d3748; font-size: 18px; font-weight: 700;">${(container.container_volume_cm3/1000).toFixed(1)}L</div>
-                    </div>
-                    <div style="background: #f8fafc; padding: 10px; border-radius: 8px;">
-                      <div style="color: #64748b; font-size: 11px; font-weight: 500; margin-bottom: 2px;">REMAINING</div>
-                      <div style="color: #64748b; font-size: 18px; font-weight: 700;">${(container.remaining_volume_cm3/1000).toFixed(1)}L</div>
-                    </div>
-                  </div>
-                </div>
-              `;
-            }).join('')}
-          </div>
-          
-          <div style="margin-top: 20px; padding: 20px; background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); border-radius: 12px; border-left: 5px solid #f59e0b; font-size: 14px; line-height: 1.7;">
-            <strong style="color: #92400e; font-size: 15px; display: block; margin-bottom: 8px;">Optimization Strategy</strong>
-            <div style="color: #78350f;">
-              Order was intelligently split across <strong>${j.container_count} containers</strong> using our <strong>Greedy Max Utilization</strong> algorithm to minimize total cost while maximizing space efficiency.
-            </div>
-          </div>
-        </div>
-      </div>
-    `;
-  } else {
-    // Premium single container summary
-    let maxW=0, maxL=0, maxH=0;
-    if(j.placements && j.placements.length > 0) {
-      j.placements.forEach(p=>{ 
-        maxW=Math.max(maxW, p.position_mm[0]+p.size_mm[0]); 
-        maxL=Math.max(maxL, p.position_mm[1]+p.size_mm[1]); 
-        maxH=Math.max(maxH, p.position_mm[2]+p.size_mm[2]); 
-      });
-    }
-    
-    const utilization = j.utilization * 100;
-    const utilizationColor = utilization >= 70 ? '#10b981' : utilization >= 60 ? '#f59e0b' : '#ef4444';
-    
-    el.innerHTML = `
-      <div style="margin-bottom: 30px;">
-        <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); padding: 24px; border-radius: 16px; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.25); margin-bottom: 24px;">
-          <h3 style="margin: 0 0 20px 0; color: white; font-size: 28px; font-weight: 800; display: flex; align-items: center; gap: 12px; letter-spacing: -0.5px;">
-            Single Container Solution
-            <span style="background: rgba(255,255,255,0.25); padding: 6px 14px; border-radius: 20px; font-size: 14px; font-weight: 700; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">Optimal</span>
-          </h3>
-          
-          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 16px;">
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="KONTEYNER" data-en="CONTAINER">${window.currentLanguage === 'en' ? 'CONTAINER' : 'KONTEYNER'}</div>
-              <div style="color: white; font-size: 18px; font-weight: 700;">${j.container_name || 'Unknown'}</div>
-              <div style="color: rgba(255,255,255,0.7); font-size: 12px; margin-top: 2px;">${j.shipping_company || 'Unknown'}</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="ÜRÜNLER" data-en="ITEMS">${window.currentLanguage === 'en' ? 'ITEMS' : 'ÜRÜNLER'}</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${j.placements ? j.placements.length : 0}</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="KULLANIM" data-en="UTILIZATION">${window.currentLanguage === 'en' ? 'UTILIZATION' : 'KULLANIM'}</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${utilization.toFixed(1)}%</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="FİYAT" data-en="PRICE">${window.currentLanguage === 'en' ? 'PRICE' : 'FİYAT'}</div>
-              <div style="color: white; font-size: 32px; font-weight: 700;">${(j.price_try || 0).toFixed(2)}₺</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="HACİM" data-en="VOLUME">${window.currentLanguage === 'en' ? 'VOLUME' : 'HACİM'}</div>
-              <div style="color: white; font-size: 20px; font-weight: 700;">${(j.container_volume_cm3/1000).toFixed(1)}L / ${(j.remaining_volume_cm3/1000).toFixed(1)}L free</div>
-            </div>
-            <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 16px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-              <div style="color: rgba(255,255,255,0.8); font-size: 12px; font-weight: 500; margin-bottom: 4px;" data-tr="BOYUTLAR" data-en="DIMENSIONS">${window.currentLanguage === 'en' ? 'DIMENSIONS' : 'BOYUTLAR'}</div>
-              <div style="color: white; font-size: 16px; font-weight: 700;">${maxW}×${maxL}×${maxH}mm</div>
-            </div>
-          </div>
-        </div>
-        
-        <div style="padding: 20px; background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); border-radius: 12px; border-left: 5px solid #10b981; font-size: 14px; line-height: 1.7;">
-          <strong style="color: #065f46; font-size: 16px; display: block; margin-bottom: 8px;" data-tr="Mükemmel Tek Konteyner Çözümü" data-en="Perfect Single-Container Solution">${window.currentLanguage === 'en' ? 'Perfect Single-Container Solution' : 'Mükemmel Tek Konteyner Çözümü'}</strong>
-          <div style="color: #047857;" id="solution-description-${j.container_name || 'default'}">
-            ${window.currentLanguage === 'en' 
-              ? `All <strong>${j.placements ? j.placements.length : 0} items</strong> fit perfectly in a single <strong>${j.container_name || 'Unknown'}</strong> container from <strong>${j.shipping_company || 'Unknown'}</strong>. This is the most cost-effective solution with <strong>${utilization.toFixed(1)}% utilization</strong>.`
-              : `Tüm <strong>${j.placements ? j.placements.length : 0} ürün</strong> <strong>${j.container_name || 'Unknown'}</strong> konteynerinde <strong>${j.shipping_company || 'Unknown'}</strong> şirketinden mükemmel şekilde sığıyor. Bu <strong>${utilization.toFixed(1)}% kullanım</strong> ile en uygun maliyetli çözümdür.`
-            }
-          </div>
-        </div>
-      </div>
-    `;
-  }
-}
 
-function renderViz(j){
-  const cvs = document.getElementById('viz');
-  const ctx = cvs.getContext('2d');
-  ctx.clearRect(0,0,cvs.width,cvs.height);
-  if(!j || !j.box_id || !Array.isArray(j.placements)) return;
-  // Draw top-down (X=width, Y=length) per layer Z
-  const W = j.container_volume_cm3 && j.placements.length ? j.placements.reduce((acc,p)=>Math.max(acc,p.size_mm[0]),0) : 0;
-  // Use container dims if available via placements approximation
-  let maxW=0, maxL=0, maxZ=0;
-  j.placements.forEach(p=>{ maxW=Math.max(maxW, p.position_mm[0]+p.size_mm[0]); maxL=Math.max(maxL, p.position_mm[1]+p.size_mm[1]); maxZ=Math.max(maxZ, p.position_mm[2]+p.size_mm[2]); });
-  const scale = Math.min(cvs.width/(maxW||1), cvs.height/(maxL||1));
-  // Group by layer using p.position_mm[2]
-  const layers = {};
-  j.placements.forEach(p=>{
-    const z = p.position_mm[2];
-    const key = Math.round(z/10)*10; // bin by 10mm
-    if(!layers[key]) layers[key]=[];
-    layers[key].push(p);
-  });
-  const keys = Object.keys(layers).map(k=>parseFloat(k)).sort((a,b)=>a-b);
-  const margin = 10;
-  const panelW = (cvs.width - margin*(keys.length+1)) / Math.max(1, keys.length);
-  keys.forEach((k, idx)=>{
-    const ox = margin + idx*(panelW+margin);
-    const oy = margin;
-    // Frame
-    ctx.strokeStyle = '#888';
-    ctx.strokeRect(ox, oy, panelW, panelW*(maxL/(maxW||1)));
-    // Draw items
-    layers[k].forEach((p,i)=>{
-      const x = p.position_mm[0]*scale;
-      const y = p.position_mm[1]*scale;
-      const w = p.size_mm[0]*scale;
-      const l = p.size_mm[1]*scale;
-      ctx.fillStyle = `hsl(${(i*57)%360} 70% 60%)`;
-      ctx.fillRect(ox+x, oy+y, w, l);
-      ctx.strokeStyle = '#333';
-      ctx.strokeRect(ox+x, oy+y, w, l);
-    });
-    ctx.fillStyle = '#000';
-    ctx.fillText('Z~'+k+'mm', ox, oy+10);
-  });
-}
+def bin_completion_select(remaining_products: List[Product], sorted_containers: List[Tuple[Container, float]],
+                          volume_of, pack_fn, max_group_size: int = 12, max_nodes: int = 300,
+                          fill_limits: Tuple[float, ...] = (1.0, 0.85, 0.7, 0.55),
+                          subsets_per_limit: int = 2) -> Optional[Tuple[Container, PackedContainer, List[int]]]:
+	"""
+	Bin-completion choice of the next container and the items that go into it.
+	
+	For every container a DFS over the items (largest volume first) enumerates maximal item
+	subsets whose total volume fits. It only branches on items that fit the container in some
+	orientation and skips siblings identical to one just explored, whose subsets would be
+	dominated duplicates. Volume is necessary but not sufficient for a geometric fit, so the
+	search is repeated under a few fill limits to also offer looser subsets; the fullest ones
+	per limit are ranked by score_candidates and pack() runs on them best-first.
+	sorted_containers holds (container, volume in cm³) pairs. Returns the container, its
+	pack and the positions in remaining_products of the items it holds.
+	"""
+	remaining_vols = np.fromiter((volume_of(p.sku, 0.0) for p in remaining_products), dtype=np.float64, count=len(remaining_products))
+	order = np.argsort(-remaining_vols, kind='stable')  # largest first, ties keep queue order
+	items = [remaining_products[i] for i in order]
+	vols = remaining_vols[order].tolist()
+	shapes = [tuple(sorted((p.width_mm, p.length_mm, p.height_mm))) for p in items]
+	
+	candidates = []  # (utilization, item ratio, price, container, subset)
+	seen = set()
+	for container, container_volume in sorted_containers:
+		if container_volume <= 0:
+			continue
+		container_capacity = container_volume * 1000.0  # mm³, same unit as vols
+		bin_shape = sorted((container.inner_w_mm, container.inner_l_mm, container.inner_h_mm))
+		fitting = [k for k in range(len(items)) if all(d <= b for d, b in zip(shapes[k], bin_shape))]
+		# The DFS walks positions in fitting, so gather their volumes and shapes once
+		fit_vols = [vols[k] for k in fitting]
+		fit_shapes = [shapes[k] for k in fitting]
+		fit_count = len(fitting)
+		container_price = container.price_try_safe
+		
+		for fill_limit in fill_limits:
+			capacity = container_capacity * fill_limit
+			subsets = []  # (used volume, item indices)
+			chosen = []  # positions in fitting
+			chosen_set = set()
+			nodes = 0
+			
+			def dfs(pos: int, used: float):
+				nonlocal nodes
+				nodes += 1
+				extended = False
+				if len(chosen) < max_group_size:
+					explored_shape = None
+					for j in range(pos, fit_count):
+						if nodes >= max_nodes:
+							break
+						volume = fit_vols[j]
+						shape = fit_shapes[j]
+						if used + volume > capacity or shape == explored_shape:
+							continue
+						explored_shape = shape
+						extended = True
+						chosen.append(j)
+						chosen_set.add(j)
+						dfs(j + 1, used + volume)
+						chosen.pop()
+						chosen_set.discard(j)
+				if extended or not chosen:
+					return
+				# Keep only maximal subsets: nothing left out could still be added
+				if len(chosen) < max_group_size and any(
+					j not in chosen_set and used + fit_vols[j] <= capacity for j in range(fit_count)
+				):
+					return
+				subsets.append((used, [fitting[j] for j in chosen]))
+			
+			dfs(0, 0.0)
+			subsets.sort(key=lambda entry: entry[0], reverse=True)
+			
+			for used, subset in subsets[:subsets_per_limit]:
+				utilization = used / container_capacity
+				key = (id(container), tuple(subset))
+				# Only consider solutions with good utilization (minimum 40%)
+				if utilization < 0.4 or key in seen:
+					continue
+				seen.add(key)
+				# pack() places all items or none, so a successful candidate packs its whole subset
+				item_ratio = len(subset) / len(items)
+				candidates.append((utilization, item_ratio, container_price, container, subset))
+	
+	if not candidates:
+		return None
+	
+	# Score all candidates in one kernel call
+	columns = np.array([entry[:3] for entry in candidates], dtype=np.float64)
+	scores = score_candidates(columns[:, 0], columns[:, 1], columns[:, 2]).tolist()
+	
+	# Like the group-size sweep this replaces: any well-scoring candidate (> 0.6) beats the rest,
+	# larger subsets first among those, then best score. The first pack() usually succeeds, so
+	# the ranking is a heap popped lazily rather than a full sort; the index keeps
+	# cost-efficiency order between exact ties
+	heap = [(-(score > 0.6), -len(entry[4]), -score, i) for i, (score, entry) in enumerate(zip(scores, candidates))]
+	heapq.heapify(heap)
+	while heap:
+		good, size, neg_score, i = heapq.heappop(heap)
+		# Candidates scoring within SCORE_TIE_EPSILON of this one are tried cheapest first
+		tied = [i]
+		while heap and heap[0][:2] == (good, size) and heap[0][2] <= neg_score + SCORE_TIE_EPSILON:
+			tied.append(heapq.heappop(heap)[3])
+		for i in sorted(tied, key=lambda k: (candidates[k][2], k)):
+			_, _, _, container, subset = candidates[i]
+			group = [items[k] for k in subset]
+			result = pack_fn(group, container)
+			if result and len(result.placements) == len(group):
+				return container, result, [int(order[k]) for k in subset]
+	
+	return None
 
-function renderMultiContainer2D(j) {
-  console.log('Rendering multi-container 2D views');
-  
-  // Replace 2D tab content with multi-container views
-  const tab2d = document.getElementById('tab-2d');
-  tab2d.innerHTML = '';
-  
-  // Add header
-  const header = document.createElement('div');
-  header.style.padding = '20px';
-  header.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-  header.style.color = 'white';
-  header.style.borderRadius = '12px 12px 0 0';
-  header.style.marginBottom = '0';
-  header.innerHTML = `
-    <div style="display: flex; align-items: center; justify-content: space-between;">
-      <div>
-        <h3 style="margin: 0; font-size: 24px; font-weight: 700;">Multi-Container 2D Views</h3>
-        <p style="margin: 8px 0 0; opacity: 0.9; font-size: 14px;">${j.containers.length} containers • ${j.total_items} items • ${(j.utilization*100).toFixed(1)}% utilization</p>
-      </div>
-      <div style="text-align: right;">
-        <div style="font-size: 32px; font-weight: 800;">${j.containers.length}</div>
-        <div style="font-size: 12px; opacity: 0.8;">Containers</div>
-      </div>
-    </div>
-  `;
-  tab2d.appendChild(header);
-  
-  // Create container for all 2D views
-  const containersDiv = document.createElement('div');
-  containersDiv.style.display = 'flex';
-  containersDiv.style.flexDirection = 'column';
-  containersDiv.style.gap = '20px';
-  containersDiv.style.padding = '20px';
-  containersDiv.style.background = '#f8fafc';
-  containersDiv.style.borderRadius = '0 0 12px 12px';
-  tab2d.appendChild(containersDiv);
-  
-  // Render 2D views for each container
-  j.containers.forEach((container, index) => {
-    const containerDiv = document.createElement('div');
-    containerDiv.style.background = 'white';
-    containerDiv.style.borderRadius = '12px';
-    containerDiv.style.padding = '20px';
-    containerDiv.style.boxShadow = '0 2px 8px rgba(0,0,0,0.1)';
-    
-    // Container header
-    const containerHeader = document.createElement('div');
-    containerHeader.style.display = 'flex';
-    containerHeader.style.justifyContent = 'space-between';
-    containerHeader.style.alignItems = 'center';
-    containerHeader.style.marginBottom = '20px';
-    containerHeader.style.paddingBottom = '15px';
-    containerHeader.style.borderBottom = '2px solid #e2e8f0';
-    
-    const utilization = container.utilization * 100;
-    const utilizationColor = utilization >= 70 ? '#10b981' : utilization >= 60 ? '#f59e0b' : '#ef4444';
-    
-    containerHeader.innerHTML = `
-      <div>
-        <h4 style="margin: 0; font-size: 18px; font-weight: 600; color: #2d3748;">Container ${index + 1}: ${container.container_name || 'Unknown'}</h4>
-        <p style="margin: 4px 0 0; color: #64748b; font-size: 14px;">${container.shipping_company || 'Unknown'} • ${container.placements.length} items</p>
-      </div>
-      <div style="text-align: right;">
-        <div style="background: ${utilizationColor}; color: white; padding: 8px 16px; border-radius: 20px; font-size: 16px; font-weight: 700;">
-          ${utilization.toFixed(1)}%
-        </div>
-        <div style="font-size: 12px; color: #64748b; margin-top: 4px;">${(container.price_try || 0).toFixed(2)}₺</div>
-      </div>
-    `;
-    containerDiv.appendChild(containerHeader);
-    
-    // 2D views grid
-    const viewsGrid = document.createElement('div');
-    viewsGrid.style.display = 'grid';
-    viewsGrid.style.gridTemplateColumns = 'repeat(auto-fit, minmax(300px, 1fr))';
-    viewsGrid.style.gap = '20px';
-    
-    // Create 2D view cards
-    const viewTypes = [
-      { name: 'Top', title: 'Kuş Bakışı Görünüm', color: '#10b981' },
-      { name: 'Front', title: 'Ön Görünüm', color: '#3b82f6' },
-      { name: 'Side', title: 'Yan Görünüm', color: '#8b5cf6' }
-    ];
-    
-    viewTypes.forEach(viewType => {
-      const viewCard = document.createElement('div');
-      viewCard.style.background = 'white';
-      viewCard.style.border = `2px solid ${viewType.color}`;
-      viewCard.style.borderRadius = '8px';
-      viewCard.style.padding = '15px';
-      viewCard.style.textAlign = 'center';
-      
-      const title = document.createElement('h5');
-      title.style.margin = '0 0 10px 0';
-      title.style.color = viewType.color;
-      title.style.fontSize = '14px';
-      title.style.fontWeight = '600';
-      title.textContent = viewType.title;
-      
-      const canvas = document.createElement('canvas');
-      canvas.width = 300;
-      canvas.height = 300;
-      canvas.style.border = `1px solid ${viewType.color}`;
-      canvas.style.borderRadius = '4px';
-      canvas.id = `viz${viewType.name}_${index}`;
-      
-      viewCard.appendChild(title);
-      viewCard.appendChild(canvas);
-      viewsGrid.appendChild(viewCard);
-    });
-    
-    containerDiv.appendChild(viewsGrid);
-    containersDiv.appendChild(containerDiv);
-    
-    // Render the views
-    const containerData = {
-      placements: container.placements,
-      inner_w_mm: container.inner_w_mm,
-      inner_l_mm: container.inner_l_mm,
-      inner_h_mm: container.inner_h_mm,
-      success: true
-    };
-    
-    renderSingle2DViews(containerData, `vizTop_${index}`, `vizFront_${index}`, `vizSide_${index}`);
-  });
-}
 
-function render2DViews(j){
-  if(!j || !j.success) {
-    ['vizTop', 'vizFront', 'vizSide'].forEach(id => {
-      const canvas = document.getElementById(id);
-      if(canvas) {
-        const ctx = canvas.getContext('2d');
-        ctx.clearRect(0,0,canvas.width, canvas.height);
-        ctx.fillStyle = '#f0f0f0';
-        ctx.fillRect(0,0,canvas.width, canvas.height);
-        ctx.fillStyle = '#666';
-        ctx.font = '14px Arial';
-        ctx.textAlign = 'center';
-        ctx.fillText('No data', canvas.width/2, canvas.height/2);
-      }
-    });
-    return;
-  }
-  
-  // Handle multi-container results
-  if(j.container_count > 1 && j.containers) {
-    renderMultiContainer2D(j);
-    return;
-  }
-  
-  // Handle single container
-  if(!Array.isArray(j.placements)) {
-    return;
-  }
-  
-  renderSingle2DViews(j, 'vizTop', 'vizFront', 'vizSide');
-}
+def sort_containers_by_efficiency(containers: List[Container]) -> List[Tuple[Container, float]]:
+	"""Containers ordered by cost efficiency (price per volume), paired with their volume in cm³"""
+	# Container geometry and price as columns (w, l, h, price)
+	container_geom = np.array(
+		[(c.inner_w_mm, c.inner_l_mm, c.inner_h_mm, c.price_try_safe) for c in containers], dtype=np.float64
+	).reshape(-1, 4)
+	container_volumes = container_geom[:, 0] * container_geom[:, 1] * container_geom[:, 2] / 1000.0
+	
+	with np.errstate(divide='ignore', invalid='ignore'):
+		efficiency = np.where(container_volumes > 0, container_geom[:, 3] / container_volumes, np.inf)
+	return [(containers[i], float(container_volumes[i])) for i in np.argsort(efficiency, kind='stable')]
 
-function renderSingle2DViews(j, topId, frontId, sideId) {
-  
-  // Use actual container dimensions
-  let maxW, maxL, maxH;
-  
-  if(j.inner_w_mm && j.inner_l_mm && j.inner_h_mm) {
-    // Use exact container dimensions from the database
-    maxW = j.inner_w_mm;
-    maxL = j.inner_l_mm;
-    maxH = j.inner_h_mm;
-    console.log(`2D Views using actual container dimensions: ${maxW}×${maxL}×${maxH}mm`);
-  } else {
-    // Fallback: calculate from placements
-    maxW = 0;
-    maxL = 0; 
-    maxH = 0;
-    j.placements.forEach(p=>{ 
-      maxW = Math.max(maxW, p.position_mm[0]+p.size_mm[0]); 
-      maxL = Math.max(maxL, p.position_mm[1]+p.size_mm[1]); 
-      maxH = Math.max(maxH, p.position_mm[2]+p.size_mm[2]); 
-    });
-    console.log(`2D Views using calculated dimensions: ${maxW}×${maxL}×${maxH}mm`);
-  }
-  
-  const colorForSku = (sku)=>{ 
-    let h=0; 
-    for(let i=0;i<sku.length;i++){ 
-      h=(h*31 + sku.charCodeAt(i))>>>0; 
-    } 
-    return `hsl(${h%360},70%,55%)`; 
-  };
-  
-  // Top View (XY plane)
-  const renderTopView = () => {
-    const canvas = document.getElementById(topId);
-    if(!canvas) return;
-    const ctx = canvas.getContext('2d');
-    ctx.clearRect(0,0,canvas.width, canvas.height);
-    ctx.fillStyle = '#f8f8f8';
-    ctx.fillRect(0,0,canvas.width, canvas.height);
-    
-    const margin = 20;
-    const scaleX = (canvas.width-2*margin)/maxW;
-    const scaleY = (canvas.height-2*margin)/maxL;
-    const scale = Math.min(scaleX, scaleY);
-    
-    // Container outline
-    ctx.strokeStyle = '#999';
-    ctx.lineWidth = 2;
-    ctx.strokeRect(margin, margin, maxW*scale, maxL*scale);
-    
-    j.placements.forEach(p=>{
-      ctx.fillStyle = colorForSku(p.sku);
-      const x = margin + p.position_mm[0] * scale;
-      const y = margin + p.position_mm[1] * scale;
-      const w = p.size_mm[0] * scale;
-      const h = p.size_mm[1] * scale;
-      ctx.fillRect(x, y, w, h);
-      ctx.strokeStyle = '#000';
-      ctx.lineWidth = 1;
-      ctx.strokeRect(x, y, w, h);
-      
-      // SKU label
-      if(w > 30 && h > 15) {
-        ctx.fillStyle = '#000';
-        ctx.font = '8px Arial';
-        ctx.textAlign = 'center';
-        ctx.fillText(p.sku, x + w/2, y + h/2 + 3);
-      }
-    });
-    
-    ctx.fillStyle = '#333';
-    ctx.font = '12px Arial';
-    ctx.textAlign = 'left';
-    ctx.fillText(`${maxW}×${maxL}mm`, margin, canvas.height - 5);
-  };
-  
-  // Front View (XZ plane)
-  const renderFrontView = () => {
-    const canvas = document.getElementById(frontId);
-    if(!canvas) return;
-    const ctx = canvas.getContext('2d');
-    ctx.clearRect(0,0,canvas.width, canvas.height);
-    ctx.fillStyle = '#f8f8f8';
-    ctx.fillRect(0,0,canvas.width, canvas.height);
-    
-    const margin = 20;
-    const scaleX = (canvas.width-2*margin)/maxW;
-    const scaleZ = (canvas.height-2*margin)/maxH;
-    const scale = Math.min(scaleX, scaleZ);
-    
-    // Container outline
-    ctx.strokeStyle = '#999';
-    ctx.lineWidth = 2;
-    ctx.strokeRect(margin, margin, maxW*scale, maxH*scale);
-    
-    j.placements.forEach(p=>{
-      ctx.fillStyle = colorForSku(p.sku);
-      const x = margin + p.position_mm[0] * scale;
-      const z = margin + p.position_mm[2] * scale;
-      const w = p.size_mm[0] * scale;
-      const h = p.size_mm[2] * scale;
-      ctx.fillRect(x, z, w, h);
-      ctx.strokeStyle = '#000';
-      ctx.lineWidth = 1;
-      ctx.strokeRect(x, z, w, h);
-      
-      // SKU label
-      if(w > 30 && h > 15) {
-        ctx.fillStyle = '#000';
-        ctx.font = '8px Arial';
-        ctx.textAlign = 'center';
-        ctx.fillText(p.sku, x + w/2, z + h/2 + 3);
-      }
-    });
-    
-    ctx.fillStyle = '#333';
-    ctx.font = '12px Arial';
-    ctx.textAlign = 'left';
-    ctx.fillText(`${maxW}×${maxH}mm`, margin, canvas.height - 5);
-  };
-  
-  // Side View (YZ plane)
-  const renderSideView = () => {
-    const canvas = document.getElementById(sideId);
-    if(!canvas) return;
-    const ctx = canvas.getContext('2d');
-    ctx.clearRect(0,0,canvas.width, canvas.height);
-    ctx.fillStyle = '#f8f8f8';
-    ctx.fillRect(0,0,canvas.width, canvas.height);
-    
-    const margin = 20;
-    const scaleY = (canvas.width-2*margin)/maxL;
-    const scaleZ = (canvas.height-2*margin)/maxH;
-    const scale = Math.min(scaleY, scaleZ);
-    
-    // Container outline
-    ctx.strokeStyle = '#999';
-    ctx.lineWidth = 2;
-    ctx.strokeRect(margin, margin, maxL*scale, maxH*scale);
-    
-    j.placements.forEach(p=>{
-      ctx.fillStyle = colorForSku(p.sku);
-      const y = margin + p.position_mm[1] * scale;
-      const z = margin + p.position_mm[2] * scale;
-      const l = p.size_mm[1] * scale;
-      const h = p.size_mm[2] * scale;
-      ctx.fillRect(y, z, l, h);
-      ctx.strokeStyle = '#000';
-      ctx.lineWidth = 1;
-      ctx.strokeRect(y, z, l, h);
-      
-      // SKU label
-      if(l > 30 && h > 15) {
-        ctx.fillStyle = '#000';
-        ctx.font = '8px Arial';
-        ctx.textAlign = 'center';
-        ctx.fillText(p.sku, y + l/2, z + h/2 + 3);
-      }
-    });
-    
-    ctx.fillStyle = '#333';
-    ctx.font = '12px Arial';
-    ctx.textAlign = 'left';
-    ctx.fillText(`${maxL}×${maxH}mm`, margin, canvas.height - 5);
-  };
-  
-  renderTopView();
-  renderFrontView();
-  renderSideView();
-}
 
-function render3D(j){
-  const el = document.getElementById('viz3d');
-  el.innerHTML = '';
-  
-  if(!j || !j.success) {
-    el.innerHTML = '<p>No packing result to visualize</p>';
-    return;
-  }
-  
-  console.log('Starting 3D render with data:', j);
-  
-  // Handle multi-container results
-  if(j.container_count > 1 && j.containers) {
-    renderMultiContainer3D(j, el);
-    return;
-  }
-  
-  // Handle single container (legacy format)
-  if(!j.box_id || !Array.isArray(j.placements) || j.placements.length === 0) {
-    el.innerHTML = '<p>No placements to visualize</p>';
-    return;
-  }
-  
-  renderSingleContainer3D(j, el);
-}
+def try_aggressive_partial_packing(products: List[Product], sorted_containers: List[Tuple[Container, float]]) -> Optional[List[Tuple[Container, PackedContainer]]]:
+	"""
+	Optimized partial packing with smart container selection and utilization maximization.
+	Each round fills one container via bin_completion_select; sorted_containers comes
+	from sort_containers_by_efficiency, which callers compute once per container set.
+	"""
+	# Sort products by volume (smallest first for better packing)
+	item_dims = np.array([(p.width_mm, p.length_mm, p.height_mm) for p in products], dtype=np.float64).reshape(-1, 3)
+	item_volumes = item_dims[:, 0] * item_dims[:, 1] * item_dims[:, 2]
+	sorted_products = [products[i] for i in np.argsort(item_volumes, kind='stable')]
+	product_volumes = dict(zip((p.sku for p in products), item_volumes.tolist()))
+	volume_of = product_volumes.get
+	
+	remaining_products = sorted_products.copy()
+	packed_containers = []
+	max_containers = min(10, len(products))
+	
+	# Candidates need at least 40% utilization, so once the whole queue could not fill
+	# the smallest container that far, every further round would only drop items
+	smallest_capacity = min((volume for _, volume in sorted_containers if volume > 0), default=0.0) * 1000.0
+	
+	# pack() is deterministic and candidate subsets recur across rounds when the
+	# packed items were not in them, so results are memoized for this call
+	pack_cache: Dict[Tuple, Optional[PackedContainer]] = {}
+	
+	def cached_pack(group: List[Product], container: Container) -> Optional[PackedContainer]:
+		cache_key = (tuple(id(p) for p in group), id(container))
+		if cache_key not in pack_cache:
+			pack_cache[cache_key] = pack(group, container)
+		return pack_cache[cache_key]
+	
+	iteration = 0
+	while remaining_products and iteration < max_containers:
+		iteration += 1
+		
+		if sum(volume_of(p.sku, 0.0) for p in remaining_products) < 0.4 * smallest_capacity:
+			break
+		
+		selection = bin_completion_select(remaining_products, sorted_containers, volume_of, cached_pack)
+		
+		if not selection:
+			# Skip this iteration if we can't pack anything
+			if remaining_products:
+				remaining_products.pop(0)  # Remove first item to try with others
+			continue
+		else:
+			# Add this container to solution
+			best_container, best_pack, packed_positions = selection
+			packed_containers.append((best_container, best_pack))
+			
+			# Remove packed items in one pass by queue position (SKUs can repeat), no walk over placements
+			packed_positions = set(packed_positions)
+			remaining_products = [p for i, p in enumerate(remaining_products) if i not in packed_positions]
+	
+	# Return partial result if we packed at least 5% of items (dropped items do not count)
+	packed_item_count = sum(len(packed.placements) for _, packed in packed_containers)
+	success_threshold = max(1, len(products) * 0.05)
+	
+	if packed_containers and packed_item_count >= success_threshold:
+		return packed_containers
+	
+	return None
 
-function renderMultiContainer3D(j, el) {
-  console.log('Rendering multi-container 3D view:', j.containers.length, 'containers');
-  
-  // Create premium header with gradient and stats
-  const header = document.createElement('div');
-  header.style.padding = '30px';
-  header.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-  header.style.color = 'white';
-  header.style.borderRadius = '16px 16px 0 0';
-  header.style.boxShadow = '0 4px 20px rgba(102, 126, 234, 0.3)';
-  header.innerHTML = `
-    <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 20px;">
-      <div style="display: flex; align-items: center; gap: 15px;">
-        <div style="width: 56px; height: 56px; background: rgba(255,255,255,0.2); border-radius: 14px; display: flex; align-items: center; justify-content: center; font-size: 28px; backdrop-filter: blur(10px); box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-          📦
-        </div>
-        <div>
-          <div style="font-size: 28px; font-weight: 800; letter-spacing: -0.5px; margin-bottom: 4px;">
-            Multi-Container Solution
-          </div>
-          <div style="font-size: 14px; opacity: 0.9; font-weight: 500;">
-            Optimized packing across ${j.containers.length} containers
-          </div>
-        </div>
-      </div>
-      <div style="text-align: right;">
-        <div style="background: rgba(255,255,255,0.25); padding: 8px 18px; border-radius: 20px; font-size: 24px; font-weight: 700; backdrop-filter: blur(10px); box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-          ${j.containers.length} Boxes
-        </div>
-      </div>
-    </div>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 12px;">
-      <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 14px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-        <div style="font-size: 11px; font-weight: 600; opacity: 0.8; margin-bottom: 4px; text-transform: uppercase; letter-spacing: 0.5px;">Total Items</div>
-        <div style="font-size: 26px; font-weight: 700;">${j.total_items}</div>
-      </div>
-      <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 14px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-        <div style="font-size: 11px; font-weight: 600; opacity: 0.8; margin-bottom: 4px; text-transform: uppercase; letter-spacing: 0.5px;">Avg Utilization</div>
-        <div style="font-size: 26px; font-weight: 700;">${(j.utilization*100).toFixed(1)}%</div>
-      </div>
-      <div style="background: rgba(255,255,255,0.15); backdrop-filter: blur(10px); padding: 14px; border-radius: 12px; border: 1px solid rgba(255,255,255,0.2);">
-        <div style="font-size: 11px; font-weight: 600; opacity: 0.8; margin-bottom: 4px; text-transform: uppercase; letter-spacing: 0.5px;">Total Price</div>
-        <div style="font-size: 26px; font-weight: 700;">${j.total_price.toFixed(2)}₺</div>
-      </div>
-    </div>
-  `;
-  el.appendChild(header);
-  
-  // Create container for all 3D views
-  const containersDiv = document.createElement('div');
-  containersDiv.style.display = 'flex';
-  containersDiv.style.flexDirection = 'column';
-  containersDiv.style.gap = '24px';
-  containersDiv.style.padding = '24px';
-  containersDiv.style.background = 'linear-gradient(135deg, #f8fafc 0%, #ffffff 100%)';
-  containersDiv.style.borderRadius = '0 0 16px 16px';
-  el.appendChild(containersDiv);
-  
-  // Render each container
-  j.containers.forEach((container, index) => {
-    const containerDiv = document.createElement('div');
-    containerDiv.style.border = '2px solid rgba(102, 126, 234, 0.2)';
-    containerDiv.style.borderRadius = '16px';
-    containerDiv.style.overflow = 'hidden';
-    containerDiv.style.background = 'white';
-    containerDiv.style.boxShadow = '0 4px 20px rgba(0, 0, 0, 0.08)';
-    containerDiv.style.transition = 'all 0.3s ease';
-    
-    // Add hover effect
-    containerDiv.addEventListener('mouseenter', () => {
-      containerDiv.style.transform = 'translateY(-2px)';
-      containerDiv.style.boxShadow = '0 8px 30px rgba(102, 126, 234, 0.15)';
-    });
-    containerDiv.addEventListener('mouseleave', () => {
-      containerDiv.style.transform = 'translateY(0)';
-      containerDiv.style.boxShadow = '0 4px 20px rgba(0, 0, 0, 0.08)';
-    });
-    
-    // Container header with premium design
-    const containerHeader = document.createElement('div');
-    const utilization = container.utilization * 100;
-    const utilizationColor = utilization >= 70 ? '#10b981' : utilization >= 60 ? '#f59e0b' : '#ef4444';
-    
-    containerHeader.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-    containerHeader.style.color = 'white';
-    containerHeader.style.padding = '20px 24px';
-    containerHeader.style.position = 'relative';
-    containerHeader.style.overflow = 'hidden';
-    
-    containerHeader.innerHTML = 
-      '<div style="position: absolute; top: 0; left: 0; right: 0; height: 4px; background: linear-gradient(90deg, ' + utilizationColor + ' ' + utilization + '%, rgba(255,255,255,0.2) ' + utilization + '%);"></div>' +
-      '<div style="display: flex; align-items: center; justify-content: space-between; margin-top: 4px;">' +
-        '<div style="display: flex; align-items: center; gap: 16px;">' +
-          '<div style="width: 48px; height: 48px; background: rgba(255,255,255,0.2); border-radius: 12px; display: flex; align-items: center; justify-content: center; font-size: 22px; font-weight: 700; backdrop-filter: blur(10px); box-shadow: 0 2px 10px rgba(0,0,0,0.1);">' +
-            (index + 1) +
-          '</div>' +
-          '<div>' +
-            '<div style="font-size: 20px; font-weight: 700; letter-spacing: -0.3px; margin-bottom: 4px;">' +
-              (container.container_name || 'Unknown') +
-            '</div>' +
-            '<div style="font-size: 13px; opacity: 0.9; font-weight: 500;">' +
-              (container.shipping_company || 'Unknown') + ' • ' + container.placements.length + ' items' +
-            '</div>' +
-          '</div>' +
-        '</div>' +
-        '<div style="text-align: right;">' +
-          '<div style="background: ' + utilizationColor + '; padding: 8px 16px; border-radius: 20px; font-size: 18px; font-weight: 700; box-shadow: 0 2px 10px rgba(0,0,0,0.15); margin-bottom: 4px;">' +
-            utilization.toFixed(1) + '%' +
-          '</div>' +
-          '<div style="font-size: 13px; opacity: 0.9; font-weight: 600;">' +
-            (container.price_try || 0).toFixed(2) + '₺' +
-          '</div>' +
-        '</div>' +
-      '</div>';
-    containerDiv.appendChild(containerHeader);
-    
-    // 3D view for this container - better quality size
-    const viz3dDiv = document.createElement('div');
-    viz3dDiv.style.width = '100%';
-    viz3dDiv.style.height = '450px';
-    viz3dDiv.id = `viz3d_${index}`;
-    containerDiv.appendChild(viz3dDiv);
-    
-    containersDiv.appendChild(containerDiv);
-    
-    // Render this container's 3D view with minimal delay
-    setTimeout(() => {
-      const containerData = {
-        box_id: container.container_id,
-        container_name: container.container_name,
-        shipping_company: container.shipping_company,
-        placements: container.placements,
-        utilization: container.utilization,
-        container_volume_cm3: container.container_volume_cm3,
-        remaining_volume_cm3: container.remaining_volume_cm3,
-        price_try: container.price_try,
-        inner_w_mm: container.inner_w_mm,
-        inner_l_mm: container.inner_l_mm,
-        inner_h_mm: container.inner_h_mm,
-        success: true
-      };
-      renderSingleContainer3D(containerData, viz3dDiv);
-    }, 50 * index);
-  });
-}
 
-function renderSingleContainer3D(j, el) {
-  console.log('Rendering single container 3D view');
-  
-  // Interactive 3D visualization with mouse controls
-  try {
-    // Create container for canvas and controls
-    const container = document.createElement('div');
-    container.style.position = 'relative';
-    container.style.width = '100%';
-    container.style.height = el.style.height || '600px';
-    container.style.background = 'linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%)';
-    container.style.borderRadius = '12px';
-    container.style.boxShadow = '0 8px 32px rgba(0,0,0,0.3)';
-    container.style.overflow = 'hidden';
-    el.appendChild(container);
-    
-    const canvas = document.createElement('canvas');
-    // Better balance between performance and quality with high-DPI support
-    const containerWidth = container.clientWidth || 800;
-    const containerHeight = parseInt(el.style.height) || 600;
-    const pixelRatio = Math.min(window.devicePixelRatio || 1, 2); // Cap at 2x for performance
-    
-    const displayWidth = Math.min(containerWidth, 900);
-    const displayHeight = Math.min(containerHeight, 500);
-    
-    canvas.width = displayWidth * pixelRatio;
-    canvas.height = displayHeight * pixelRatio;
-    canvas.style.width = displayWidth + 'px';
-    canvas.style.height = displayHeight + 'px';
-    canvas.style.cursor = 'grab';
-    canvas.style.display = 'block';
-    container.appendChild(canvas);
-    
-    // Get canvas context and scale for high-DPI displays
-    const ctx = canvas.getContext('2d');
-    ctx.scale(pixelRatio, pixelRatio);
-    
-    // Add premium control panel
-    const controlPanel = document.createElement('div');
-    controlPanel.style.position = 'absolute';
-    controlPanel.style.top = '20px';
-    controlPanel.style.right = '20px';
-    controlPanel.style.background = 'linear-gradient(135deg, rgba(255,255,255,0.98) 0%, rgba(248,250,252,0.98) 100%)';
-    controlPanel.style.backdropFilter = 'blur(20px)';
-    controlPanel.style.padding = '20px';
-    controlPanel.style.borderRadius = '16px';
-    controlPanel.style.boxShadow = '0 8px 32px rgba(0,0,0,0.12), 0 2px 8px rgba(0,0,0,0.08)';
-    controlPanel.style.border = '1px solid rgba(102, 126, 234, 0.1)';
-    controlPanel.style.fontFamily = 'Inter, -apple-system, BlinkMacSystemFont, sans-serif';
-    controlPanel.style.fontSize = '13px';
-    controlPanel.style.minWidth = '200px';
-    controlPanel.style.transition = 'all 0.3s ease';
-    container.appendChild(controlPanel);
-    
-    // Use actual container dimensions from the API response
-    let maxW, maxL, maxH;
-    
-    if(j.inner_w_mm && j.inner_l_mm && j.inner_h_mm) {
-      // Use exact container dimensions from the database
-      maxW = j.inner_w_mm;
-      maxL = j.inner_l_mm;
-      maxH = j.inner_h_mm;
-      console.log(`Using actual container dimensions: ${maxW}×${maxL}×${maxH}mm`);
-    } else {
-      // Fallback: calculate from placements (old method)
-      maxW = 0;
-      maxL = 0; 
-      maxH = 0;
-      j.placements.forEach(p=>{ 
-        maxW = Math.max(maxW, p.position_mm[0]+p.size_mm[0]); 
-        maxL = Math.max(maxL, p.position_mm[1]+p.size_mm[1]); 
-        maxH = Math.max(maxH, p.position_mm[2]+p.size_mm[2]); 
-      });
-      console.log(`Using calculated dimensions from placements: ${maxW}×${maxL}×${maxH}mm`);
-    }
-    
-    // 3D view state with smooth animation - improved zoom and performance
-    let rotationX = 0.5;
-    let rotationY = 0.8;
-    let targetRotationX = 0.5;
-    let targetRotationY = 0.8;
-    let scale = Math.min(300/Math.max(maxW, maxL), 200/maxH) * 1.2; // Increased zoom from 0.6 to 1.2
-    let targetScale = scale;
-    // Use display dimensions for offset, not canvas dimensions
-    let offsetX = displayWidth/2;
-    let offsetY = displayHeight/2;
-    let isDragging = false;
-    let lastMouseX = 0;
-    let lastMouseY = 0;
-    let autoRotate = false;
-    let animationTime = 0;
-    let isVisible = true; // Start as visible
-    
-    // 3D projection with rotation
-    const project3D = (x, y, z) => {
-      // Center coordinates
-      const cx = x - maxW/2;
-      const cy = y - maxL/2;
-      const cz = z - maxH/2;
-      
-      // Apply rotations
-      const cosX = Math.cos(rotationX), sinX = Math.sin(rotationX);
-      const cosY = Math.cos(rotationY), sinY = Math.sin(rotationY);
-      
-      // Rotate around X axis
-      const y1 = cy * cosX - cz * sinX;
-      const z1 = cy * sinX + cz * cosX;
-      
-      // Rotate around Y axis
-      const x2 = cx * cosY + z1 * sinY;
-      const z2 = -cx * sinY + z1 * cosY;
-      
-      // Project to 2D
-      const px = x2 * scale + offsetX;
-      const py = -y1 * scale + offsetY;
-      
-      return [px, py, z2];
-    };
-    
-    // Enhanced color with lighting
-    const colorForSku = (sku, lightIntensity = 1.0) => {
-      let h = 0;
-      for(let i = 0; i < sku.length; i++){
-        h = (h * 31 + sku.charCodeAt(i)) >>> 0;
-      }
-      const saturation = 75;
-      const baseLightness = 50;
-      const lightness = Math.min(90, Math.max(20, baseLightness * lightIntensity));
-      return `hsl(${h % 360}, ${saturation}%, ${lightness}%)`;
-    };
-    
-    // Calculate lighting based on face normal
-    const calculateLighting = (face, corners) => {
-      // Simple lighting from top-right-front
-      const lightDir = [0.5, -0.3, 0.8];
-      const normalize = (v) => {
-        const len = Math.sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2]);
-        return len > 0 ? [v[0]/len, v[1]/len, v[2]/len] : [0,0,0];
-      };
-      
-      // Calculate face normal (simplified)
-      const faceNormals = [
-        [0, 0, -1],  // bottom
-        [0, 0, 1],   // top
-        [0, -1, 0],  // front
-        [0, 1, 0],   // back
-        [-1, 0, 0],  // left
-        [1, 0, 0]    // right
-      ];
-      
-      const normal = faceNormals[face] || [0, 0, 1];
-      
-      // Rotate normal with same rotation as object
-      const cosX = Math.cos(rotationX), sinX = Math.sin(rotationX);
-      const cosY = Math.cos(rotationY), sinY = Math.sin(rotationY);
-      
-      const ny = normal[1] * cosX - normal[2] * sinX;
-      const nz = normal[1] * sinX + normal[2] * cosX;
-      const nx = normal[0] * cosY + nz * sinY;
-      
-      // Dot product for lighting
-      const dot = nx * lightDir[0] + ny * lightDir[1] + nz * lightDir[2];
-      return 0.5 + 0.5 * Math.max(0, dot); // Range 0.5 to 1.0
-    };
-    
-    // Instance-specific controls using unique IDs
-    const instanceId = 'view_' + Math.random().toString(36).substr(2, 9);
-    const resetBtnId = 'resetBtn_' + instanceId;
-    const autoRotateBtnId = 'autoRotateBtn_' + instanceId;
-    
-    // Update control panel with unique IDs - premium design
-    controlPanel.innerHTML = `
-      <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 18px;">
-        <div style="width: 36px; height: 36px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.25);">
-          <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <circle cx="12" cy="12" r="3"></circle>
-            <path d="M12 1v6m0 6v6m-5.2-5.2l4.2 4.2m4.2-4.2l-4.2 4.2"></path>
-          </svg>
-        </div>
-        <div>
-          <div style="font-weight: 700; color: #1e293b; font-size: 15px; letter-spacing: -0.2px;" data-tr="Kontroller" data-en="Controls">Kontroller</div>
-          <div style="font-size: 11px; color: #64748b; font-weight: 500; margin-top: 2px;" data-tr="3D Etkileşim" data-en="3D Interaction">3D Etkileşim</div>
-        </div>
-      </div>
-      
-      <div style="margin: 0; display: flex; flex-direction: column; gap: 10px; margin-bottom: 18px;">
-        <button id="${resetBtnId}" style="width: 100%; padding: 12px 16px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border: none; border-radius: 10px; cursor: pointer; font-weight: 600; font-size: 13px; box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3); transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1); display: flex; align-items: center; justify-content: center; gap: 8px;">
-          <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <polyline points="23 4 23 10 17 10"></polyline>
-            <path d="M20.49 15a9 9 0 1 1-2.12-9.36L23 10"></path>
-          </svg>
-          <span data-tr="Görünümü Sıfırla" data-en="Reset View">Görünümü Sıfırla</span>
-        </button>
-        <button id="${autoRotateBtnId}" style="width: 100%; padding: 12px 16px; background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; border: none; border-radius: 10px; cursor: pointer; font-weight: 600; font-size: 13px; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3); transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1); display: flex; align-items: center; justify-content: center; gap: 8px;">
-          <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <path d="M21.5 2v6h-6M2.5 22v-6h6M2 11.5a10 10 0 0 1 18.8-4.3M22 12.5a10 10 0 0 1-18.8 4.2"></path>
-          </svg>
-          <span data-tr="Otomatik Döndür" data-en="Auto Rotate">Otomatik Döndür</span>
-        </button>
-      </div>
-      
-      <div style="background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); padding: 14px; border-radius: 10px; border: 1px solid #e2e8f0;">
-        <div style="font-size: 11px; font-weight: 600; color: #64748b; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 0.5px;" data-tr="Kısayollar" data-en="Shortcuts">Kısayollar</div>
-        <div style="color: #475569; font-size: 12px; line-height: 1.8; font-weight: 500;">
-          <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
-            <div style="min-width: 60px; padding: 4px 8px; background: white; border-radius: 6px; font-weight: 600; font-size: 11px; text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">Drag</div>
-            <div style="color: #64748b;" data-tr="Görünümü döndür" data-en="Rotate view">Görünümü döndür</div>
-          </div>
-          <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
-            <div style="min-width: 60px; padding: 4px 8px; background: white; border-radius: 6px; font-weight: 600; font-size: 11px; text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">Scroll</div>
-            <div style="color: #64748b;" data-tr="Yakınlaştır/Uzaklaştır" data-en="Zoom in/out">Yakınlaştır/Uzaklaştır</div>
-          </div>
-          <div style="display: flex; align-items: center; gap: 8px;">
-            <div style="min-width: 60px; padding: 4px 8px; background: white; border-radius: 6px; font-weight: 600; font-size: 11px; text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">Click</div>
-            <div style="color: #64748b;" data-tr="Ürün detayları" data-en="Item details">Ürün detayları</div>
-          </div>
-        </div>
-      </div>
-    `;
-    
-    // Attach event listeners to instance-specific buttons
-    document.getElementById(resetBtnId).addEventListener('click', () => {
-      targetRotationX = 0.5;
-      targetRotationY = 0.8;
-      targetScale = Math.min(300/Math.max(maxW, maxL), 200/maxH) * 1.2;
-    });
-    
-    document.getElementById(autoRotateBtnId).addEventListener('click', () => {
-      autoRotate = !autoRotate;
-      const btn = document.getElementById(autoRotateBtnId);
-      if(autoRotate) {
-        btn.style.background = 'linear-gradient(135deg, #ef4444 0%, #dc2626 100%)';
-        btn.style.boxShadow = '0 4px 12px rgba(239, 68, 68, 0.3)';
-        btn.innerHTML = `
-          <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <circle cx="12" cy="12" r="10"></circle>
-            <rect x="9" y="9" width="6" height="6"></rect>
-          </svg>
-          <span>Stop Rotation</span>
-        `;
-      } else {
-        btn.style.background = 'linear-gradient(135deg, #10b981 0%, #059669 100%)';
-        btn.style.boxShadow = '0 4px 12px rgba(16, 185, 129, 0.3)';
-        btn.innerHTML = `
-          <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-            <path d="M21.5 2v6h-6M2.5 22v-6h6M2 11.5a10 10 0 0 1 18.8-4.3M22 12.5a10 10 0 0 1-18.8 4.2"></path>
-          </svg>
-          <span data-tr="Otomatik Döndür" data-en="Auto Rotate">Otomatik Döndür</span>
-        `;
-      }
-    });
-    
-    // Add hover effects to buttons
-    const addButtonHoverEffect = (btnId) => {
-      const btn = document.getElementById(btnId);
-      btn.addEventListener('mouseenter', () => {
-        btn.style.transform = 'translateY(-2px)';
-        btn.style.boxShadow = '0 4px 12px rgba(0,0,0,0.2)';
-      });
-      btn.addEventListener('mouseleave', () => {
-        btn.style.transform = 'translateY(0)';
-      });
-    };
-    
-    addButtonHoverEffect(resetBtnId);
-    addButtonHoverEffect(autoRotateBtnId);
-    
-    // Render function with smooth animations
-    const render = () => {
-      // Smooth animation interpolation
-      if (autoRotate) {
-        targetRotationY += 0.01;
-        animationTime += 0.016;
-      }
-      
-      // Smooth camera movement - faster interpolation for better performance
-      rotationX += (targetRotationX - rotationX) * 0.25;
-      rotationY += (targetRotationY - rotationY) * 0.25;
-      scale += (targetScale - scale) * 0.25;
-      
-      // Clear with gradient background
-      const gradient = ctx.createLinearGradient(0, 0, 0, canvas.height);
-      gradient.addColorStop(0, '#1a1a2e');
-      gradient.addColorStop(0.5, '#16213e');
-      gradient.addColorStop(1, '#0f3460');
-      ctx.fillStyle = gradient;
-      ctx.fillRect(0, 0, canvas.width, canvas.height);
-      
-      // Add grid background
-      ctx.strokeStyle = 'rgba(255, 255, 255, 0.03)';
-      ctx.lineWidth = 1;
-      const gridSize = 30;
-      for (let x = 0; x < canvas.width; x += gridSize) {
-        ctx.beginPath();
-        ctx.moveTo(x, 0);
-        ctx.lineTo(x, canvas.height);
-        ctx.stroke();
-      }
-      for (let y = 0; y < canvas.height; y += gridSize) {
-        ctx.beginPath();
-        ctx.moveTo(0, y);
-        ctx.lineTo(canvas.width, y);
-        ctx.stroke();
-      }
-      
-      // Premium title with gradient effect
-      ctx.save();
-      
-      // Create gradient for title text
-      const titleGradient = ctx.createLinearGradient(20, 0, 400, 0);
-      titleGradient.addColorStop(0, '#ffffff');
-      titleGradient.addColorStop(1, '#e0e7ff');
-      
-      // Title shadow
-      ctx.shadowColor = 'rgba(0, 0, 0, 0.4)';
-      ctx.shadowBlur = 8;
-      ctx.shadowOffsetY = 2;
-      
-      // Main title
-      ctx.fillStyle = titleGradient;
-      ctx.font = '700 18px Inter, Arial';
-      ctx.letterSpacing = '0.5px';
-      ctx.fillText(localization && localization.t ? localization.t('3D_CONTAINER_VIEW') : '3D CONTAINER VIEW', 20, 32);
-      
-      // Subtitle with container info
-      ctx.shadowBlur = 4;
-      ctx.fillStyle = 'rgba(255, 255, 255, 0.7)';
-      ctx.font = '400 12px Inter, Arial';
-      ctx.fillText(`${j.container_name || 'Container'} | ${j.shipping_company || ''}`.trim(), 20, 50);
-      
-      ctx.restore();
-      
-      // Collect all faces for z-sorting
-      const faces = [];
-      
-      // Container faces - using exact container dimensions
-      const containerCorners = [
-        [0,0,0], [maxW,0,0], [maxW,maxL,0], [0,maxL,0],
-        [0,0,maxH], [maxW,0,maxH], [maxW,maxL,maxH], [0,maxL,maxH]
-      ];
-      
-      console.log(`Drawing container wireframe: ${maxW}×${maxL}×${maxH}mm`);
-      
-      const containerFaces = [
-        [0,1,2,3], [4,7,6,5], [0,4,5,1], [2,6,7,3], [0,3,7,4], [1,5,6,2]
-      ];
-      
-      containerFaces.forEach((face, idx) => {
-        const corners3d = face.map(i => project3D(...containerCorners[i]));
-        const avgZ = corners3d.reduce((sum, p) => sum + p[2], 0) / 4;
-        const lighting = calculateLighting(idx, corners3d);
-        faces.push({
-          type: 'container',
-          corners: corners3d,
-          z: avgZ,
-          color: `rgba(100, 150, 255, ${0.05 + lighting * 0.1})`,
-          stroke: `rgba(100, 200, 255, ${0.3 + lighting * 0.3})`
-        });
-      });
-      
-      // Item faces with lighting
-      j.placements.forEach((p, idx) => {
-        const x = p.position_mm[0];
-        const y = p.position_mm[1];
-        const z = p.position_mm[2];
-        const w = p.size_mm[0];
-        const l = p.size_mm[1];
-        const h = p.size_mm[2];
-        
-        const itemCorners = [
-          [x,y,z], [x+w,y,z], [x+w,y+l,z], [x,y+l,z],
-          [x,y,z+h], [x+w,y,z+h], [x+w,y+l,z+h], [x,y+l,z+h]
-        ];
-        
-        const itemFaces = [
-          [0,1,2,3], [4,7,6,5], [0,4,5,1], [2,6,7,3], [0,3,7,4], [1,5,6,2]
-        ];
-        
-        itemFaces.forEach((face, faceIdx) => {
-          const corners3d = face.map(i => project3D(...itemCorners[i]));
-          const avgZ = corners3d.reduce((sum, p) => sum + p[2], 0) / 4;
-          
-          // Calculate lighting for this face
-          const lighting = calculateLighting(faceIdx, corners3d);
-          const color = colorForSku(p.sku, lighting);
-          
-          faces.push({
-            type: 'item',
-            corners: corners3d,
-            z: avgZ,
-            color: color,
-            stroke: 'rgba(0, 0, 0, 0.4)',
-            sku: p.sku,
-            faceIdx: faceIdx,
-            lighting: lighting
-          });
-        });
-      });
-      
-      // Sort faces by z-depth (back to front)
-      faces.sort((a, b) => a.z - b.z);
-      
-      // Draw all faces with enhanced shadows and highlights
-      faces.forEach(face => {
-        ctx.save();
-        ctx.beginPath();
-        ctx.moveTo(face.corners[0][0], face.corners[0][1]);
-        for(let i = 1; i < face.corners.length; i++){
-          ctx.lineTo(face.corners[i][0], face.corners[i][1]);
-        }
-        ctx.closePath();
-        
-        if(face.type === 'container'){
-          // Container with glow effect
-          ctx.strokeStyle = face.stroke;
-          ctx.lineWidth = 2.5;
-          ctx.shadowColor = face.stroke;
-          ctx.shadowBlur = 8;
-          ctx.stroke();
-        } else {
-          // Items with shadow and highlight
-          ctx.shadowColor = 'rgba(0, 0, 0, 0.3)';
-          ctx.shadowBlur = 8;
-          ctx.shadowOffsetX = 2;
-          ctx.shadowOffsetY = 2;
-          ctx.fillStyle = face.color;
-          ctx.fill();
-          
-          // Add subtle highlight on top
-          if(face.lighting > 0.8) {
-            ctx.shadowBlur = 0;
-            ctx.shadowOffsetX = 0;
-            ctx.shadowOffsetY = 0;
-            ctx.fillStyle = 'rgba(255, 255, 255, 0.15)';
-            ctx.fill();
-          }
-          
-          ctx.strokeStyle = face.stroke;
-          ctx.lineWidth = 1.5;
-          ctx.shadowBlur = 0;
-          ctx.shadowOffsetX = 0;
-          ctx.shadowOffsetY = 0;
-          ctx.stroke();
-        }
-        ctx.restore();
-      });
-      
-      // Draw SKU labels with enhanced styling
-      ctx.save();
-      j.placements.forEach((p, idx) => {
-        const x = p.position_mm[0] + p.size_mm[0]/2;
-        const y = p.position_mm[1] + p.size_mm[1]/2;
-        const z = p.position_mm[2] + p.size_mm[2] + 5;
-        const [lx, ly, lz] = project3D(x, y, z);
-        
-        if(lz > 0 && p.size_mm[0] * scale > 30) { // Only draw if in front and item is large enough
-          // Label background
-          ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
-          ctx.font = 'bold 11px Arial';
-          ctx.textAlign = 'center';
-          const textWidth = ctx.measureText(p.sku).width;
-          ctx.fillRect(lx - textWidth/2 - 4, ly - 14, textWidth + 8, 18);
-          
-          // Label text with shadow
-          ctx.shadowColor = 'rgba(0, 0, 0, 0.8)';
-          ctx.shadowBlur = 3;
-          ctx.fillStyle = '#ffffff';
-          ctx.fillText(p.sku, lx, ly);
-        }
-      });
-      ctx.restore();
-      
-      // Premium stats panel
-      ctx.save();
-      
-      // Stats background with rounded corners effect
-      const panelX = 15;
-      const panelY = canvas.height - 100;
-      const panelWidth = canvas.width - 30;
-      const panelHeight = 85;
-      const panelRadius = 12;
-      
-      ctx.shadowColor = 'rgba(0, 0, 0, 0.3)';
-      ctx.shadowBlur = 15;
-      ctx.shadowOffsetY = 5;
-      
-      // Draw rounded rectangle background
-      ctx.fillStyle = 'rgba(0, 0, 0, 0.75)';
-      ctx.beginPath();
-      ctx.roundRect(panelX, panelY, panelWidth, panelHeight, panelRadius);
-      ctx.fill();
-      
-      ctx.shadowBlur = 0;
-      ctx.shadowOffsetY = 0;
-      ctx.textAlign = 'left';
-      
-      // Container name header
-      ctx.font = '600 15px Inter, Arial';
-      const headerGradient = ctx.createLinearGradient(25, 0, 400, 0);
-      headerGradient.addColorStop(0, '#60a5fa');
-      headerGradient.addColorStop(1, '#a78bfa');
-      ctx.fillStyle = headerGradient;
-      ctx.fillText(`${j.shipping_company || 'Container'} ${j.container_name || ''}`.trim(), 25, canvas.height - 73);
-      
-      // Stats line 1
-      ctx.font = '400 12px Inter, Arial';
-      ctx.fillStyle = '#e5e7eb';
-      ctx.fillText(`Dimensions: ${maxW}×${maxL}×${maxH}mm`, 25, canvas.height - 53);
-      
-      // Stats line 2
-      ctx.fillText(`Items: ${j.placements.length} | Utilization: ${(j.utilization*100).toFixed(1)}%`, 25, canvas.height - 38);
-      
-      // Utilization bar
-      const barX = 25;
-      const barY = canvas.height - 25;
-      const barWidth = 200;
-      const barHeight = 10;
-      
-      ctx.fillStyle = 'rgba(255, 255, 255, 0.2)';
-      ctx.fillRect(barX, barY, barWidth, barHeight);
-      
-      const utilPercent = Math.min(1, j.utilization);
-      const barGradient = ctx.createLinearGradient(barX, 0, barX + barWidth, 0);
-      barGradient.addColorStop(0, '#4fc3f7');
-      barGradient.addColorStop(0.5, '#29b6f6');
-      barGradient.addColorStop(1, '#03a9f4');
-      ctx.fillStyle = barGradient;
-      ctx.fillRect(barX, barY, barWidth * utilPercent, barHeight);
-      
-      ctx.fillStyle = '#e5e7eb';
-      ctx.font = '400 11px Inter, Arial';
-      ctx.fillText(`Price: ${(j.price_try || 0).toFixed(2)}₺ • Volume: ${(j.container_volume_cm3/1000).toFixed(1)}L`, barX + barWidth + 15, barY + 8);
-      
-      ctx.restore();
-    };
-    
-    // Mouse controls with smooth interaction
-    canvas.addEventListener('mousedown', (e) => {
-      isDragging = true;
-      canvas.style.cursor = 'grabbing';
-      lastMouseX = e.clientX;
-      lastMouseY = e.clientY;
-    });
-    
-    canvas.addEventListener('mousemove', (e) => {
-      if(isDragging){
-        const deltaX = e.clientX - lastMouseX;
-        const deltaY = e.clientY - lastMouseY;
-        
-        targetRotationY += deltaX * 0.01;
-        targetRotationX += deltaY * 0.01;
-        
-        // Clamp rotation
-        targetRotationX = Math.max(-Math.PI/2, Math.min(Math.PI/2, targetRotationX));
-        
-        lastMouseX = e.clientX;
-        lastMouseY = e.clientY;
-      }
-    });
-    
-    canvas.addEventListener('mouseup', () => {
-      isDragging = false;
-      canvas.style.cursor = 'grab';
-    });
-    
-    canvas.addEventListener('mouseleave', () => {
-      isDragging = false;
-      canvas.style.cursor = 'grab';
-    });
-    
-    // Smooth zoom with mouse wheel
-    canvas.addEventListener('wheel', (e) => {
-      e.preventDefault();
-      const zoomFactor = e.deltaY > 0 ? 0.9 : 1.1;
-      targetScale *= zoomFactor;
-      targetScale = Math.max(0.1, Math.min(5.0, targetScale));
-    });
-    
-    // Optimized animation loop - render immediately then optimize
-    let animationFrameId;
-    let lastRenderTime = 0;
-    const targetFPS = 45; // Balanced FPS for good quality and performance
-    const frameInterval = 1000 / targetFPS;
-    
-    const animate = (currentTime = 0) => {
-      if (!isVisible && !autoRotate && !isDragging) {
-        // Pause animation when not visible and not interacting
-        animationFrameId = requestAnimationFrame(animate);
-        return;
-      }
-      
-      const deltaTime = currentTime - lastRenderTime;
-      
-      if (deltaTime >= frameInterval) {
-        // Only render if something has changed or auto-rotate is on
-        const hasMovement = Math.abs(targetRotationX - rotationX) > 0.001 || 
-                           Math.abs(targetRotationY - rotationY) > 0.001 || 
-                           Math.abs(targetScale - scale) > 0.001 || 
-                           autoRotate;
-        
-        if (hasMovement || isDragging) {
-          render();
-          lastRenderTime = currentTime;
-        }
-      }
-      
-      animationFrameId = requestAnimationFrame(animate);
-    };
-    
-    // Intersection Observer for performance optimization (non-blocking)
-    const observer = new IntersectionObserver((entries) => {
-      entries.forEach(entry => {
-        isVisible = entry.isIntersecting;
-      });
-    }, { threshold: 0.1 });
-    
-    observer.observe(container);
-    
-    // Initial render and start animation immediately
-    render();
-    animate();
-    
-    // Cleanup on modal close
-    window.addEventListener('beforeunload', () => {
-      if(animationFrameId) {
-        cancelAnimationFrame(animationFrameId);
-      }
-    });
-    
-    console.log('Interactive 3D visualization rendered successfully');
-    
-  } catch (error) {
-    console.error('3D render error:', error);
-    el.innerHTML = '<p>Error rendering 3D: ' + error.message + '</p>';
-  }
-}
-</script>
-</body>
-</html>
-"""
+@app.get("/static/localization.js")
+def get_localization():
+	"""Serve the localization JavaScript file"""
+	localization_path = os.path.join(os.path.dirname(__file__), "localization.js")
+	with open(localization_path, 'r', encoding='utf-8') as f:
+		content = f.read()
+	return HTMLResponse(content=content, media_type="application/javascript")
+
+# The UI page is rendered once at import; it takes no per-request context yet, so the
+# result is also encoded, compressed and fingerprinted once
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+try:
+	from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+	_template_env = Environment(
+		loader=FileSystemLoader(_TEMPLATES_DIR),
+		autoescape=select_autoescape(["html"]),
+		bytecode_cache=FileSystemBytecodeCache(),
+		keep_trailing_newline=True,
+	)
+	_INDEX_BYTES = _template_env.get_template("index.html").render().encode("utf-8")
+except ImportError:  # jinja2 is optional while the template has no placeholders
+	with open(os.path.join(_TEMPLATES_DIR, "index.html"), "rb") as _index_file:
+		_INDEX_BYTES = _index_file.read()
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, compresslevel=9, mtime=0)
+_INDEX_ETAG = '"' + hashlib.md5(_INDEX_BYTES).hexdigest() + '"'
+_INDEX_GZ_ETAG = _INDEX_ETAG[:-1] + '-gzip"'
+
+
+@app.get("/", response_class=HTMLResponse)
+def index(request: Request):
+	"""Serve the UI page, gzip-compressed when accepted, answering matching revalidations with 304"""
+	use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+	etag = _INDEX_GZ_ETAG if use_gzip else _INDEX_ETAG
+	headers = {"Cache-Control": "public, max-age=3600", "ETag": etag, "Vary": "Accept-Encoding"}
+	if request.headers.get("if-none-match") == etag:
+		return Response(status_code=304, headers=headers)
+	if use_gzip:
+		headers["Content-Encoding"] = "gzip"
+		return Response(content=_INDEX_GZ, media_type="text/html; charset=utf-8", headers=headers)
+	return Response(content=_INDEX_BYTES, media_type="text/html; charset=utf-8", headers=headers)
 
 
 @app.get("/health")
@@ -3916,101 +317,150 @@ def health():
 	return {"status": "ok"}
 
 
+def pack_cheapest(products: List[Product], containers: List[Container]) -> Optional[Tuple[Container, PackedContainer]]:
+	"""The cheapest container that pack() fits all products into, with its packing
+
+	Containers are tried cheapest-first (ties keep request order) and the search stops at the
+	first fit; with the process pool running the trials run concurrently but are consumed in
+	order, and the trials still queued are cancelled once one fits.
+	"""
+	ordered = sorted(containers, key=lambda c: c.price_try_safe)
+	pool = getattr(app.state, "pack_pool", None)
+	if pool is None or len(products) < PARALLEL_PACK_MIN_ITEMS or len(containers) < 2:
+		for c in ordered:
+			res = pack(products, c)
+			if res is not None:
+				return c, res
+		return None
+	futures = [pool.submit(pack, products, c) for c in ordered]
+	try:
+		for c, future in zip(ordered, futures):
+			res = future.result()
+			if res is not None:
+				return c, res
+		return None
+	finally:
+		for future in futures:
+			future.cancel()
+
+
 @app.post("/pack", response_model=PackResponse)
-def pack_endpoint(req: PackRequest) -> PackResponse:
-	products = [Product(**p.model_dump()) for p in req.products]
-	containers = [Container(**c.model_dump()) for c in req.containers]
-	best = None
-	best_price = None
-	for c in containers:
-		res = pack(products, c)
-		if res is None:
-			continue
-		price = c.price_try or 0.0
-		if best is None or price < best_price:
-			best = (c, res)
-			best_price = price
+def pack_endpoint(req: PackRequest) -> Response:
+	# The request models were validated at the API boundary, so their field values are copied
+	# straight into the packer's dataclasses without a dump/re-parse round trip
+	products = [Product(**p.__dict__) for p in req.products]
+	containers = [Container(**c.__dict__) for c in req.containers]
+	best = pack_cheapest(products, containers)
+	# The payload is built from already-validated values, so it is returned as a dict
+	# and serialized directly instead of being re-validated through PackResponse
 	if best is None:
-		return PackResponse(order_id=req.order_id, box_id=None, placements=[], utilization=0.0, price_try=None)
+		return DefaultResponse(PackResponseDict(order_id=req.order_id, box_id=None, placements=[], utilization=0.0, price_try=None))
 	c, res = best
-	placements: List[Placement] = [Placement(sku=it.sku, position_mm=it.position_mm, size_mm=it.size_mm, rotation=it.rotation) for it in res.placements]
-	total_item_volume = sum(it.size_mm[0]*it.size_mm[1]*it.size_mm[2] for it in res.placements) / 1000.0
+	placements: List[PlacementDict] = [
+		PlacementDict(sku=it.sku, position_mm=[float(v) for v in it.position_mm], size_mm=[float(v) for v in it.size_mm], rotation=list(it.rotation))
+		for it in res.placements
+	]
+	total_item_volume = placements_volume(res.placements) / 1000.0
 	container_volume = c.inner_w_mm*c.inner_l_mm*c.inner_h_mm / 1000.0
 	util = round(min(1.0, total_item_volume / container_volume), 4) if container_volume > 0 else 0.0
-	return PackResponse(order_id=req.order_id, box_id=c.box_id, placements=placements, utilization=util, price_try=c.price_try)
+	return DefaultResponse(PackResponseDict(order_id=req.order_id, box_id=c.box_id, placements=placements, utilization=util, price_try=c.price_try))
+
+
+def _container_catalog() -> Tuple[List[Container], List[Tuple[Container, float]]]:
+	"""Containers and their cost-efficiency order, kept on app.state until the CSV changes"""
+	stat = os.stat("data/container.csv")
+	stamp = (stat.st_mtime_ns, stat.st_size)
+	cached = getattr(app.state, "container_catalog", None)
+	if cached is None or cached[0] != stamp:
+		containers = load_containers_csv("data/container.csv")
+		cached = app.state.container_catalog = (stamp, containers, sort_containers_by_efficiency(containers))
+	return cached[1], cached[2]
+
+
+def _product_catalog() -> Tuple[List[Product], Dict[str, Product]]:
+	"""Products and the same products by SKU, kept on app.state until the CSV changes"""
+	stat = os.stat("data/products.csv")
+	stamp = (stat.st_mtime_ns, stat.st_size)
+	cached = getattr(app.state, "product_catalog", None)
+	if cached is None or cached[0] != stamp:
+		products = load_products_csv("data/products.csv")
+		cached = app.state.product_catalog = (stamp, products, {p.sku: p for p in products})
+	return cached[1], cached[2]
+
+
+def _expand_order_items(items, product_by_sku: Dict[str, Product]) -> List[Product]:
+	"""One product per ordered unit, in order; a single 400 names every unknown SKU"""
+	unknown = list(dict.fromkeys(item.sku for item in items if item.sku not in product_by_sku))
+	if unknown:
+		raise HTTPException(status_code=400, detail=f"Unknown SKU{'s' if len(unknown) > 1 else ''}: {', '.join(unknown)}")
+	return list(chain.from_iterable([product_by_sku[item.sku]] * int(item.quantity) for item in items))
 
 
 @app.post("/pack/order", response_model=OrderPackResponse)
 def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 	# Load master data
-	all_products = load_products_csv("data/products.csv")
-	product_by_sku = {p.sku: p for p in all_products}
-	containers = load_containers_csv("data/container.csv")
+	_, product_by_sku = _product_catalog()
+	containers, sorted_containers = _container_catalog()
 	
 	# Expand order items into individual product instances
-	products: List[Product] = []
-	for item in req.items:
-		if item.sku not in product_by_sku:
-			raise HTTPException(status_code=400, detail=f"Unknown SKU: {item.sku}")
-		for _ in range(int(item.quantity)):
-			products.append(product_by_sku[item.sku])
+	products = _expand_order_items(req.items, product_by_sku)
 	
 	# 🤖 ML-ENHANCED STRATEGY SELECTION
 	try:
 		# Get ML prediction for best strategy
 		predicted_strategy, confidence, features = strategy_predictor.predict_strategy(products, containers)
-		print(f"🤖 ML Prediction: {predicted_strategy} (confidence: {confidence:.2f})")
+		logger.debug("🤖 ML Prediction: %s (confidence: %.2f)", predicted_strategy, confidence)
 		
 		# 🚀 ENHANCED: Try the ML-recommended strategy with enhanced implementations
 		packing_result = None
 		if predicted_strategy == 'greedy':
-			print("🎯 Using Enhanced Greedy Strategy")
+			logger.debug("🎯 Using Enhanced Greedy Strategy")
 			packing_result = pack_greedy_max_utilization(products, containers)
 		elif predicted_strategy == 'best_fit':
-			print("🎯 Using Enhanced Best-Fit Strategy")
+			logger.debug("🎯 Using Enhanced Best-Fit Strategy")
 			packing_result = pack_best_fit(products, containers)
 		elif predicted_strategy == 'large_first':
-			print("🎯 Using Enhanced Large-First Strategy")
+			logger.debug("🎯 Using Enhanced Large-First Strategy")
 			packing_result = pack_largest_first_optimized(products, containers)
 		elif predicted_strategy == 'aggressive':
-			packing_result = try_aggressive_partial_packing(products, containers)
+			packing_result = try_aggressive_partial_packing(products, sorted_containers)
 		
 		# 🚀 ENHANCED: If ML strategy fails or confidence is low, use adaptive strategy selection
 		if not packing_result or confidence < 0.5:
 			if not packing_result:
-				print(f"🔄 ML strategy '{predicted_strategy}' failed to pack items, using adaptive strategy selection")
+				logger.debug("🔄 ML strategy '%s' failed to pack items, using adaptive strategy selection", predicted_strategy)
 			else:
-				print(f"🔄 ML strategy has low confidence ({confidence:.2f} < 0.5), using adaptive strategy selection")
+				logger.debug("🔄 ML strategy has low confidence (%.2f < 0.5), using adaptive strategy selection", confidence)
 			
 			# Use our enhanced adaptive strategy selection
 			packing_result = adaptive_strategy_selection(products, containers)
 			
 	except Exception as e:
-		print(f"⚠️ ML prediction failed: {e}, using adaptive strategy selection")
+		logger.warning("⚠️ ML prediction failed: %s, using adaptive strategy selection", e)
 		# 🚀 ENHANCED: Use adaptive strategy selection as fallback
 		packing_result = adaptive_strategy_selection(products, containers)
 	
 	if not packing_result:
 		# 🚀 ENHANCED: Try our enhanced strategies as fallback
-		print("🔄 No packing result, trying enhanced strategies...")
+		logger.debug("🔄 No packing result, trying enhanced strategies...")
 		
 		# Try optimized utilization packing first
-		print("🎯 Trying optimized utilization packing...")
+		logger.debug("🎯 Trying optimized utilization packing...")
 		packing_result = optimized_utilization_packing(products, containers)
 		
 		# If no result, try ensemble strategy
 		if not packing_result:
-			print("🔄 Trying ensemble strategy...")
+			logger.debug("🔄 Trying ensemble strategy...")
 			packing_result = ensemble_packing(products, containers)
 		
 		# If still no result, try genetic algorithm (temporarily disabled due to issues)
 		if not packing_result:
-			print("🔄 Genetic algorithm temporarily disabled, trying intelligent multi-container...")
+			logger.debug("🔄 Genetic algorithm temporarily disabled, trying intelligent multi-container...")
 			packing_result = find_optimal_multi_packing(products, containers)
 		
 		# If still no result, try intelligent multi-container packing
 		if not packing_result:
-			print("🔄 Trying intelligent multi-container packing...")
+			logger.debug("🔄 Trying intelligent multi-container packing...")
 			packing_result = find_optimal_multi_packing(products, containers)
 		
 		# Last resort: aggressive partial packing
@@ -4029,8 +479,8 @@ def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 			)
 			
 			if should_try_aggressive:
-				print(f"🔄 Trying aggressive partial packing (items: {len(products)}, volume: {total_volume:.1f}cm³, util: {utilization_ratio*100:.1f}%)")
-				partial_result = try_aggressive_partial_packing(products, containers)
+				logger.debug("🔄 Trying aggressive partial packing (items: %d, volume: %.1fcm³, util: %.1f%%)", len(products), total_volume, utilization_ratio*100)
+				partial_result = try_aggressive_partial_packing(products, sorted_containers)
 				if partial_result:
 					packing_result = partial_result
 			else:
@@ -4061,13 +511,13 @@ def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 	packed_skus = set()  # Track which SKUs were packed
 	
 	for container, packed_result in packing_result:
-		placements = [Placement(sku=it.sku, position_mm=it.position_mm, size_mm=it.size_mm, rotation=it.rotation) for it in packed_result.placements]
+		placements = [Placement.model_construct(sku=it.sku, position_mm=list(it.position_mm), size_mm=list(it.size_mm), rotation=list(it.rotation)) for it in packed_result.placements]
 		
 		# Track packed SKUs
 		for placement in placements:
 			packed_skus.add(placement.sku)
 		
-		total_item_volume_cm3 = sum(it.size_mm[0]*it.size_mm[1]*it.size_mm[2] for it in packed_result.placements) / 1000.0
+		total_item_volume_cm3 = placements_volume(packed_result.placements) / 1000.0
 		container_volume_cm3 = (container.inner_w_mm*container.inner_l_mm*container.inner_h_mm) / 1000.0
 		util = round(min(1.0, total_item_volume_cm3 / container_volume_cm3), 4) if container_volume_cm3 > 0 else 0.0
 		remaining = max(0.0, container_volume_cm3 - total_item_volume_cm3)
@@ -4082,16 +532,15 @@ def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 			utilization=util,
 			remaining_volume_cm3=remaining,
 			container_volume_cm3=container_volume_cm3,
-			price_try=container.price_try
+			price_try=container.price_try,
+			# Actual container dimensions
+			inner_w_mm=container.inner_w_mm,
+			inner_l_mm=container.inner_l_mm,
+			inner_h_mm=container.inner_h_mm
 		)
 		
-		# Add actual container dimensions to the result
-		container_result.inner_w_mm = container.inner_w_mm
-		container_result.inner_l_mm = container.inner_l_mm
-		container_result.inner_h_mm = container.inner_h_mm
-		
 		container_results.append(container_result)
-		total_price += container.price_try or 0.0
+		total_price += container.price_try_safe
 		total_items += len(placements)
 		all_placements.extend(placements)
 	
@@ -4103,8 +552,17 @@ def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 	first_container = packing_result[0][0]
 	first_result = container_results[0] if container_results else None
 	
+	# Container dimensions only for single container (for 3D visualization compatibility)
+	single_dims = {}
+	if len(packing_result) == 1:
+		single_dims = dict(
+			inner_w_mm=first_container.inner_w_mm,
+			inner_l_mm=first_container.inner_l_mm,
+			inner_h_mm=first_container.inner_h_mm
+		)
+	
 	# Create response with container dimensions for single container compatibility
-	response = OrderPackResponse(
+	return OrderPackResponse(
 		order_id=req.order_id,
 		success=True,
 		containers=container_results,
@@ -4121,23 +579,16 @@ def pack_order_endpoint(req: OrderPackRequest) -> OrderPackResponse:
 		used_container_id=first_container.box_id if len(packing_result) == 1 else f"MULTI-{len(packing_result)}",
 		container_name=first_container.box_name if len(packing_result) == 1 else f"{len(packing_result)} Containers",
 		shipping_company=first_container.shipping_company if len(packing_result) == 1 else "Multiple",
-		container_material=first_container.material if len(packing_result) == 1 else "Multiple"
+		container_material=first_container.material if len(packing_result) == 1 else "Multiple",
+		**single_dims
 	)
-	
-	# Add container dimensions for single container (for 3D visualization compatibility)
-	if len(packing_result) == 1:
-		response.inner_w_mm = first_container.inner_w_mm
-		response.inner_l_mm = first_container.inner_l_mm
-		response.inner_h_mm = first_container.inner_h_mm
-	
-	return response 
 
 
 @app.get("/containers")
 def list_containers(limit: int = 100):
     """List all available containers with their dimensions"""
     try:
-        containers = load_containers_csv("data/container.csv")
+        containers, _ = _container_catalog()
         
         container_list = []
         for container in containers[:limit]:
@@ -4159,11 +610,26 @@ def list_containers(limit: int = 100):
         raise HTTPException(status_code=500, detail=f"Error loading containers: {str(e)}")
 
 
-@app.get("/skus")
-def list_skus(q: str | None = None, limit: int = 20):
+def _sku_rows() -> Tuple[List[Tuple[Dict[str, str], str]], Dict[str, List[int]]]:
+    """
+    /skus rows with a lowercase search blob each, and the row positions of each SKU, kept on
+    app.state until the CSV changes, so the encoding probe, delimiter sniffing and synthetic
+    SKU hashing run once per file version
+    """
+    stat = os.stat("data/products.csv")
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = getattr(app.state, "sku_rows", None)
+    if cached is None or cached[0] != stamp:
+        rows = _read_sku_rows("data/products.csv")
+        positions: Dict[str, List[int]] = {}
+        for i, r in enumerate(rows):
+            positions.setdefault(r['sku'], []).append(i)
+        cached = app.state.sku_rows = (stamp, [(r, '\n'.join(r.values()).lower()) for r in rows], positions)
+    return cached[1], cached[2]
+
+
+def _read_sku_rows(path: str) -> List[Dict[str, str]]:
     # CSV-only reader; güvenli JSON için NaN/None → '' coerces
-    import csv, hashlib
-    path = "data/products.csv"
     encodings = ("utf-8-sig", "utf-8", "cp1254")
     for enc in encodings:
         try:
@@ -4193,57 +659,147 @@ def list_skus(q: str | None = None, limit: int = 20):
                         'variant': variant
                     }
                     out.append(row)
-                if q:
-                    qL = str(q).lower()
-                    out = [r for r in out
-                           if (qL in r['sku'].lower()
-                               or qL in r['brand'].lower()
-                               or qL in r['model'].lower()
-                               or qL in r['variant'].lower())]
-                # JSON-safe: her şey string, NaN yok
-                return out[:max(1, min(int(limit), 2000))]
+                return out
         except Exception:
             continue
     return []
 
 
+@app.get("/skus")
+def list_skus(q: str | None = None, limit: int = 20, offset: int = 0, skus: str | None = None):
+    try:
+        rows, positions = _sku_rows()
+    except OSError:
+        return []
+    if skus:
+        # Exact lookup for a comma-separated batch of SKUs, returned in file order
+        wanted = {part.strip() for part in skus.split(',') if part.strip()}
+        found = sorted(i for sku in wanted for i in positions.get(sku, ()))
+        return [rows[i][0] for i in found]
+    if q:
+        # The blob joins the fields with newlines, so a match never spans two fields
+        qL = str(q).lower()
+        out = [r for r, blob in rows if qL in blob]
+    else:
+        out = [r for r, _ in rows]
+    # JSON-safe: her şey string, NaN yok
+    start = max(0, int(offset))
+    return out[start:start + max(1, min(int(limit), 2000))]
+
+
 # Order Management Endpoints
+def _order_to_response(order: Order, api_items: Optional[List[APIOrderItem]] = None) -> OrderResponse:
+    """
+    Convert a domain order to its API model. Write paths pass the request's own API items when
+    they are the order's items, so those are not converted back.
+    Domain orders hold values that were validated on the way in or typed by the CSV loader, and
+    the API models share their field names, so the models are built without re-validation.
+    """
+    if api_items is None:
+        api_items = [APIOrderItem.model_construct(**vars(item)) for item in order.items]
+    return OrderResponse.model_construct(**dict(vars(order), items=api_items))
+
+
+ORDER_PAGE_TTL_S = 30.0
+# Serialized /orders pages kept per cached order list, least recently used dropped first; the
+# page size is clamped so clients cannot ask for arbitrarily large pages
+ORDER_PAGE_CACHE_SIZE = 16
+ORDER_PAGE_MAX_LIMIT = 500
+_order_pages_lock = threading.Lock()
+
+
+def _orders_stamp() -> Tuple[Tuple[int, int], ...]:
+    """Modification time and size of both order CSVs; raises FileNotFoundError like the loader"""
+    return tuple((st.st_mtime_ns, st.st_size) for st in map(os.stat, ("data/orders.csv", "data/order_items.csv")))
+
+
+def _cached_orders() -> Tuple[List[OrderResponse], Dict[str, OrderResponse], "OrderedDict[Tuple[int, int], Tuple[float, bytes]]"]:
+    """
+    API models for all stored orders, kept on app.state between requests, along with
+    the serialized /orders pages built from them.
+    The CSVs are re-read only when either file changes on disk (every write path
+    rewrites them), so reads stay in memory; raises FileNotFoundError like the loader.
+    """
+    stamp = _orders_stamp()
+    cached = getattr(app.state, "orders_cache", None)
+    if cached is None or cached[0] != stamp:
+        responses = [_order_to_response(order) for order in load_orders_csv("data/orders.csv", "data/order_items.csv")]
+        by_id = {}
+        for response in responses:
+            by_id.setdefault(response.order_id, response)
+        cached = app.state.orders_cache = (stamp, responses, by_id, OrderedDict())
+    return cached[1], cached[2], cached[3]
+
+
+def _cached_order_responses() -> Tuple[List[OrderResponse], Dict[str, OrderResponse]]:
+    """API models for all stored orders and the same models by order ID"""
+    responses, by_id, _ = _cached_orders()
+    return responses, by_id
+
+
+def _invalidate_orders_cache() -> None:
+    """Drop cached orders and pages after a write, even if the file stamps did not move"""
+    app.state.orders_cache = None
+
+
+def _cached_order_index() -> Dict[str, Order]:
+    """
+    Stored orders by ID for the single-order write paths, kept on app.state until either CSV
+    changes. The first order with an ID wins, as with a scan of the loaded list.
+    """
+    stamp = _orders_stamp()
+    cached = getattr(app.state, "order_index", None)
+    if cached is None or cached[0] != stamp:
+        index: Dict[str, Order] = {}
+        for order in load_orders_csv("data/orders.csv", "data/order_items.csv"):
+            index.setdefault(order.order_id, order)
+        cached = app.state.order_index = (stamp, index)
+    return cached[1]
+
+
+def _order_index_written(order_id: str, order: Optional[Order]) -> None:
+    """
+    Apply this process's write of one order (None for a delete) to the cached index and adopt
+    the new file stamps, so the write does not force a full reload on the next lookup
+    """
+    cached = getattr(app.state, "order_index", None)
+    if cached is None:
+        return
+    index = cached[1]
+    if order is None:
+        index.pop(order_id, None)
+    else:
+        index[order_id] = order
+    app.state.order_index = (_orders_stamp(), index)
+
+
 @app.get("/orders", response_model=OrderListResponse)
 def list_orders(limit: int = 50, offset: int = 0):
     """List all orders with optional filtering"""
     try:
-        orders = load_orders_csv("data/orders.csv", "data/order_items.csv")
+        orders, _, pages = _cached_orders()
+        limit = min(max(limit, 1), ORDER_PAGE_MAX_LIMIT)
+        offset = max(offset, 0)
+        key = (limit, offset)
         
+        # Pages are serialized once and served as bytes until they expire or the orders change
+        now = time.monotonic()
+        with _order_pages_lock:
+            page = pages.get(key)
+            if page is not None and now - page[0] <= ORDER_PAGE_TTL_S:
+                pages.move_to_end(key)
+                return Response(content=page[1], media_type="application/json")
         
         # Apply pagination
-        total_count = len(orders)
-        orders = orders[offset:offset + limit]
-        
-        # Convert to API format
-        api_orders = []
-        for order in orders:
-            api_items = [APIOrderItem(
-                sku=item.sku,
-                quantity=item.quantity,
-                unit_price_try=item.unit_price_try,
-                total_price_try=item.total_price_try
-            ) for item in order.items]
-            
-            api_orders.append(OrderResponse(
-                order_id=order.order_id,
-                customer_name=order.customer_name,
-                customer_email=order.customer_email,
-                order_date=order.order_date,
-                items=api_items,
-                total_items=order.total_items,
-                total_price_try=order.total_price_try,
-                shipping_company=order.shipping_company,
-                container_count=order.container_count,
-                utilization_avg=order.utilization_avg,
-                notes=order.notes
-            ))
-        
-        return OrderListResponse(orders=api_orders, total_count=total_count)
+        body = OrderListResponse(orders=orders[offset:offset + limit], total_count=len(orders)).model_dump_json().encode("utf-8")
+        with _order_pages_lock:
+            for stale in [k for k, (built, _) in pages.items() if now - built > ORDER_PAGE_TTL_S]:
+                del pages[stale]
+            pages[key] = (now, body)
+            pages.move_to_end(key)
+            while len(pages) > ORDER_PAGE_CACHE_SIZE:
+                pages.popitem(last=False)
+        return Response(content=body, media_type="application/json")
     
     except FileNotFoundError:
         return OrderListResponse(orders=[], total_count=0)
@@ -4255,32 +811,13 @@ def list_orders(limit: int = 50, offset: int = 0):
 def get_order(order_id: str):
     """Get a specific order by ID"""
     try:
-        orders = load_orders_csv("data/orders.csv", "data/order_items.csv")
-        order = next((o for o in orders if o.order_id == order_id), None)
+        _, orders_by_id = _cached_order_responses()
+        order = orders_by_id.get(order_id)
         
         if not order:
             raise HTTPException(status_code=404, detail=f"Order {order_id} not found")
         
-        api_items = [APIOrderItem(
-            sku=item.sku,
-            quantity=item.quantity,
-            unit_price_try=item.unit_price_try,
-            total_price_try=item.total_price_try
-        ) for item in order.items]
-        
-        return OrderResponse(
-            order_id=order.order_id,
-            customer_name=order.customer_name,
-            customer_email=order.customer_email,
-            order_date=order.order_date,
-            items=api_items,
-            total_items=order.total_items,
-            total_price_try=order.total_price_try,
-            shipping_company=order.shipping_company,
-            container_count=order.container_count,
-            utilization_avg=order.utilization_avg,
-            notes=order.notes
-        )
+        return order
     
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Orders database not found")
@@ -4293,7 +830,7 @@ def create_order(request: CreateOrderRequest):
     """Create a new order"""
     try:
         # Generate unique order ID
-        order_id = f"ORD-{uuid.uuid4().hex[:8].upper()}"
+        order_id = f"ORD-{secrets.token_hex(4).upper()}"
         
         # Convert API items to domain items
         items = [OrderItem(
@@ -4309,35 +846,17 @@ def create_order(request: CreateOrderRequest):
             customer_name=request.customer_name,
             customer_email=request.customer_email,
             order_date=datetime.now(),
-            status="pending",
             items=items,
             notes=request.notes
         )
         
-        # Save to CSV
-        save_order_to_csv(order, "data/orders.csv", "data/order_items.csv")
-        
-        # Return API response
-        api_items = [APIOrderItem(
-            sku=item.sku,
-            quantity=item.quantity,
-            unit_price_try=item.unit_price_try,
-            total_price_try=item.total_price_try
-        ) for item in order.items]
+        # Append to CSV; a new order ID never replaces a stored order
+        append_order_to_csv(order, "data/orders.csv", "data/order_items.csv")
+        _invalidate_orders_cache()
+        _order_index_written(order.order_id, order)
         
-        return OrderResponse(
-            order_id=order.order_id,
-            customer_name=order.customer_name,
-            customer_email=order.customer_email,
-            order_date=order.order_date,
-            items=api_items,
-            total_items=order.total_items,
-            total_price_try=order.total_price_try,
-            shipping_company=order.shipping_company,
-            container_count=order.container_count,
-            utilization_avg=order.utilization_avg,
-            notes=order.notes
-        )
+        # Return API response; the order's items are the request's
+        return _order_to_response(order, request.items)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating order: {str(e)}")
@@ -4347,13 +866,14 @@ def create_order(request: CreateOrderRequest):
 def update_order(order_id: str, request: UpdateOrderRequest):
     """Update an existing order"""
     try:
-        # Load existing orders
-        orders = load_orders_csv("data/orders.csv", "data/order_items.csv")
-        order = next((o for o in orders if o.order_id == order_id), None)
+        order = _cached_order_index().get(order_id)
         
         if not order:
             raise HTTPException(status_code=404, detail=f"Order {order_id} not found")
         
+        # Changes go to a copy, so the cached order stays as stored if saving fails
+        order = replace(order)
+        
         # Update fields if provided
         if request.customer_name is not None:
             order.customer_name = request.customer_name
@@ -4368,34 +888,18 @@ def update_order(order_id: str, request: UpdateOrderRequest):
                 unit_price_try=item.unit_price_try,
                 total_price_try=item.total_price_try
             ) for item in request.items]
-            # Recalculate totals
-            order.total_items = sum(item.quantity for item in order.items)
-            order.total_price_try = sum(item.total_price_try or 0 for item in order.items)
+            # Recalculate totals, summing in numpy since orders can run to thousands of lines
+            count = len(order.items)
+            order.total_items = int(np.fromiter((item.quantity for item in order.items), dtype=np.int64, count=count).sum())
+            order.total_price_try = float(np.fromiter((item.total_price_try or 0.0 for item in order.items), dtype=np.float64, count=count).sum())
         
         # Save updated order
         save_order_to_csv(order, "data/orders.csv", "data/order_items.csv")
+        _invalidate_orders_cache()
+        _order_index_written(order.order_id, order)
         
-        # Return API response
-        api_items = [APIOrderItem(
-            sku=item.sku,
-            quantity=item.quantity,
-            unit_price_try=item.unit_price_try,
-            total_price_try=item.total_price_try
-        ) for item in order.items]
-        
-        return OrderResponse(
-            order_id=order.order_id,
-            customer_name=order.customer_name,
-            customer_email=order.customer_email,
-            order_date=order.order_date,
-            items=api_items,
-            total_items=order.total_items,
-            total_price_try=order.total_price_try,
-            shipping_company=order.shipping_company,
-            container_count=order.container_count,
-            utilization_avg=order.utilization_avg,
-            notes=order.notes
-        )
+        # Return API response; new items are the request's, otherwise the stored ones are converted
+        return _order_to_response(order, request.items)
     
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Orders database not found")
@@ -4407,53 +911,10 @@ def update_order(order_id: str, request: UpdateOrderRequest):
 def delete_order(order_id: str):
 	"""Delete an order"""
 	try:
-		# Load existing orders
-		orders = load_orders_csv("data/orders.csv", "data/order_items.csv")
-		order = next((o for o in orders if o.order_id == order_id), None)
-		
-		if not order:
+		if not delete_order_from_csv(order_id, "data/orders.csv", "data/order_items.csv"):
 			raise HTTPException(status_code=404, detail=f"Order {order_id} not found")
-		
-		# Remove from list and save
-		orders = [o for o in orders if o.order_id != order_id]
-		
-		# Save all remaining orders
-		import pandas as pd
-		from pathlib import Path
-		
-		# Prepare data for saving
-		orders_data = []
-		items_data = []
-		
-		for order in orders:
-			orders_data.append({
-				'order_id': order.order_id,
-				'customer_name': order.customer_name,
-				'customer_email': order.customer_email,
-				'order_date': order.order_date.strftime('%Y-%m-%d %H:%M:%S'),
-				'total_items': order.total_items,
-				'total_price_try': order.total_price_try,
-				'shipping_company': order.shipping_company,
-				'container_count': order.container_count,
-				'utilization_avg': order.utilization_avg,
-				'notes': order.notes
-			})
-			
-			for item in order.items:
-				items_data.append({
-					'order_id': order.order_id,
-					'sku': item.sku,
-					'quantity': item.quantity,
-					'unit_price_try': item.unit_price_try,
-					'total_price_try': item.total_price_try
-				})
-		
-		# Save to CSV
-		orders_df = pd.DataFrame(orders_data)
-		items_df = pd.DataFrame(items_data)
-		
-		orders_df.to_csv("data/orders.csv", index=False)
-		items_df.to_csv("data/order_items.csv", index=False)
+		_invalidate_orders_cache()
+		_order_index_written(order_id, None)
 		
 		return {"message": f"Order {order_id} deleted successfully"}
 	
@@ -4465,6 +926,19 @@ def delete_order(order_id: str):
 
 # 🤖 ML STRATEGY PREDICTION ENDPOINTS
 
+def _rounded_feature_importance() -> Dict[str, float]:
+	"""
+	Feature importance of the strategy model as JSON-safe floats rounded to 3 places, kept on
+	app.state until the predictor holds a different model
+	"""
+	model = strategy_predictor.model
+	cached = getattr(app.state, "feature_importance", None)
+	if cached is None or cached[0] is not model:
+		rounded = {k: round(float(v), 3) for k, v in strategy_predictor.get_feature_importance().items()}
+		cached = app.state.feature_importance = (model, rounded)
+	return cached[1]
+
+
 @app.post("/predict-strategy")
 def predict_packing_strategy(req: OrderPackRequest):
 	"""
@@ -4474,35 +948,20 @@ def predict_packing_strategy(req: OrderPackRequest):
 	"""
 	try:
 		# Load master data
-		all_products = load_products_csv("data/products.csv")
-		product_by_sku = {p.sku: p for p in all_products}
-		containers = load_containers_csv("data/container.csv")
+		_, product_by_sku = _product_catalog()
+		containers, _ = _container_catalog()
 		
 		# Expand order items into individual product instances
-		products: List[Product] = []
-		for item in req.items:
-			if item.sku not in product_by_sku:
-				raise HTTPException(status_code=400, detail=f"Unknown SKU: {item.sku}")
-			for _ in range(int(item.quantity)):
-				products.append(product_by_sku[item.sku])
+		products = _expand_order_items(req.items, product_by_sku)
 		
 		# Get ML prediction
 		predicted_strategy, confidence, features = strategy_predictor.predict_strategy(products, containers)
 		
 		# Get feature importance if model is available
-		feature_importance = strategy_predictor.get_feature_importance()
+		safe_feature_importance = _rounded_feature_importance()
 		
 		# Ensure all numeric values are JSON-serializable
-		safe_features = {}
-		for k, v in features.items():
-			if isinstance(v, (int, float)):
-				safe_features[k] = round(float(v), 3)
-			else:
-				safe_features[k] = v
-		
-		safe_feature_importance = {}
-		for k, v in feature_importance.items():
-			safe_feature_importance[k] = round(float(v), 3)
+		safe_features = {k: round(float(v), 3) if isinstance(v, (int, float)) else v for k, v in features.items()}
 		
 		return {
 			"order_id": req.order_id,
@@ -4532,19 +991,16 @@ def train_ml_model(sample_size: int = 100):
 	"""
 	try:
 		# Load master data
-		all_products = load_products_csv("data/products.csv")
-		containers = load_containers_csv("data/container.csv")
+		all_products, _ = _product_catalog()
+		containers, _ = _container_catalog()
 		
-		# Generate sample orders for training
-		import random
-		random.seed(42)
-		
-		sample_orders = []
-		for i in range(sample_size):
-			# Create random order with 1-20 items
-			order_size = random.randint(1, 20)
-			order_products = random.choices(all_products, k=order_size)
-			sample_orders.append(order_products)
+		# Generate sample orders for training: random orders with 1-20 items. All sizes and product
+		# indices are drawn in two numpy calls, then split per order
+		rng = np.random.default_rng(42)
+		order_sizes = rng.integers(1, 21, size=sample_size)
+		picks = rng.integers(0, len(all_products), size=int(order_sizes.sum())).tolist()
+		ends = np.cumsum(order_sizes).tolist()
+		sample_orders = [[all_products[i] for i in picks[start:end]] for start, end in zip([0] + ends[:-1], ends)]
 		
 		# Generate training data
 		print(f"🔄 Generating training data from {sample_size} sample orders...")
@@ -4555,8 +1011,9 @@ def train_ml_model(sample_size: int = 100):
 		success = strategy_predictor.train_model(training_data)
 		
 		if success:
-			# Get feature importance
-			feature_importance = strategy_predictor.get_feature_importance()
+			# Get feature importance of the new model
+			app.state.feature_importance = None
+			feature_importance = _rounded_feature_importance()
 			
 			return {
 				"success": True,
@@ -4564,7 +1021,7 @@ def train_ml_model(sample_size: int = 100):
 				"training_samples": len(training_data),
 				"feature_count": len(strategy_predictor.feature_names),
 				"strategies": strategy_predictor.strategies,
-				"feature_importance": {k: round(v, 3) for k, v in feature_importance.items()},
+				"feature_importance": feature_importance,
 				"model_path": strategy_predictor.model_path
 			}
 		else:
@@ -4584,12 +1041,7 @@ def get_ml_status():
 	📊 Get ML model status and feature importance
 	"""
 	try:
-		feature_importance = strategy_predictor.get_feature_importance()
-		
-		# Ensure all numeric values are JSON-serializable
-		safe_feature_importance = {}
-		for k, v in feature_importance.items():
-			safe_feature_importance[k] = round(float(v), 3)
+		safe_feature_importance = _rounded_feature_importance()
 		
 		return {
 			"model_available": strategy_predictor.model is not None,
@@ -4645,37 +1097,36 @@ async def get_ml_performance():
 		raise HTTPException(status_code=500, detail=f"ML performance check failed: {str(e)}")
 
 
+_STRATEGY_EXPLANATIONS = {
+	'greedy': "Greedy strategy recommended for efficient single-container packing",
+	'best_fit': "Best-fit strategy recommended to minimize waste and handle fragile items",
+	'large_first': "Large-first strategy recommended for complex size distributions",
+	'aggressive': "Aggressive multi-container strategy recommended for large orders"
+}
+
+# Per feature, (threshold, reason) pairs from the highest threshold down; the first one the
+# feature value exceeds gives that feature's reason
+_EXPLAIN_RULES = (
+	('utilization_potential', ((1.2, "high volume requires multiple containers"), (0.9, "high utilization potential"))),
+	('fragility_ratio', ((0.3, "high fragility ratio requires careful packing"),)),
+	('weight_ratio', ((0.8, "weight constraints are significant"),)),
+	('size_diversity', ((10, "high size diversity needs specialized handling"),)),
+	('hazmat_flag', ((0, "hazardous materials require special handling"),)),
+)
+
+
 def _get_strategy_explanation(strategy: str, features: Dict[str, float]) -> str:
 	"""Generate human-readable explanation for strategy recommendation"""
-	
-	explanations = {
-		'greedy': "Greedy strategy recommended for efficient single-container packing",
-		'best_fit': "Best-fit strategy recommended to minimize waste and handle fragile items",
-		'large_first': "Large-first strategy recommended for complex size distributions",
-		'aggressive': "Aggressive multi-container strategy recommended for large orders"
-	}
-	
-	base_explanation = explanations.get(strategy, "Strategy selected based on ML analysis")
+	base_explanation = _STRATEGY_EXPLANATIONS.get(strategy, "Strategy selected based on ML analysis")
 	
 	# Add specific reasons based on features
 	reasons = []
-	
-	if features.get('utilization_potential', 0) > 1.2:
-		reasons.append("high volume requires multiple containers")
-	elif features.get('utilization_potential', 0) > 0.9:
-		reasons.append("high utilization potential")
-	
-	if features.get('fragility_ratio', 0) > 0.3:
-		reasons.append("high fragility ratio requires careful packing")
-	
-	if features.get('weight_ratio', 0) > 0.8:
-		reasons.append("weight constraints are significant")
-	
-	if features.get('size_diversity', 0) > 10:
-		reasons.append("high size diversity needs specialized handling")
-	
-	if features.get('hazmat_flag', 0) > 0:
-		reasons.append("hazardous materials require special handling")
+	for key, thresholds in _EXPLAIN_RULES:
+		value = features.get(key, 0)
+		for threshold, reason in thresholds:
+			if value > threshold:
+				reasons.append(reason)
+				break
 	
 	if reasons:
 		return f"{base_explanation} due to: {', '.join(reasons)}"
@@ -1,38 +1,44 @@
 import pandas as pd
 from typing import List, Dict, Any
-from .io import load_products_csv, load_containers_csv
+from .io import products_frame, containers_frame
+
+
+# (level, message) of each check, in the order the checks are reported for a row
+PRODUCT_CHECKS = (("error", "Non-positive dimension detected"), ("warning", "Non-positive weight"))
+CONTAINER_CHECKS = (("error", "Non-positive inner dimension"), ("warning", "Missing or non-positive max weight"), ("warning", "Negative stock"))
 
 
 def validate_products(path: str) -> List[Dict[str, Any]]:
-	reports: List[Dict[str, Any]] = []
 	try:
-		prods = load_products_csv(path)
+		df = products_frame(path)
 	except Exception as e:
-		reports.append({"level":"error","message":f"Reading products failed: {e}"})
-		return reports
-	for p in prods:
-		if p.width_mm <= 0 or p.length_mm <= 0 or p.height_mm <= 0:
-			reports.append({"level":"error","sku":p.sku,"message":"Non-positive dimension detected"})
-		if p.weight_g <= 0:
-			reports.append({"level":"warning","sku":p.sku,"message":"Non-positive weight"})
-	return reports
+		return [{"level":"error","message":f"Reading products failed: {e}"}]
+	# Checks run on whole columns; reports are built only for the flagged rows, in file order
+	bad_dim = (df[["width_mm", "length_mm", "height_mm"]] <= 0).any(axis=1)
+	bad_weight = df["weight_g"] <= 0
+	flagged = bad_dim | bad_weight
+	return [
+		{"level":level,"sku":sku,"message":message}
+		for sku, *failed in zip(df.loc[flagged, "sku"].tolist(), bad_dim[flagged].tolist(), bad_weight[flagged].tolist())
+		for (level, message), fail in zip(PRODUCT_CHECKS, failed) if fail
+	]
 
 
 def validate_containers(path: str) -> List[Dict[str, Any]]:
-	reports: List[Dict[str, Any]] = []
 	try:
-		boxes = load_containers_csv(path)
+		df = containers_frame(path)
 	except Exception as e:
-		reports.append({"level":"error","message":f"Reading containers failed: {e}"})
-		return reports
-	for c in boxes:
-		if c.inner_w_mm <= 0 or c.inner_l_mm <= 0 or c.inner_h_mm <= 0:
-			reports.append({"level":"error","box_id":c.box_id,"message":"Non-positive inner dimension"})
-		if c.max_weight_g is None or c.max_weight_g <= 0:
-			reports.append({"level":"warning","box_id":c.box_id,"message":"Missing or non-positive max weight"})
-		if c.stock < 0:
-			reports.append({"level":"warning","box_id":c.box_id,"message":"Negative stock"})
-	return reports
+		return [{"level":"error","message":f"Reading containers failed: {e}"}]
+	bad_dim = (df[["inner_w_mm", "inner_l_mm", "inner_h_mm"]] <= 0).any(axis=1)
+	bad_weight = df["max_weight_g"].isna() | (df["max_weight_g"] <= 0)
+	bad_stock = df["stock"] < 0
+	flagged = bad_dim | bad_weight | bad_stock
+	return [
+		{"level":level,"box_id":box_id,"message":message}
+		for box_id, *failed in zip(df.loc[flagged, "box_id"].tolist(), bad_dim[flagged].tolist(),
+		                           bad_weight[flagged].tolist(), bad_stock[flagged].tolist())
+		for (level, message), fail in zip(CONTAINER_CHECKS, failed) if fail
+	]
 
 
 def print_report(items: List[Dict[str, Any]]):
@@ -0,0 +1,2 @@
+// Pretty-prints packing results for the raw data tab off the main thread
+self.onmessage = e => self.postMessage(JSON.stringify(e.data, null, 2));
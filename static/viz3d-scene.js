@@ -0,0 +1,820 @@
+// Interactive 3D view of one packed container: projection, lighting, depth sorting and drawing on
+// a 2D canvas context. The page loads it to draw on the main thread, and viz3d-worker.js loads it
+// to draw on a canvas transferred with transferControlToOffscreen.
+
+// Lit colour of a face with the given SKU hue. Lightness is rounded to whole percents so there
+// are at most 71 shades per hue
+const skuShadeCache = new Map();
+
+function shadeLightness(lightIntensity){
+  return Math.round(Math.min(90, Math.max(20, 50 * lightIntensity)));
+}
+
+function hueShade(hue, lightIntensity = 1.0){
+  const lightness = shadeLightness(lightIntensity);
+  const key = hue * 100 + lightness;
+  let color = skuShadeCache.get(key);
+  if(color === undefined){
+    color = `hsl(${hue}, 75%, ${lightness}%)`;
+    skuShadeCache.set(key, color);
+  }
+  return color;
+}
+
+// Unit box corners as x, y, z triples, and the 4 corners of each face in face order: bottom, top,
+// front, back, left, right
+const BOX_CORNERS = Uint8Array.of(0,0,0, 1,0,0, 1,1,0, 0,1,0, 0,0,1, 1,0,1, 1,1,1, 0,1,1);
+const FACE_CORNERS = Uint8Array.of(0,1,2,3, 4,7,6,5, 0,4,5,1, 2,6,7,3, 0,3,7,4, 1,5,6,2);
+
+// Workers without requestAnimationFrame fall back to a 60 Hz timer
+const nextFrame = typeof requestAnimationFrame === 'function'
+  ? fn => requestAnimationFrame(fn)
+  : fn => setTimeout(() => fn(performance.now()), 16);
+const cancelFrame = typeof cancelAnimationFrame === 'function' ? cancelAnimationFrame : clearTimeout;
+
+// WebGL2 renderer for the box faces, drawn on a canvas stacked under the 2D one. Face geometry is
+// uploaded once; the vertex shader applies the rotation and the lighting colours, so a frame only
+// uploads the sorted face indices and draws them in one call. Outlines are drawn by the fragment
+// shader from the distance to the quad edge. Returns null when WebGL2 is unavailable
+const FACE_VERTEX_SHADER = `#version 300 es
+in vec3 aPos;
+in vec2 aUv;
+in float aHue;
+in float aFace;
+uniform vec3 uCenter;
+uniform vec4 uRotation; // cos x, sin x, cos y, sin y
+uniform float uScale;
+uniform vec2 uOffset;
+uniform vec2 uViewport;
+uniform float uLighting[6];
+out vec2 vUv;
+flat out vec4 vFill;
+flat out vec4 vLine;
+flat out float vLineWidth;
+
+vec3 hsl(float h, float s, float l) {
+  vec3 k = mod(vec3(0.0, 8.0, 4.0) + h / 30.0, 12.0);
+  return l - s * min(l, 1.0 - l) * clamp(min(k - 3.0, 9.0 - k), -1.0, 1.0);
+}
+
+void main() {
+  // Same projection as the corner pass in createScene3D
+  vec3 c = aPos - uCenter;
+  float y1 = c.y * uRotation.x - c.z * uRotation.y;
+  float z1 = c.y * uRotation.y + c.z * uRotation.x;
+  float x2 = c.x * uRotation.z + z1 * uRotation.w;
+  vec2 screen = vec2(x2, -y1) * uScale + uOffset;
+  gl_Position = vec4(screen / uViewport * vec2(2.0, -2.0) + vec2(-1.0, 1.0), 0.0, 1.0);
+  vUv = aUv;
+
+  float lighting = uLighting[int(aFace)];
+  if (aHue < 0.0) {
+    // Container: glowing outline only
+    vFill = vec4(0.0);
+    vLine = vec4(100.0 / 255.0, 200.0 / 255.0, 1.0, 0.3 + lighting * 0.3);
+    vLineWidth = 2.5;
+  } else {
+    // Items: lit SKU colour as in hueShade, with the highlight on well-lit faces
+    vec3 color = hsl(aHue, 0.75, floor(clamp(50.0 * lighting, 20.0, 90.0) + 0.5) / 100.0);
+    if (lighting > 0.8) color = mix(color, vec3(1.0), 0.15);
+    vFill = vec4(color, 1.0);
+    vLine = vec4(0.0, 0.0, 0.0, 0.4);
+    vLineWidth = 1.5;
+  }
+}`;
+
+const FACE_FRAGMENT_SHADER = `#version 300 es
+precision highp float;
+uniform float uPixelRatio;
+in vec2 vUv;
+flat in vec4 vFill;
+flat in vec4 vLine;
+flat in float vLineWidth;
+out vec4 outColor;
+
+void main() {
+  // Distance to the nearest quad edge in device pixels; a canvas stroke covers half its width
+  // on each side of the edge
+  vec2 edge = min(vUv, 1.0 - vUv) / max(fwidth(vUv), vec2(1e-6));
+  float halfWidth = 0.5 * vLineWidth * uPixelRatio;
+  float line = vLine.a * (1.0 - smoothstep(halfWidth - 0.5, halfWidth + 0.5, min(edge.x, edge.y)));
+  // Outline over fill, premultiplied
+  outColor = vec4(vLine.rgb * line, line) + vec4(vFill.rgb * vFill.a, vFill.a) * (1.0 - line);
+  if (outColor.a <= 0.0) discard;
+}`;
+
+function createFaceRenderer(glCanvas, scene) {
+  const gl = glCanvas.getContext('webgl2', { antialias: true, premultipliedAlpha: true });
+  if (!gl) return null;
+
+  const compile = (type, source) => {
+    const shader = gl.createShader(type);
+    gl.shaderSource(shader, source);
+    gl.compileShader(shader);
+    if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) throw new Error(gl.getShaderInfoLog(shader));
+    return shader;
+  };
+  const program = gl.createProgram();
+  try {
+    gl.attachShader(program, compile(gl.VERTEX_SHADER, FACE_VERTEX_SHADER));
+    gl.attachShader(program, compile(gl.FRAGMENT_SHADER, FACE_FRAGMENT_SHADER));
+    gl.linkProgram(program);
+    if (!gl.getProgramParameter(program, gl.LINK_STATUS)) throw new Error(gl.getProgramInfoLog(program));
+  } catch (error) {
+    console.warn('WebGL face renderer unavailable:', error);
+    return null;
+  }
+  gl.useProgram(program);
+
+  // 4 vertices per face of every box (the container is box 0): position, quad uv, hue (-1 for
+  // the container) and face index for the lighting
+  const { itemCount, maxW, maxL, maxH, posX, posY, posZ, sizeX, sizeY, sizeZ, itemHue } = scene;
+  const boxCount = itemCount + 1;
+  const faceCount = boxCount * 6;
+  const STRIDE = 7;
+  const quadUv = [[0, 0], [1, 0], [1, 1], [0, 1]];
+  const vertices = new Float32Array(faceCount * 4 * STRIDE);
+  let v = 0;
+  for (let b = 0; b < boxCount; b++) {
+    let x = 0, y = 0, z = 0, w = maxW, l = maxL, h = maxH, hue = -1;
+    if (b > 0) {
+      const i = b - 1;
+      x = posX[i]; y = posY[i]; z = posZ[i];
+      w = sizeX[i]; l = sizeY[i]; h = sizeZ[i];
+      hue = itemHue[i];
+    }
+    for (let f = 0; f < 6; f++) {
+      for (let k = 0; k < 4; k++) {
+        const corner = FACE_CORNERS[f*4 + k] * 3;
+        vertices[v++] = x + w*BOX_CORNERS[corner];
+        vertices[v++] = y + l*BOX_CORNERS[corner + 1];
+        vertices[v++] = z + h*BOX_CORNERS[corner + 2];
+        vertices[v++] = quadUv[k][0];
+        vertices[v++] = quadUv[k][1];
+        vertices[v++] = hue;
+        vertices[v++] = f;
+      }
+    }
+  }
+  gl.bindBuffer(gl.ARRAY_BUFFER, gl.createBuffer());
+  gl.bufferData(gl.ARRAY_BUFFER, vertices, gl.STATIC_DRAW);
+  const attribute = (name, size, offset) => {
+    const location = gl.getAttribLocation(program, name);
+    gl.enableVertexAttribArray(location);
+    gl.vertexAttribPointer(location, size, gl.FLOAT, false, STRIDE * 4, offset * 4);
+  };
+  attribute('aPos', 3, 0);
+  attribute('aUv', 2, 3);
+  attribute('aHue', 1, 5);
+  attribute('aFace', 1, 6);
+
+  // Two triangles per visible face, rewritten in draw order every frame
+  const indices = new Uint32Array(faceCount * 6);
+  const lighting = new Float32Array(6);
+  gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, gl.createBuffer());
+  gl.bufferData(gl.ELEMENT_ARRAY_BUFFER, indices.byteLength, gl.DYNAMIC_DRAW);
+
+  const uniform = name => gl.getUniformLocation(program, name);
+  const uRotation = uniform('uRotation'), uScale = uniform('uScale'), uLighting = uniform('uLighting');
+  gl.uniform3f(uniform('uCenter'), maxW/2, maxL/2, maxH/2);
+  gl.uniform2f(uniform('uOffset'), scene.displayWidth/2, scene.displayHeight/2);
+  gl.uniform2f(uniform('uViewport'), scene.displayWidth, scene.displayHeight);
+  gl.uniform1f(uniform('uPixelRatio'), scene.pixelRatio);
+
+  // Faces are drawn back to front like the 2D pass, so no depth buffer is needed
+  gl.viewport(0, 0, glCanvas.width, glCanvas.height);
+  gl.enable(gl.BLEND);
+  gl.blendFunc(gl.ONE, gl.ONE_MINUS_SRC_ALPHA);
+  gl.clearColor(0, 0, 0, 0);
+
+  return {
+    draw(faceOrder, drawCount, cosX, sinX, cosY, sinY, scale, faceLighting) {
+      let count = 0;
+      for (let n = 0; n < drawCount; n++) {
+        const first = faceOrder[n] * 4;
+        indices[count++] = first;
+        indices[count++] = first + 1;
+        indices[count++] = first + 2;
+        indices[count++] = first;
+        indices[count++] = first + 2;
+        indices[count++] = first + 3;
+      }
+      gl.bufferSubData(gl.ELEMENT_ARRAY_BUFFER, 0, indices, 0, count);
+      gl.uniform4f(uRotation, cosX, sinX, cosY, sinY);
+      gl.uniform1f(uScale, scale);
+      lighting.set(faceLighting);
+      gl.uniform1fv(uLighting, lighting);
+      gl.clear(gl.COLOR_BUFFER_BIT);
+      gl.drawElements(gl.TRIANGLES, count, gl.UNSIGNED_INT, 0);
+    }
+  };
+}
+
+// Builds the view for a scene description (see renderSingleContainer3D) and draws its first frame.
+// With a faceCanvas stacked under canvas, faces are drawn there with WebGL and canvas only holds
+// the texts. The returned controls only change the view state; the animation loop runs while it changes
+function createScene3D(canvas, scene, faceCanvas) {
+  const { maxW, maxL, maxH, displayWidth, displayHeight, pixelRatio, itemCount } = scene;
+  const { posX, posY, posZ, sizeX, sizeY, sizeZ, itemHue, itemSku } = scene;
+
+  // Get canvas context and scale for high-DPI displays
+  const ctx = canvas.getContext('2d');
+  ctx.scale(pixelRatio, pixelRatio);
+
+  // The 8 corners of every box (the container is box 0), centred on the container. They are
+  // computed once; each frame transforms them in one pass into the screen position and depth
+  // buffers. Then the depth of each face, and the faces to draw in back-to-front order with the
+  // 16-bit depth keys and scratch space of the radix sort
+  const boxCount = itemCount + 1;
+  const faceCount = boxCount * 6;
+  const cornerCount = boxCount * 8;
+  const cornerX = new Float64Array(cornerCount), cornerY = new Float64Array(cornerCount), cornerZ = new Float64Array(cornerCount);
+  const screenX = new Float64Array(cornerCount), screenY = new Float64Array(cornerCount), depth = new Float64Array(cornerCount);
+  const faceDepth = new Float64Array(faceCount);
+  const faceOrder = new Uint32Array(faceCount);
+  const faceKey = new Uint16Array(faceCount);
+  const sortScratch = new Uint32Array(faceCount);
+  const radixCounts = new Uint32Array(256);
+  const boxOnScreen = new Uint8Array(boxCount);
+  const faceFront = new Uint8Array(6);
+  const CULL_MARGIN = 16;
+  let faceRenderer = faceCanvas ? createFaceRenderer(faceCanvas, scene) : null;
+
+  // 3D view state with smooth animation - improved zoom and performance
+  const initialScale = Math.min(300/Math.max(maxW, maxL), 200/maxH) * 1.2; // Increased zoom from 0.6 to 1.2
+  let rotationX = 0.5;
+  let rotationY = 0.8;
+  let targetRotationX = 0.5;
+  let targetRotationY = 0.8;
+  let scale = initialScale;
+  let targetScale = scale;
+  // Use display dimensions for offset, not canvas dimensions
+  let offsetX = displayWidth/2;
+  let offsetY = displayHeight/2;
+  let isDragging = false;
+  let autoRotate = false;
+  let isVisible = true; // Start as visible
+
+  // Box corners relative to the container centre, which the view rotates around
+  const centerX = maxW/2, centerY = maxL/2, centerZ = maxH/2;
+  for(let b = 0; b < boxCount; b++) {
+    let x = 0, y = 0, z = 0, w = maxW, l = maxL, h = maxH;
+    if(b > 0) {
+      const i = b - 1;
+      x = posX[i]; y = posY[i]; z = posZ[i];
+      w = sizeX[i]; l = sizeY[i]; h = sizeZ[i];
+    }
+    for(let c = 0; c < 8; c++) {
+      cornerX[b*8 + c] = x + w*BOX_CORNERS[c*3] - centerX;
+      cornerY[b*8 + c] = y + l*BOX_CORNERS[c*3 + 1] - centerY;
+      cornerZ[b*8 + c] = z + h*BOX_CORNERS[c*3 + 2] - centerZ;
+    }
+  }
+  // SKU labels sit 5mm above the centre of each item's top face. Text widths are measured once
+  // per SKU, on first draw
+  const labelX = new Float64Array(itemCount), labelY = new Float64Array(itemCount), labelZ = new Float64Array(itemCount);
+  const skuLabelWidths = new Map();
+  for(let i = 0; i < itemCount; i++) {
+    labelX[i] = posX[i] + sizeX[i]/2 - centerX;
+    labelY[i] = posY[i] + sizeY[i]/2 - centerY;
+    labelZ[i] = posZ[i] + sizeZ[i] + 5 - centerZ;
+  }
+
+  // Rotation terms and per-face lighting are the same for every point of a frame, so
+  // updateProjection computes them once at the start of each render
+  let cosX = 1, sinX = 0, cosY = 1, sinY = 0;
+
+  // Simple lighting from top-right-front
+  const lightDir = [0.5, -0.3, 0.8];
+  // Face normals in face order: bottom, top, front, back, left, right
+  const faceNormals = [
+    [0, 0, -1],
+    [0, 0, 1],
+    [0, -1, 0],
+    [0, 1, 0],
+    [-1, 0, 0],
+    [1, 0, 0]
+  ];
+  const faceLighting = new Float64Array(6);
+
+  // Face colours of the Canvas2D pass only depend on the SKU hue and the face lighting, so each
+  // frame builds them once per distinct hue (slot) and face: faceShades[slot*6 + face]. Each slot
+  // keeps its shades in a palette indexed by lightness percent, so steady-state frames only index
+  // arrays. faceGlows holds the container outline colour per face
+  const hueSlots = [];
+  const itemSlot = new Uint16Array(itemCount);
+  for(let i = 0; i < itemCount; i++) {
+    let slot = hueSlots.indexOf(itemHue[i]);
+    if(slot < 0) slot = hueSlots.push(itemHue[i]) - 1;
+    itemSlot[i] = slot;
+  }
+  const slotPalettes = hueSlots.map(() => new Array(91));
+  const faceShades = new Array(hueSlots.length * 6);
+  const faceGlows = new Array(6);
+
+  const updateProjection = () => {
+    cosX = Math.cos(rotationX); sinX = Math.sin(rotationX);
+    cosY = Math.cos(rotationY); sinY = Math.sin(rotationY);
+
+    // Rotate each normal with the object; lighting ranges from 0.5 to 1.0. Faces whose normal
+    // points away from the viewer (towards lower depth) are hidden behind their own box
+    for(let f = 0; f < 6; f++) {
+      const normal = faceNormals[f];
+      const ny = normal[1] * cosX - normal[2] * sinX;
+      const nz = normal[1] * sinX + normal[2] * cosX;
+      const nx = normal[0] * cosY + nz * sinY;
+      const dot = nx * lightDir[0] + ny * lightDir[1] + nz * lightDir[2];
+      faceLighting[f] = 0.5 + 0.5 * Math.max(0, dot);
+      faceFront[f] = -normal[0] * sinY + nz * cosY > 0 ? 1 : 0;
+    }
+    if(faceRenderer) return;
+    for(let f = 0; f < 6; f++) {
+      faceGlows[f] = `rgba(100, 200, 255, ${0.3 + faceLighting[f] * 0.3})`;
+      const lightness = shadeLightness(faceLighting[f]);
+      for(let slot = 0; slot < hueSlots.length; slot++) {
+        const palette = slotPalettes[slot];
+        faceShades[slot*6 + f] = palette[lightness] || (palette[lightness] = hueShade(hueSlots[slot], faceLighting[f]));
+      }
+    }
+  };
+
+  // Last canvas style values written by the face pass; see resetStyleCache
+  let curFill, curStroke, curLineWidth, curShadowColor, curShadowBlur, curShadowX, curShadowY;
+  const resetStyleCache = () => {
+    curFill = curStroke = curShadowColor = null;
+    curLineWidth = curShadowBlur = curShadowX = curShadowY = NaN;
+  };
+  const setFill = (color) => {
+    if(color !== curFill) ctx.fillStyle = curFill = color;
+  };
+  const setStroke = (color, width) => {
+    if(color !== curStroke) ctx.strokeStyle = curStroke = color;
+    if(width !== curLineWidth) ctx.lineWidth = curLineWidth = width;
+  };
+  const setShadow = (color, blur, x, y) => {
+    if(color !== curShadowColor) ctx.shadowColor = curShadowColor = color;
+    if(blur !== curShadowBlur) ctx.shadowBlur = curShadowBlur = blur;
+    if(x !== curShadowX) ctx.shadowOffsetX = curShadowX = x;
+    if(y !== curShadowY) ctx.shadowOffsetY = curShadowY = y;
+  };
+
+  // Offscreen canvas of the view's size, for layers drawn once and copied in each frame
+  const newLayer = () => {
+    if(typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(canvas.width, canvas.height);
+    const layer = document.createElement('canvas');
+    layer.width = canvas.width;
+    layer.height = canvas.height;
+    return layer;
+  };
+
+  // The gradient background, the grid and the title only depend on the canvas size and the
+  // scene, so they are drawn once into an offscreen canvas of the same size and copied in each
+  // frame. With WebGL faces the gradient is the face canvas's own background and is left out here,
+  // so the layer is redrawn when faces switch between WebGL and the Canvas2D pass
+  const background = newLayer();
+  const drawBackground = () => {
+    const bg = background.getContext('2d');
+    bg.save();
+    bg.setTransform(1, 0, 0, 1, 0, 0);
+    bg.clearRect(0, 0, background.width, background.height);
+    bg.scale(pixelRatio, pixelRatio);
+    if(!faceRenderer) {
+      const backgroundGradient = bg.createLinearGradient(0, 0, 0, canvas.height);
+      backgroundGradient.addColorStop(0, '#1a1a2e');
+      backgroundGradient.addColorStop(0.5, '#16213e');
+      backgroundGradient.addColorStop(1, '#0f3460');
+      bg.fillStyle = backgroundGradient;
+      bg.fillRect(0, 0, canvas.width, canvas.height);
+    }
+    bg.strokeStyle = 'rgba(255, 255, 255, 0.03)';
+    bg.lineWidth = 1;
+    const gridSize = 30;
+    for (let x = 0; x < canvas.width; x += gridSize) {
+      bg.beginPath();
+      bg.moveTo(x, 0);
+      bg.lineTo(x, canvas.height);
+      bg.stroke();
+    }
+    for (let y = 0; y < canvas.height; y += gridSize) {
+      bg.beginPath();
+      bg.moveTo(0, y);
+      bg.lineTo(canvas.width, y);
+      bg.stroke();
+    }
+
+    // Premium title with gradient effect
+    // Title shadow
+    bg.shadowColor = 'rgba(0, 0, 0, 0.4)';
+    bg.shadowBlur = 8;
+    bg.shadowOffsetY = 2;
+
+    // Main title
+    const titleGradient = bg.createLinearGradient(20, 0, 400, 0);
+    titleGradient.addColorStop(0, '#ffffff');
+    titleGradient.addColorStop(1, '#e0e7ff');
+    bg.fillStyle = titleGradient;
+    bg.font = '700 18px Inter, Arial';
+    bg.letterSpacing = '0.5px';
+    bg.fillText(scene.titleText, 20, 32);
+
+    // Subtitle with container info
+    bg.shadowBlur = 4;
+    bg.fillStyle = 'rgba(255, 255, 255, 0.7)';
+    bg.font = '400 12px Inter, Arial';
+    bg.fillText(scene.subtitleText, 20, 50);
+    bg.restore();
+  };
+  drawBackground();
+
+  // Browsers cap the live WebGL contexts of a page, so a view hands its context back while it is
+  // scrolled out of sight and takes it again when shown. A context the browser drops is drawn
+  // by the Canvas2D pass until it is restored
+  let disposed = false, facesReleased = false;
+  const setFaceRenderer = renderer => {
+    faceRenderer = renderer;
+    drawBackground();
+  };
+  const loseContext = faceRenderer ? faceCanvas.getContext('webgl2').getExtension('WEBGL_lose_context') : null;
+  if(faceRenderer && faceCanvas.addEventListener) {
+    faceCanvas.addEventListener('webglcontextlost', e => {
+      // Keeps the context restorable
+      e.preventDefault();
+      if(disposed || !faceRenderer) return;
+      setFaceRenderer(null);
+      requestRender();
+    });
+    faceCanvas.addEventListener('webglcontextrestored', () => {
+      if(disposed) return;
+      facesReleased = false;
+      setFaceRenderer(createFaceRenderer(faceCanvas, scene));
+      requestRender();
+    });
+  }
+  const releaseFaces = () => {
+    if(!loseContext || facesReleased || !faceRenderer) return;
+    facesReleased = true;
+    setFaceRenderer(null);
+    loseContext.loseContext();
+  };
+  const restoreFaces = () => {
+    if(facesReleased && !disposed) loseContext.restoreContext();
+  };
+
+  // The premium stats panel shows fixed scene texts, so it is drawn once as well, into a layer
+  // that is copied over the faces and labels each frame
+  const statsPanel = newLayer();
+  {
+    const sp = statsPanel.getContext('2d');
+    sp.scale(pixelRatio, pixelRatio);
+
+    // Stats background with rounded corners effect
+    const panelX = 15;
+    const panelY = canvas.height - 100;
+    const panelWidth = canvas.width - 30;
+    const panelHeight = 85;
+    const panelRadius = 12;
+
+    sp.shadowColor = 'rgba(0, 0, 0, 0.3)';
+    sp.shadowBlur = 15;
+    sp.shadowOffsetY = 5;
+
+    // Draw rounded rectangle background
+    sp.fillStyle = 'rgba(0, 0, 0, 0.75)';
+    sp.beginPath();
+    sp.roundRect(panelX, panelY, panelWidth, panelHeight, panelRadius);
+    sp.fill();
+
+    sp.shadowBlur = 0;
+    sp.shadowOffsetY = 0;
+    sp.textAlign = 'left';
+
+    // Container name header
+    sp.font = '600 15px Inter, Arial';
+    const headerGradient = sp.createLinearGradient(25, 0, 400, 0);
+    headerGradient.addColorStop(0, '#60a5fa');
+    headerGradient.addColorStop(1, '#a78bfa');
+    sp.fillStyle = headerGradient;
+    sp.fillText(scene.headerText, 25, canvas.height - 73);
+
+    // Stats line 1
+    sp.font = '400 12px Inter, Arial';
+    sp.fillStyle = '#e5e7eb';
+    sp.fillText(scene.dimensionsText, 25, canvas.height - 53);
+
+    // Stats line 2
+    sp.fillText(scene.itemsText, 25, canvas.height - 38);
+
+    // Utilization bar
+    const barX = 25;
+    const barY = canvas.height - 25;
+    const barWidth = 200;
+    const barHeight = 10;
+
+    sp.fillStyle = 'rgba(255, 255, 255, 0.2)';
+    sp.fillRect(barX, barY, barWidth, barHeight);
+
+    const utilPercent = Math.min(1, scene.utilization);
+    const barGradient = sp.createLinearGradient(25, 0, 225, 0);
+    barGradient.addColorStop(0, '#4fc3f7');
+    barGradient.addColorStop(0.5, '#29b6f6');
+    barGradient.addColorStop(1, '#03a9f4');
+    sp.fillStyle = barGradient;
+    sp.fillRect(barX, barY, barWidth * utilPercent, barHeight);
+
+    sp.fillStyle = '#e5e7eb';
+    sp.font = '400 11px Inter, Arial';
+    sp.fillText(scene.priceText, barX + barWidth + 15, barY + 8);
+  }
+
+  // One stable counting pass of the radix sort: orders count faces from src into dst by one byte
+  // of their depth key
+  const radixPass = (src, dst, count, shift) => {
+    radixCounts.fill(0);
+    for(let n = 0; n < count; n++) radixCounts[(faceKey[src[n]] >> shift) & 255]++;
+    let start = 0;
+    for(let b = 0; b < 256; b++) {
+      const c = radixCounts[b];
+      radixCounts[b] = start;
+      start += c;
+    }
+    for(let n = 0; n < count; n++) {
+      const f = src[n];
+      dst[radixCounts[(faceKey[f] >> shift) & 255]++] = f;
+    }
+  };
+
+  // Render function with smooth animations
+  const render = () => {
+    // Smooth camera movement - faster interpolation for better performance
+    rotationX += (targetRotationX - rotationX) * 0.25;
+    rotationY += (targetRotationY - rotationY) * 0.25;
+    scale += (targetScale - scale) * 0.25;
+    updateProjection();
+
+    // Background, grid and title; see background above
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    ctx.drawImage(background, 0, 0, displayWidth, displayHeight);
+
+    if(scene.debug) console.log(`Drawing container wireframe: ${maxW}×${maxL}×${maxH}mm`);
+
+    // Project all corners in one pass: rotate around the X axis, then the Y axis, and scale
+    for(let c = 0; c < cornerCount; c++) {
+      const cy = cornerY[c], cz = cornerZ[c];
+      const y1 = cy * cosX - cz * sinX;
+      const z1 = cy * sinX + cz * cosX;
+      screenX[c] = (cornerX[c] * cosY + z1 * sinY) * scale + offsetX;
+      screenY[c] = -y1 * scale + offsetY;
+      depth[c] = -cornerX[c] * sinY + z1 * cosY;
+    }
+
+    for(let b = 0; b < boxCount; b++) {
+      let minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
+      for(let c = b*8; c < b*8 + 8; c++) {
+        const px = screenX[c], py = screenY[c];
+        if(px < minX) minX = px;
+        if(px > maxX) maxX = px;
+        if(py < minY) minY = py;
+        if(py > maxY) maxY = py;
+      }
+      // Boxes whose screen bounds (plus room for their shadow) miss the canvas are not drawn
+      boxOnScreen[b] = maxX >= -CULL_MARGIN && minX <= displayWidth + CULL_MARGIN &&
+                       maxY >= -CULL_MARGIN && minY <= displayHeight + CULL_MARGIN ? 1 : 0;
+    }
+
+    // Collect the faces to draw: those of on-screen boxes, and of items only the ones facing the
+    // viewer (the container is a see-through wireframe). Face depth is the mean depth of its corners
+    let drawCount = 0, minDepth = Infinity, maxDepth = -Infinity;
+    for(let f = 0; f < faceCount; f++) {
+      const box = f / 6 | 0;
+      if(!boxOnScreen[box] || (box > 0 && !faceFront[f % 6])) continue;
+      const base = box * 8;
+      const face = (f % 6) * 4;
+      let sum = 0;
+      for(let k = 0; k < 4; k++) sum += depth[base + FACE_CORNERS[face + k]];
+      const d = sum / 4;
+      faceDepth[f] = d;
+      if(d < minDepth) minDepth = d;
+      if(d > maxDepth) maxDepth = d;
+      faceOrder[drawCount++] = f;
+    }
+
+    // Sort back to front with a two-pass LSD radix sort on depth quantized to 16 bits, which
+    // takes linear time however much the view turned since the last frame
+    const keyScale = maxDepth > minDepth ? 65535 / (maxDepth - minDepth) : 0;
+    for(let n = 0; n < drawCount; n++) {
+      const f = faceOrder[n];
+      faceKey[f] = (faceDepth[f] - minDepth) * keyScale;
+    }
+    radixPass(faceOrder, sortScratch, drawCount, 0);
+    radixPass(sortScratch, faceOrder, drawCount, 8);
+
+    if(faceRenderer) {
+      faceRenderer.draw(faceOrder, drawCount, cosX, sinX, cosY, sinY, scale, faceLighting);
+    } else {
+      // Draw all faces with enhanced shadows and highlights. Consecutive faces (in depth order)
+      // with the same look form a run that is filled and stroked as one path. Faces share one
+      // save/restore, and style setters skip writes of the value that is already set.
+      // Faces are appended to the run path from the projected corners rather than filled from
+      // cached unit-face Path2Ds under a per-face setTransform: that would cost a fill and stroke
+      // per face instead of per run, and the transform would also skew the stroke widths
+      ctx.save();
+      resetStyleCache();
+      let runFill = null, runGlow = null, runHighlight = false, runLength = 0;
+      const drawRun = () => {
+        if(runGlow) {
+          // Container with glow effect
+          setStroke(runGlow, 2.5);
+          setShadow(runGlow, 8, 0, 0);
+          ctx.stroke();
+        } else {
+          // Items with shadow and highlight
+          setShadow('rgba(0, 0, 0, 0.3)', 8, 2, 2);
+          setFill(runFill);
+          ctx.fill();
+
+          // Add subtle highlight on top
+          setShadow('rgba(0, 0, 0, 0.3)', 0, 0, 0);
+          if(runHighlight) {
+            setFill('rgba(255, 255, 255, 0.15)');
+            ctx.fill();
+          }
+
+          setStroke('rgba(0, 0, 0, 0.4)', 1.5);
+          ctx.stroke();
+        }
+      };
+      for(let n = 0; n < drawCount; n++) {
+        const f = faceOrder[n];
+        const box = f / 6 | 0;
+        const faceIdx = f % 6;
+        const face = faceIdx * 4;
+        const base = box * 8;
+        const lighting = faceLighting[faceIdx];
+        const glow = box === 0 ? faceGlows[faceIdx] : null;
+        const fill = glow ? null : faceShades[itemSlot[box - 1]*6 + faceIdx];
+        const highlight = !glow && lighting > 0.8;
+
+        if(!runLength || glow !== runGlow || fill !== runFill || highlight !== runHighlight) {
+          if(runLength) drawRun();
+          ctx.beginPath();
+          runGlow = glow;
+          runFill = fill;
+          runHighlight = highlight;
+          runLength = 0;
+        }
+        let c = base + FACE_CORNERS[face];
+        ctx.moveTo(screenX[c], screenY[c]);
+        for(let k = 1; k < 4; k++) {
+          c = base + FACE_CORNERS[face + k];
+          ctx.lineTo(screenX[c], screenY[c]);
+        }
+        ctx.closePath();
+        runLength++;
+      }
+      if(runLength) drawRun();
+      ctx.restore();
+    }
+
+    // Draw SKU labels with enhanced styling; the text styles are the same for every label
+    ctx.save();
+    ctx.font = 'bold 11px Arial';
+    ctx.textAlign = 'center';
+    ctx.shadowColor = 'rgba(0, 0, 0, 0.8)';
+    ctx.shadowBlur = 3;
+    for(let i = 0; i < itemCount; i++) {
+      // Cheapest rejections first: culled boxes and items too small at this zoom to hold a label
+      if(!boxOnScreen[i + 1] || sizeX[i] * scale <= 30) continue;
+      const y1 = labelY[i] * cosX - labelZ[i] * sinX;
+      const z1 = labelY[i] * sinX + labelZ[i] * cosX;
+      const lz = -labelX[i] * sinY + z1 * cosY;
+      if(lz <= 0) continue; // Only draw if in front
+      const lx = (labelX[i] * cosY + z1 * sinY) * scale + offsetX;
+      const ly = -y1 * scale + offsetY;
+      if(lx < -50 || lx > displayWidth + 50 || ly < -20 || ly > displayHeight + 20) continue;
+
+      // Label background
+      const sku = itemSku[i];
+      let textWidth = skuLabelWidths.get(sku);
+      if(textWidth === undefined) {
+        textWidth = ctx.measureText(sku).width;
+        skuLabelWidths.set(sku, textWidth);
+      }
+      ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
+      ctx.fillRect(lx - textWidth/2 - 4, ly - 14, textWidth + 8, 18);
+
+      // Label text with shadow
+      ctx.fillStyle = '#ffffff';
+      ctx.fillText(sku, lx, ly);
+    }
+    ctx.restore();
+
+    // Premium stats panel; see statsPanel above
+    ctx.drawImage(statsPanel, 0, 0, displayWidth, displayHeight);
+  };
+
+  // Animation loop. It only runs while the view is moving or has pending changes; the controls
+  // below call requestRender to mark the view dirty and restart it. Between throttled frames it
+  // sleeps on a timer rather than waking on every display refresh
+  let animationFrameId = 0;
+  let frameTimerId = 0;
+  let lastRenderTime = 0;
+  let dirty = false;
+  const targetFPS = 45; // Balanced FPS for good quality and performance
+  const frameInterval = 1000 / targetFPS;
+  // Unattended auto-rotation turns at a fixed speed and needs fewer frames than interaction
+  const autoRotateInterval = 1000 / 30;
+  const AUTO_ROTATE_SPEED = 0.45; // radians per second
+  // Tilt and zoom limits for the controls
+  const MAX_TILT = Math.PI/2;
+  const MIN_SCALE = 0.1, MAX_SCALE = 5.0;
+
+  const animate = (currentTime) => {
+    animationFrameId = 0;
+    // Stop while scrolled out of view and not dragging, also when auto-rotating; setVisible
+    // restarts the loop
+    if (!isVisible && !isDragging) return;
+
+    const hasMovement = Math.abs(targetRotationX - rotationX) > 0.001 ||
+                       Math.abs(targetRotationY - rotationY) > 0.001 ||
+                       Math.abs(targetScale - scale) > 0.001 ||
+                       autoRotate;
+    if (!hasMovement && !dirty) return;
+
+    const elapsed = currentTime - lastRenderTime;
+    const interval = autoRotate && !dirty && !isDragging ? autoRotateInterval : frameInterval;
+    if (elapsed < interval) {
+      // Wake up just before the frame that is due
+      frameTimerId = setTimeout(() => {
+        frameTimerId = 0;
+        animationFrameId = nextFrame(animate);
+      }, interval - elapsed - 1);
+      return;
+    }
+    // Rotation follows elapsed time, capped so a resumed loop does not jump
+    if (autoRotate) targetRotationY += AUTO_ROTATE_SPEED * Math.min(elapsed, 100) / 1000;
+    render();
+    dirty = false;
+    lastRenderTime = currentTime;
+    animationFrameId = nextFrame(animate);
+  };
+
+  const requestRender = () => {
+    dirty = true;
+    // Input may shorten the interval being slept on, so a pending wake-up is brought forward
+    if (frameTimerId) {
+      clearTimeout(frameTimerId);
+      frameTimerId = 0;
+    }
+    if (!animationFrameId) animationFrameId = nextFrame(animate);
+  };
+
+  // Initial render; the loop starts on the first interaction
+  render();
+
+  return {
+    rotate(deltaX, deltaY) {
+      if(!deltaX && !deltaY) return;
+      targetRotationY += deltaX * 0.01;
+      targetRotationX += deltaY * 0.01;
+
+      // Clamp rotation
+      targetRotationX = targetRotationX < -MAX_TILT ? -MAX_TILT : targetRotationX > MAX_TILT ? MAX_TILT : targetRotationX;
+      requestRender();
+    },
+    zoom(zoomFactor) {
+      targetScale *= zoomFactor;
+      targetScale = targetScale < MIN_SCALE ? MIN_SCALE : targetScale > MAX_SCALE ? MAX_SCALE : targetScale;
+      requestRender();
+    },
+    reset() {
+      targetRotationX = 0.5;
+      targetRotationY = 0.8;
+      targetScale = initialScale;
+      requestRender();
+    },
+    setAutoRotate(on) {
+      autoRotate = on;
+      requestRender();
+    },
+    setDragging(on) {
+      isDragging = on;
+    },
+    setVisible(on) {
+      isVisible = on;
+      if (isVisible) {
+        restoreFaces();
+        requestRender();
+      } else {
+        releaseFaces();
+      }
+    },
+    dispose() {
+      if (animationFrameId) cancelFrame(animationFrameId);
+      if (frameTimerId) clearTimeout(frameTimerId);
+      animationFrameId = frameTimerId = 0;
+      isVisible = false;
+      releaseFaces();
+      disposed = true;
+    }
+  };
+}
@@ -0,0 +1,13 @@
+// Runs a 3D container view on a canvas transferred from the page, so projection, sorting and
+// drawing happen off the main thread. The page forwards its input as control calls
+importScripts('viz3d-scene.js');
+
+let view = null;
+
+self.onmessage = e => {
+  const { type, args } = e.data;
+  if (type === 'init') view = createScene3D(e.data.canvas, e.data.scene, e.data.faceCanvas);
+  else if (view) view[type](...args);
+  // The view hands back its WebGL context before the worker goes
+  if (type === 'dispose') self.close();
+};